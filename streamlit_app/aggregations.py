@@ -0,0 +1,102 @@
+import streamlit as st
+import pandas as pd
+
+from data_loader import get_data_version
+from scoring.timing import stage
+
+# Dimensi cube agregat yang dibutuhkan oleh seluruh chart dashboard
+CUBE_DIMENSIONS = [
+    'Department', 'JobRole', 'OverTime', 'RiskLevel',
+    'JobSatisfaction', 'EnvironmentSatisfaction', 'WorkLifeBalance', 'RelationshipSatisfaction'
+]
+
+# Kolom ukuran (measure) cube: nama kolom hasil -> kolom sumber
+CUBE_MEASURES = {
+    'attrition_sum': 'Attrition',
+    'income_sum': 'MonthlyIncome',
+}
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_aggregate_cube(data_version, _df):
+    """
+    Menghitung cube agregat (jumlah karyawan, jumlah attrition, total gaji) untuk
+    setiap kombinasi dimensi CUBE_DIMENSIONS.
+    
+    Cube hanya dihitung sekali per versi data; argumen _df tidak di-hash oleh Streamlit.
+    
+    Args:
+        data_version: Fingerprint data (lihat data_loader.get_data_version)
+        _df: DataFrame sumber
+    
+    Returns:
+        DataFrame: Satu baris per sel cube dengan kolom dimensi, count dan measure
+    """
+    dims = [col for col in CUBE_DIMENSIONS if col in _df.columns]
+    measures = {name: source for name, source in CUBE_MEASURES.items() if source in _df.columns}
+    
+    # Gunakan tipe lebar agar penjumlahan tidak overflow pada kolom int8/int16
+    values = _df[dims].copy()
+    values['count'] = 1
+    for name, source in measures.items():
+        values[name] = _df[source].astype('float64')
+    
+    with stage('aggregations.build_cube'):
+        cube = values.groupby(dims, observed=True, sort=True).sum().reset_index()
+    
+    # Versi data ikut disimpan agar figure turunan dapat di-cache per versi
+    cube.attrs['data_version'] = data_version
+    return cube
+
+def get_aggregate_cube(df):
+    """
+    Mengambil cube agregat untuk DataFrame dashboard dari cache.
+    
+    Args:
+        df: DataFrame hasil load_data
+    
+    Returns:
+        DataFrame: Cube agregat
+    """
+    return build_aggregate_cube(get_data_version(df), df)
+
+def rollup(cube, dims):
+    """
+    Menggabungkan sel-sel cube ke dimensi yang lebih sedikit.
+    
+    Args:
+        cube: Cube agregat dari get_aggregate_cube
+        dims: Nama dimensi (string atau list) yang dipertahankan
+    
+    Returns:
+        DataFrame: count dan measure per kombinasi dims, dengan dims sebagai index
+    """
+    measure_cols = ['count'] + [col for col in CUBE_MEASURES if col in cube.columns]
+    with stage('aggregations.rollup'):
+        return cube.groupby(dims, observed=True, sort=True)[measure_cols].sum()
+
+def has_dimensions(cube, *columns):
+    """
+    Mengecek apakah cube memiliki semua dimensi atau measure yang dibutuhkan chart.
+    """
+    return cube is not None and all(col in cube.columns for col in columns)
+
+def weighted_mean(cube, group_dim, value_dim):
+    """
+    Menghitung rata-rata dimensi bernilai numerik (misalnya skor kepuasan 1-4) per grup
+    dari cube, tertimbang jumlah karyawan di setiap sel.
+    
+    Args:
+        cube: Cube agregat dari get_aggregate_cube
+        group_dim: Dimensi pengelompokan (misalnya 'RiskLevel')
+        value_dim: Dimensi yang dirata-ratakan (misalnya 'JobSatisfaction')
+    
+    Returns:
+        Series: Rata-rata value_dim per nilai group_dim (0 untuk grup tanpa data)
+    """
+    cells = rollup(cube, [group_dim, value_dim])['count'].reset_index()
+    cells['weighted'] = cells[value_dim].astype('float64') * cells['count']
+    
+    # observed=False mempertahankan semua kategori grup, termasuk yang kosong
+    with stage('aggregations.weighted_mean'):
+        totals = cells.groupby(group_dim, observed=False)[['weighted', 'count']].sum()
+    return (totals['weighted'] / totals['count']).fillna(0).rename(value_dim)
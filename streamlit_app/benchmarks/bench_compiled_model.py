@@ -0,0 +1,71 @@
+"""
+Benchmark model terkompilasi: paritas dan latensi dibandingkan model joblib (sklearn).
+
+Paritas diperiksa pada optimal_risk_segmentation_result.csv; latensi diukur untuk
+scoring 1 baris dan 10.000 baris (preprocessing + predict, median beberapa ulangan).
+
+Contoh (dijalankan dari folder streamlit_app):
+    python benchmarks/bench_compiled_model.py --repeats 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from scoring import (  # noqa: E402
+    create_engineered_features_df, fill_default_columns, load_artifacts
+)
+from scoring.compiled import check_parity  # noqa: E402
+
+REFERENCE_DATA = os.path.join(APP_DIR, 'data', 'optimal_risk_segmentation_result.csv')
+
+def time_predict(model, preprocessor, employee_df, repeats):
+    """
+    Mengukur median durasi transform + predict dalam milidetik.
+    """
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(preprocessor.transform(employee_df))
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=50)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1, 10_000])
+    args = parser.parse_args()
+
+    sklearn_artifacts = load_artifacts()
+    compiled_artifacts = load_artifacts(compiled=True)
+    reference = pd.read_csv(REFERENCE_DATA)
+
+    parity = check_parity(sklearn_artifacts.model, sklearn_artifacts.preprocessor,
+                          compiled_artifacts.model, compiled_artifacts.preprocessor, reference)
+    print(f"Paritas pada {parity['rows']:,} baris: {parity['mismatched_predictions']} prediksi berbeda, "
+          f"selisih maks proba {parity['max_proba_diff']:.2e}")
+
+    employees = fill_default_columns(create_engineered_features_df(reference))
+
+    print(f"{'baris':>8} {'sklearn ms':>11} {'compiled ms':>12} {'speedup':>8}")
+    for rows in args.rows:
+        repeats = -(-rows // len(employees))
+        employee_df = pd.concat([employees] * repeats, ignore_index=True).head(rows)
+
+        # Pemanasan agar thread pool dan cache tidak ikut terukur
+        for artifacts in (sklearn_artifacts, compiled_artifacts):
+            artifacts.model.predict(artifacts.preprocessor.transform(employee_df))
+
+        sklearn_ms = time_predict(sklearn_artifacts.model, sklearn_artifacts.preprocessor, employee_df, args.repeats)
+        compiled_ms = time_predict(compiled_artifacts.model, compiled_artifacts.preprocessor, employee_df,
+                                   args.repeats)
+        print(f"{rows:>8,} {sklearn_ms:>11.2f} {compiled_ms:>12.2f} {sklearn_ms / compiled_ms:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark memori pemuatan model: waktu cold-load dan RSS/PSS per proses worker.
+
+Setiap mode dijalankan dengan N proses worker baru (start method 'spawn'). Setiap worker
+memuat model, melakukan scoring employee_data.csv sekali, lalu melaporkan isi
+/proc/self/smaps_rollup selagi semua worker masih hidup, sehingga PSS mencerminkan
+halaman memori yang dipakai bersama.
+
+Mode:
+    joblib          load_artifacts(): model sklearn (mmap_mode tidak berpengaruh karena
+                    Tree.__setstate__ menyalin array node ke memori proses)
+    compiled        compiled_model.joblib tanpa memory map
+    compiled-mmap   load_artifacts(compiled=True): compiled_model.joblib dengan mmap_mode='r'
+
+Contoh (Linux, dijalankan dari folder streamlit_app):
+    python benchmarks/bench_model_memory.py --workers 1 4 16
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+SOURCE_DATA = os.path.join(APP_DIR, '..', 'data', 'employee_data.csv')
+MODES = ['joblib', 'compiled', 'compiled-mmap']
+SMAPS_FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Private_Clean', 'Private_Dirty')
+
+def read_smaps_rollup():
+    """
+    Returns:
+        dict: Nilai SMAPS_FIELDS proses saat ini dalam MB
+    """
+    usage = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            name, _, rest = line.partition(':')
+            if name in SMAPS_FIELDS:
+                usage[name] = int(rest.split()[0]) / 1024
+    return usage
+
+def load_for_mode(mode):
+    """
+    Memuat model dan preprocessor sesuai mode benchmark.
+    """
+    if mode == 'compiled':
+        from scoring.artifacts import DEFAULT_MODEL_DIR
+        from scoring.compiled import COMPILED_FILENAME, load_compiled
+        preprocessor, model, _ = load_compiled(os.path.join(DEFAULT_MODEL_DIR, COMPILED_FILENAME), mmap_mode=None)
+        return model, preprocessor
+    
+    from scoring import load_artifacts
+    artifacts = load_artifacts(compiled=(mode == 'compiled-mmap'))
+    return artifacts.model, artifacts.preprocessor
+
+def worker(mode, results, release):
+    start = time.perf_counter()
+    model, preprocessor = load_for_mode(mode)
+    load_seconds = time.perf_counter() - start
+    
+    # Scoring sekali agar semua halaman model benar-benar tersentuh
+    import pandas as pd
+    from scoring import predict_attrition_risk_batch
+    if hasattr(model, 'n_jobs'):
+        model.n_jobs = 1
+    predict_attrition_risk_batch(pd.read_csv(SOURCE_DATA), model, preprocessor)
+    
+    results.put(dict(read_smaps_rollup(), load_seconds=load_seconds))
+    release.wait()
+
+def run(mode, workers):
+    """
+    Menjalankan satu mode dengan sejumlah worker dan mengembalikan rata-rata per worker.
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    release = context.Event()
+    processes = [context.Process(target=worker, args=(mode, results, release)) for _ in range(workers)]
+    
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    release.set()
+    for process in processes:
+        process.join()
+    
+    return {key: sum(report[key] for report in reports) / workers for key in reports[0]}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    args = parser.parse_args()
+    
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        raise SystemExit("Benchmark ini membutuhkan /proc/self/smaps_rollup (Linux).")
+    
+    print(f"{'mode':>14} {'workers':>8} {'load s':>7} {'RSS MB':>7} {'PSS MB':>7} "
+          f"{'shared MB':>10} {'private MB':>11} {'total PSS MB':>13}")
+    for mode in args.modes:
+        for workers in args.workers:
+            usage = run(mode, workers)
+            private = usage['Private_Clean'] + usage['Private_Dirty']
+            print(f"{mode:>14} {workers:>8} {usage['load_seconds']:>7.2f} {usage['Rss']:>7.1f} "
+                  f"{usage['Pss']:>7.1f} {usage['Shared_Clean']:>10.1f} {private:>11.1f} "
+                  f"{usage['Pss'] * workers:>13.1f}")
+
+if __name__ == '__main__':
+    main()
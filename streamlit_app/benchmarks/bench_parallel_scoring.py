@@ -0,0 +1,58 @@
+"""
+Benchmark scoring paralel: mengukur skalabilitas batch_scoring dari 1 hingga N worker.
+
+Data employee_data.csv direplikasi hingga jumlah baris yang diminta, lalu
+di-scoring dengan stream_score_file untuk setiap jumlah worker.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python benchmarks/bench_parallel_scoring.py --rows 1000000 --workers 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from batch_scoring import DEFAULT_CHUNK_SIZE, stream_score_file  # noqa: E402
+
+SOURCE_DATA = os.path.join(APP_DIR, '..', 'data', 'employee_data.csv')
+
+def build_workforce(rows, path):
+    """
+    Mereplikasi employee_data.csv hingga jumlah baris tertentu dan menyimpannya ke CSV.
+    """
+    base = pd.read_csv(SOURCE_DATA)
+    repeats = -(-rows // len(base))
+    workforce = pd.concat([base] * repeats, ignore_index=True).head(rows)
+    workforce['EmployeeId'] = range(1, len(workforce) + 1)
+    workforce.to_csv(path, index=False)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+    
+    from scoring import load_artifacts
+    model, preprocessor, _, _ = load_artifacts(compiled=True)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'workforce.csv')
+        output_path = os.path.join(tmp_dir, 'scored.csv')
+        build_workforce(args.rows, input_path)
+        
+        print(f"{'workers':>8} {'detik':>8} {'baris/detik':>12} {'speedup':>8}")
+        baseline = None
+        for workers in sorted(set(args.workers)):
+            rows, elapsed = stream_score_file(input_path, output_path, model, preprocessor,
+                                              chunk_size=args.chunk_size, workers=workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>8.2f} {rows / elapsed:>12,.0f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
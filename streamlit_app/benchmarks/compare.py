@@ -0,0 +1,79 @@
+"""
+Membandingkan dua file hasil run_benchmarks.py (misalnya commit lama dan commit baru).
+
+Kasus dicocokkan berdasarkan (nama, jumlah baris). Rasio = median baru / median lama;
+rasio di atas --threshold ditandai REGRESI dan di bawah 1/threshold ditandai lebih cepat.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python benchmarks/compare.py benchmarks/results/<lama>.json benchmarks/results/<baru>.json
+    python benchmarks/compare.py lama.json baru.json --threshold 1.2 --fail-on-regression
+"""
+import argparse
+import json
+
+def load_results(path):
+    """
+    Returns:
+        tuple: (isi file JSON, dictionary (nama, baris) -> hasil kasus)
+    """
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data, {(result['name'], result['rows']): result for result in data['results']}
+
+def compare(baseline, candidate, threshold=1.10):
+    """
+    Args:
+        baseline: Dictionary hasil lama dari load_results
+        candidate: Dictionary hasil baru dari load_results
+        threshold: Rasio minimum yang dianggap regresi
+    
+    Returns:
+        list: Tuple (nama, baris, median lama, median baru, rasio, status) per kasus yang ada di keduanya
+    """
+    rows = []
+    for key in sorted(baseline.keys() & candidate.keys()):
+        old, new = baseline[key]['median_s'], candidate[key]['median_s']
+        ratio = new / old
+        if ratio > threshold:
+            status = 'REGRESI'
+        elif ratio < 1 / threshold:
+            status = 'lebih cepat'
+        else:
+            status = ''
+        rows.append((key[0], key[1], old, new, ratio, status))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline', help="File JSON hasil lama")
+    parser.add_argument('candidate', help="File JSON hasil baru")
+    parser.add_argument('--threshold', type=float, default=1.10)
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help="Keluar dengan kode 1 jika ada regresi")
+    args = parser.parse_args()
+    
+    baseline_data, baseline = load_results(args.baseline)
+    candidate_data, candidate = load_results(args.candidate)
+    print(f"lama: {(baseline_data.get('commit') or '-')[:12]} ({baseline_data.get('timestamp')}), "
+          f"baru: {(candidate_data.get('commit') or '-')[:12]} ({candidate_data.get('timestamp')})")
+    if baseline_data.get('environment') != candidate_data.get('environment'):
+        print("Peringatan: lingkungan (Python/paket/mesin) berbeda, perbandingan bisa tidak sebanding")
+    
+    rows = compare(baseline, candidate, args.threshold)
+    print(f"{'kasus':<50} {'baris':>10} {'lama ms':>11} {'baru ms':>11} {'rasio':>7}")
+    for name, size, old, new, ratio, status in rows:
+        print(f"{name:<50} {size:>10,} {old * 1000:>11.3f} {new * 1000:>11.3f} {ratio:>6.2f}x  {status}".rstrip())
+    
+    missing = sorted(baseline.keys() ^ candidate.keys())
+    if missing:
+        print(f"{len(missing)} kasus hanya ada di salah satu file: "
+              + ", ".join(f"{name}@{size}" for name, size in missing))
+    
+    regressions = [row for row in rows if row[5] == 'REGRESI']
+    if regressions:
+        print(f"{len(regressions)} regresi di atas {args.threshold:.2f}x")
+        if args.fail_on_regression:
+            raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
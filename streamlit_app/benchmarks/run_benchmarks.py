@@ -0,0 +1,362 @@
+"""
+Suite benchmark jalur panas scoring dan dashboard, dengan hasil JSON yang dapat dibandingkan antar commit.
+
+Setiap kasus dijalankan pada data karyawan sintetis (lihat synthetic.py) dari 1.058 baris
+bawaan hingga 1 juta baris. Kasus satu karyawan (dictionary) hanya diukur sekali karena
+tidak bergantung pada ukuran data. Cache Streamlit dilewati (memanggil fungsi asli),
+sehingga setiap ulangan mengukur komputasi yang sebenarnya.
+
+Jumlah panggilan per ulangan ditentukan otomatis seperti timeit (minimal 0,2 detik per
+ulangan); ulangan berhenti lebih awal jika anggaran waktu per kasus terlewati.
+Hasil disimpan ke benchmarks/results/<commit>.json; bandingkan dua hasil dengan compare.py.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1058 10000 --filter predict
+    python benchmarks/compare.py benchmarks/results/<lama>.json benchmarks/results/<baru>.json
+"""
+import argparse
+import contextlib
+import datetime
+import fnmatch
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+import visualizations  # noqa: E402
+from sklearn.cluster import KMeans  # noqa: E402
+from sklearn.preprocessing import StandardScaler  # noqa: E402
+from aggregations import build_aggregate_cube  # noqa: E402
+from data_loader import load_data  # noqa: E402
+from scoring import (  # noqa: E402
+    create_engineered_features, create_engineered_features_df, generate_risk_factors,
+    generate_risk_factors_batch, load_artifacts, predict_attrition_risk, predict_attrition_risk_batch
+)
+from training.segmentation import silhouette  # noqa: E402
+from synthetic import BASE_ROWS, DEFAULT_SEED, make_workforce, write_workforce  # noqa: E402
+
+DEFAULT_SIZES = [BASE_ROWS, 10_000, 100_000, 1_000_000]
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+RAW_INPUT_COLUMNS = [
+    'Age', 'BusinessTravel', 'DailyRate', 'Department', 'DistanceFromHome', 'Education',
+    'EducationField', 'EnvironmentSatisfaction', 'Gender', 'HourlyRate', 'JobInvolvement',
+    'JobLevel', 'JobRole', 'JobSatisfaction', 'MaritalStatus', 'MonthlyIncome', 'MonthlyRate',
+    'NumCompaniesWorked', 'OverTime', 'PercentSalaryHike', 'PerformanceRating',
+    'RelationshipSatisfaction', 'StockOptionLevel', 'TotalWorkingYears', 'TrainingTimesLastYear',
+    'WorkLifeBalance', 'YearsAtCompany', 'YearsInCurrentRole', 'YearsSinceLastPromotion',
+    'YearsWithCurrManager',
+]
+# Fitur segmentasi terpilih di notebook (lihat training.segmentation)
+SEGMENTATION_COLUMNS = ['Age', 'MonthlyIncome', 'JobSatisfaction', 'OverTime']
+PACKAGES = ['numpy', 'pandas', 'sklearn', 'plotly', 'streamlit', 'pyarrow']
+
+# Registry kasus benchmark: nama -> (fungsi setup, hanya satu ukuran)
+BENCHMARKS = {}
+
+def benchmark(name, single=False):
+    """
+    Mendaftarkan kasus benchmark.
+    
+    Fungsi setup menerima BenchmarkContext dan mengembalikan callable tanpa argumen yang
+    diukur; semua persiapan di luar callable tersebut tidak ikut terukur.
+    
+    Args:
+        name: Nama kasus (dipakai sebagai kunci perbandingan antar commit)
+        single: True jika kasus tidak bergantung pada ukuran data (cukup diukur sekali)
+    """
+    def register(setup):
+        BENCHMARKS[name] = (setup, single)
+        return setup
+    return register
+
+class BenchmarkContext:
+    """
+    Data dan artefak bersama untuk semua kasus pada satu ukuran data; setiap bagian
+    dibuat sekali saat pertama kali dibutuhkan.
+    """
+    
+    def __init__(self, rows, artifacts, tmp_dir, seed=DEFAULT_SEED):
+        self.rows = rows
+        self.artifacts = artifacts
+        self.tmp_dir = tmp_dir
+        self.seed = seed
+        self._workforce = None
+        self._cube = None
+        self._csv_path = None
+        self._segmentation = None
+    
+    @property
+    def workforce(self):
+        if self._workforce is None:
+            self._workforce = make_workforce(self.rows, self.seed)
+        return self._workforce
+    
+    @property
+    def raw_input(self):
+        return self.workforce[RAW_INPUT_COLUMNS]
+    
+    @property
+    def employee(self):
+        return self.workforce[RAW_INPUT_COLUMNS].iloc[0].to_dict()
+    
+    @property
+    def cube(self):
+        if self._cube is None:
+            self._cube = build_aggregate_cube.__wrapped__(f'bench-{self.rows}', self.workforce)
+        return self._cube
+    
+    @property
+    def segmentation(self):
+        # Fitur terstandardisasi dan label KMeans 4 cluster untuk kasus silhouette
+        if self._segmentation is None:
+            X = StandardScaler().fit_transform(
+                self.workforce[SEGMENTATION_COLUMNS].replace({'Yes': 1, 'No': 0}).astype(float))
+            labels = KMeans(n_clusters=4, n_init=1, random_state=self.seed).fit_predict(X)
+            self._segmentation = (X, labels)
+        return self._segmentation
+    
+    @property
+    def csv_path(self):
+        if self._csv_path is None:
+            self._csv_path = write_workforce(self.rows, os.path.join(self.tmp_dir, f'workforce_{self.rows}.csv'),
+                                             self.seed)
+        return self._csv_path
+
+@benchmark('create_engineered_features.single', single=True)
+def bench_engineered_single(ctx):
+    employee = ctx.employee
+    return lambda: create_engineered_features(employee)
+
+@benchmark('create_engineered_features.batch')
+def bench_engineered_batch(ctx):
+    raw_input = ctx.raw_input
+    return lambda: create_engineered_features_df(raw_input)
+
+@benchmark('predict_attrition_risk.single', single=True)
+def bench_predict_single(ctx):
+    employee = ctx.employee
+    model, preprocessor = ctx.artifacts.model, ctx.artifacts.preprocessor
+    return lambda: predict_attrition_risk(employee, model, preprocessor)
+
+@benchmark('predict_attrition_risk.batch')
+def bench_predict_batch(ctx):
+    raw_input = ctx.raw_input
+    model, preprocessor = ctx.artifacts.model, ctx.artifacts.preprocessor
+    return lambda: predict_attrition_risk_batch(raw_input, model, preprocessor)
+
+@benchmark('generate_risk_factors.single', single=True)
+def bench_risk_factors_single(ctx):
+    employee = create_engineered_features(ctx.employee)
+    return lambda: generate_risk_factors(employee)
+
+@benchmark('generate_risk_factors.batch')
+def bench_risk_factors_batch(ctx):
+    workforce = ctx.workforce
+    return lambda: generate_risk_factors_batch(workforce)
+
+@benchmark('aggregations.build_aggregate_cube')
+def bench_aggregate_cube(ctx):
+    workforce = ctx.workforce
+    return lambda: build_aggregate_cube.__wrapped__(f'bench-{ctx.rows}', workforce)
+
+def _register_plot_benchmarks():
+    # Satu kasus per fungsi visualizations.plot_*, diukur tanpa cache figure
+    for name in sorted(visualizations._FIGURE_BUILDERS):
+        if not name.startswith('plot_'):
+            continue
+        builder = visualizations._FIGURE_BUILDERS[name]
+        params = ('JobSatisfaction',) if name == 'plot_attrition_by_satisfaction' else ()
+        
+        def setup(ctx, builder=builder, params=params):
+            cube = ctx.cube
+            return lambda: builder(cube, *params)
+        
+        benchmark(f'visualizations.{name}')(setup)
+
+_register_plot_benchmarks()
+
+@benchmark('data_loader.load_data.cold')
+def bench_load_data_cold(ctx):
+    # Cache Parquet dihapus setiap panggilan: parse CSV + normalisasi tipe + tulis Parquet
+    csv_path = ctx.csv_path
+    cache_dir = os.path.join(os.path.dirname(csv_path), '.cache')
+    
+    def run():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_data.__wrapped__(csv_path)
+    return run
+
+@benchmark('data_loader.load_data.warm')
+def bench_load_data_warm(ctx):
+    # Cache Parquet sudah ada: hanya membaca Parquet
+    csv_path = ctx.csv_path
+    with contextlib.redirect_stdout(io.StringIO()):
+        load_data.__wrapped__(csv_path)
+    return lambda: load_data.__wrapped__(csv_path)
+
+@benchmark('segmentation.silhouette.sampled')
+def bench_silhouette_sampled(ctx):
+    # Silhouette exact tidak diukur: O(n^2) memori dan waktu pada 1 juta baris
+    X, labels = ctx.segmentation
+    return lambda: silhouette(X, labels, 'sampled')
+
+@benchmark('segmentation.silhouette.simplified')
+def bench_silhouette_simplified(ctx):
+    X, labels = ctx.segmentation
+    return lambda: silhouette(X, labels, 'simplified')
+
+def measure(func, repeats, max_seconds, min_seconds=0.2):
+    """
+    Mengukur durasi satu panggilan func.
+    
+    Args:
+        func: Callable tanpa argumen
+        repeats: Jumlah ulangan maksimum
+        max_seconds: Anggaran waktu per kasus; ulangan berhenti jika terlewati (minimal 1 ulangan)
+        min_seconds: Durasi minimum satu ulangan untuk menentukan jumlah panggilan
+    
+    Returns:
+        dict: number (panggilan per ulangan), repeats, serta median/min/max detik per panggilan
+    """
+    timer = timeit.Timer(func)
+    
+    # Pemanasan sekaligus menentukan jumlah panggilan per ulangan
+    start = time.perf_counter()
+    func()
+    first = time.perf_counter() - start
+    number = 1 if first >= min_seconds else max(1, int(min_seconds / max(first, 1e-9)))
+    
+    durations = []
+    started = time.perf_counter()
+    for _ in range(repeats):
+        durations.append(timer.timeit(number) / number)
+        if time.perf_counter() - started > max_seconds:
+            break
+    
+    return {
+        'number': number,
+        'repeats': len(durations),
+        'median_s': statistics.median(durations),
+        'min_s': min(durations),
+        'max_s': max(durations),
+    }
+
+def git_revision():
+    """
+    Returns:
+        tuple: (hash commit, True jika working tree berisi perubahan yang belum di-commit)
+    """
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=APP_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    
+    try:
+        return git('rev-parse', 'HEAD'), bool(git('status', '--porcelain', '--untracked-files=no'))
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+
+def environment_info():
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = __import__(package).__version__
+        except ImportError:
+            versions[package] = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'packages': versions,
+    }
+
+def run_benchmarks(sizes, names, artifacts, repeats, max_seconds, seed=DEFAULT_SEED, report=print):
+    """
+    Menjalankan kasus benchmark untuk setiap ukuran data.
+    
+    Returns:
+        list: Satu dictionary hasil per (kasus, ukuran)
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for index, rows in enumerate(sorted(sizes)):
+            ctx = BenchmarkContext(rows, artifacts, tmp_dir, seed)
+            for name in names:
+                setup, single = BENCHMARKS[name]
+                if single and index > 0:
+                    continue
+                
+                stats = measure(setup(ctx), repeats, max_seconds)
+                result = {'name': name, 'rows': 1 if single else rows}
+                result.update(stats)
+                result['rows_per_s'] = result['rows'] / stats['median_s']
+                results.append(result)
+                report(f"{name:<50} {result['rows']:>10,} {stats['median_s'] * 1000:>12.3f} "
+                       f"{result['rows_per_s']:>14,.0f} {stats['repeats']:>3}x{stats['number']}")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="Jumlah baris data sintetis (default: %(default)s)")
+    parser.add_argument('--filter', nargs='+', default=['*'],
+                        help="Pola nama kasus (fnmatch atau substring) yang dijalankan")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--max-seconds', type=float, default=10.0, help="Anggaran waktu per kasus")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--sklearn', action='store_true',
+                        help="Memakai model joblib sklearn, bukan model terkompilasi seperti di aplikasi")
+    parser.add_argument('--output', help="File JSON hasil (default: benchmarks/results/<commit>.json)")
+    parser.add_argument('--list', action='store_true', help="Hanya menampilkan daftar kasus")
+    args = parser.parse_args()
+    
+    names = [name for name in BENCHMARKS
+             if any(fnmatch.fnmatch(name, pattern) or pattern in name for pattern in args.filter)]
+    if args.list:
+        print("\n".join(names))
+        return
+    if not names:
+        raise SystemExit(f"Tidak ada kasus benchmark yang cocok dengan {args.filter}")
+    
+    artifacts = load_artifacts(compiled=not args.sklearn)
+    if not artifacts.available:
+        raise SystemExit("Model tidak dapat dimuat: " + "; ".join(issue.message for issue in artifacts.issues))
+    
+    commit, dirty = git_revision()
+    print(f"commit {commit or '-'}{' (dirty)' if dirty else ''}, model {artifacts.version}"
+          f"{' (sklearn)' if args.sklearn else ' (compiled)'}")
+    print(f"{'kasus':<50} {'baris':>10} {'median ms':>12} {'baris/detik':>14} ulangan")
+    results = run_benchmarks(args.sizes, names, artifacts, args.repeats, args.max_seconds, args.seed)
+    
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        label = (commit or 'nocommit')[:12] + ('-dirty' if dirty else '')
+        output = os.path.join(RESULTS_DIR, f'{label}.json')
+    
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'commit': commit,
+            'dirty': dirty,
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'model_version': artifacts.version,
+            'compiled': not args.sklearn,
+            'seed': args.seed,
+            'environment': environment_info(),
+            'results': results,
+        }, f, indent=2)
+    print(f"Hasil disimpan ke {output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Pembuat data karyawan sintetis untuk benchmark, diskalakan dari 1.058 baris data bawaan.
+
+Baris diambil acak (bootstrap) dari optimal_risk_segmentation_result.csv dengan seed tetap,
+lalu kolom numerik utama diberi sedikit variasi agar data tidak berupa salinan persis
+(sehingga cache dan hash tidak membuat hasil benchmark terlalu optimis). Fitur turunan
+dihitung ulang dari kolom yang sudah divariasikan; Cluster dan RiskLevel mengikuti baris asal.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from scoring import create_engineered_features_df  # noqa: E402
+
+REFERENCE_DATA = os.path.join(APP_DIR, 'data', 'optimal_risk_segmentation_result.csv')
+BASE_ROWS = 1058
+DEFAULT_SEED = 42
+
+# Kolom numerik yang divariasikan: kolom -> (variasi relatif maksimum, batas bawah, batas atas)
+JITTER_COLUMNS = {
+    'MonthlyIncome': (0.05, 1000, 20000),
+    'DailyRate': (0.05, 100, 1500),
+    'MonthlyRate': (0.05, 2000, 27000),
+    'Age': (0.05, 18, 60),
+    'DistanceFromHome': (0.10, 1, 29),
+}
+
+_reference = None
+
+def load_reference():
+    """
+    Returns:
+        DataFrame: Data referensi bawaan (dibaca sekali per proses)
+    """
+    global _reference
+    if _reference is None:
+        _reference = pd.read_csv(REFERENCE_DATA)
+    return _reference
+
+def make_workforce(rows, seed=DEFAULT_SEED):
+    """
+    Membuat data karyawan sintetis yang deterministik untuk seed yang sama.
+    
+    Args:
+        rows: Jumlah baris yang diinginkan
+        seed: Seed generator acak
+    
+    Returns:
+        DataFrame: Data karyawan dengan kolom yang sama seperti data referensi
+    """
+    reference = load_reference()
+    rng = np.random.default_rng(seed)
+    
+    # Ukuran data bawaan memakai data asli apa adanya agar hasilnya mewakili dashboard saat ini
+    if rows == len(reference):
+        return reference.copy()
+    
+    workforce = reference.iloc[rng.integers(0, len(reference), size=rows)].reset_index(drop=True)
+    for column, (scale, lower, upper) in JITTER_COLUMNS.items():
+        factor = 1 + rng.uniform(-scale, scale, size=rows)
+        workforce[column] = np.clip(np.rint(workforce[column] * factor), lower, upper).astype('int64')
+    
+    workforce['EmployeeId'] = np.arange(1, rows + 1)
+    workforce = create_engineered_features_df(workforce)
+    return workforce[reference.columns]
+
+def write_workforce(rows, path, seed=DEFAULT_SEED):
+    """
+    Menyimpan data karyawan sintetis ke CSV.
+    
+    Returns:
+        str: Path file yang ditulis
+    """
+    make_workforce(rows, seed).to_csv(path, index=False)
+    return path
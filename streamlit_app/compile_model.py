@@ -0,0 +1,81 @@
+"""
+Mengompilasi model sebuah versi di registry (default: versi aktif) menjadi compiled_model.joblib.
+
+Versi terkompilasi dipakai otomatis oleh load_artifacts(compiled=True) selama file joblib
+asalnya tidak berubah. model_registry.py register menjalankan kompilasi ini untuk setiap
+versi baru; script ini hanya perlu dijalankan ulang untuk versi yang sudah terdaftar.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python compile_model.py
+    python compile_model.py --version 2041ebb074e4694c
+"""
+import argparse
+import os
+
+import pandas as pd
+
+from scoring import DEFAULT_MODEL_DIR, get_registry, load_artifacts
+from scoring.compiled import check_parity, compile_forest, compile_preprocessor, save_compiled
+
+DEFAULT_REFERENCE = os.path.join(os.path.dirname(DEFAULT_MODEL_DIR), 'data', 'optimal_risk_segmentation_result.csv')
+
+def compile_version(model_dir=DEFAULT_MODEL_DIR, version=None, reference=DEFAULT_REFERENCE, report=print):
+    """
+    Mengompilasi satu versi model dan mencatat file hasilnya di manifest.
+    
+    File hanya ditulis jika prediksi model terkompilasi identik dengan model asal pada
+    data referensi.
+    
+    Args:
+        model_dir: Folder model (registry)
+        version: Versi model; None untuk versi aktif
+        reference: Path CSV data untuk pengecekan paritas
+        report: Callable penerima pesan progres
+    
+    Returns:
+        str: Path file model terkompilasi
+    
+    Raises:
+        ValueError: Jika model tidak dapat dimuat, tidak dapat dikompilasi, atau hasilnya
+            tidak identik dengan model asal
+    """
+    entry = get_registry(model_dir).get(version)
+    if entry is None:
+        raise ValueError(f"Versi model {version or '(aktif)'} tidak terdaftar di {model_dir}")
+    
+    artifacts = load_artifacts(model_dir, version=entry.version)
+    if not artifacts.available:
+        raise ValueError("Model atau preprocessor tidak dapat dimuat: "
+                         + "; ".join(issue.message for issue in artifacts.issues))
+    
+    compiled_preprocessor = compile_preprocessor(artifacts.preprocessor)
+    compiled_model = compile_forest(artifacts.model)
+    
+    parity = check_parity(artifacts.model, artifacts.preprocessor, compiled_model, compiled_preprocessor,
+                          pd.read_csv(reference))
+    report(f"Paritas pada {parity['rows']:,} baris: {parity['mismatched_predictions']} prediksi berbeda, "
+           f"selisih maks transform {parity['max_transform_diff']:.2e}, proba {parity['max_proba_diff']:.2e}")
+    if parity['mismatched_predictions']:
+        raise ValueError("Model terkompilasi tidak identik dengan model asal; file tidak ditulis.")
+    
+    output_path = entry.files['compiled']
+    save_compiled(output_path, compiled_preprocessor, compiled_model, entry.version)
+    get_registry(model_dir).set_compiled(entry.version, output_path)
+    report(f"Model terkompilasi (versi {entry.version}) disimpan ke {output_path}")
+    return output_path
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kompilasi model ke format inferensi cepat.")
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR)
+    parser.add_argument('--version', help="Versi model di registry (default: versi aktif)")
+    parser.add_argument('--reference', default=DEFAULT_REFERENCE,
+                        help="Data untuk pengecekan paritas (default: %(default)s)")
+    args = parser.parse_args(argv)
+    
+    try:
+        compile_version(args.model_dir, args.version, args.reference)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,216 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import hashlib
+import json
+import logging
+import os
+
+from scoring.timing import stage
+
+logger = logging.getLogger(__name__)
+
+# Versi format cache; naikkan jika skema tipe data berubah agar cache lama dibuat ulang
+CACHE_VERSION = 3
+
+# Folder cache kolumnar, relatif terhadap folder file CSV
+CACHE_DIR_NAME = '.cache'
+
+# Urutan level risiko dari yang paling rendah
+RISK_LEVEL_ORDER = ['Risiko Sangat Rendah', 'Risiko Rendah', 'Risiko Tinggi', 'Risiko Sangat Tinggi']
+
+# Skema tipe data: skor ordinal sebagai int8, teks sebagai kategori
+ORDINAL_COLUMNS = [
+    'Attrition', 'Education', 'EnvironmentSatisfaction', 'JobInvolvement', 'JobLevel',
+    'JobSatisfaction', 'OverTime', 'PerformanceRating', 'RelationshipSatisfaction',
+    'StockOptionLevel', 'WorkLifeBalance', 'MaritalRiskFactor', 'Cluster'
+]
+
+CATEGORICAL_COLUMNS = ['Department', 'EducationField', 'Gender', 'JobRole', 'MaritalStatus', 'Over18']
+
+# Kategori dengan urutan alami; groupby dan sort otomatis mengikuti urutan ini
+ORDERED_CATEGORIES = {
+    'RiskLevel': RISK_LEVEL_ORDER,
+    'BusinessTravel': ['Non-Travel', 'Travel_Rarely', 'Travel_Frequently'],
+    'SalaryCategory': ['Rendah (< 5000)', 'Sedang (5000-10000)', 'Tinggi (10000-15000)', 'Sangat Tinggi (>15000)'],
+    'PromotionCategory': ['Baru Dipromosikan', '1-2 Tahun', '3-5 Tahun', '> 5 Tahun'],
+    'AgeGroup': ['< 30', '30-39', '40-49', '50+'],
+    'DistanceCategory': ['0-5 km', '6-10 km', '11-20 km', '21-30 km'],
+}
+
+def normalize_dtypes(df):
+    """
+    Menyeragamkan format kolom dan mengonversinya ke tipe data yang ringkas sesuai skema.
+    
+    Kolom teks menjadi kategori (berurutan untuk ORDERED_CATEGORIES), skor ordinal menjadi
+    int8, dan kolom integer lain di-downcast ke tipe terkecil yang cukup. Ukuran memori
+    sebelum dan sesudah konversi disimpan di df.attrs['memory_footprint'].
+    
+    Args:
+        df: DataFrame hasil pembacaan file mentah
+    
+    Returns:
+        DataFrame: Data dengan tipe data yang sudah dikonversi
+    """
+    before_bytes = int(df.memory_usage(deep=True).sum())
+    
+    # Menangani kolom OverTime jika berupa string
+    if 'OverTime' in df.columns and df['OverTime'].dtype == 'object':
+        df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
+    
+    for col in ORDINAL_COLUMNS:
+        if col not in df.columns or df[col].isnull().any():
+            continue
+        # Kolom Attrition hanya dikonversi jika formatnya 0/1
+        if col == 'Attrition' and df[col].max() > 1:
+            continue
+        df[col] = df[col].astype('int8')
+    
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    
+    for col, categories in ORDERED_CATEGORIES.items():
+        if col not in df.columns:
+            continue
+        # Nilai di luar skema tidak boleh hilang, gunakan kategori biasa
+        if set(df[col].dropna().unique()) <= set(categories):
+            df[col] = df[col].astype(pd.CategoricalDtype(categories, ordered=True))
+        else:
+            df[col] = df[col].astype('category')
+    
+    for col in df.select_dtypes(include='integer').columns:
+        if col not in ORDINAL_COLUMNS:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    
+    df.attrs['memory_footprint'] = {
+        'before_bytes': before_bytes,
+        'after_bytes': int(df.memory_usage(deep=True).sum()),
+    }
+    
+    return df
+
+def format_memory_footprint(df):
+    """
+    Membuat ringkasan teks penggunaan memori DataFrame sebelum dan sesudah normalisasi tipe data.
+    
+    Args:
+        df: DataFrame hasil load_data
+    
+    Returns:
+        str: Ringkasan memori, atau string kosong jika informasi tidak tersedia
+    """
+    footprint = df.attrs.get('memory_footprint') if df is not None else None
+    if not footprint:
+        return ""
+    
+    before_mb = footprint['before_bytes'] / 1e6
+    after_mb = footprint['after_bytes'] / 1e6
+    return (f"Memori dataset: {after_mb:.2f} MB (sebelum optimasi tipe data: {before_mb:.2f} MB, "
+            f"hemat {1 - after_mb / max(before_mb, 1e-9):.0%})")
+
+def _file_sha256(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _cache_paths(file_path):
+    directory, file_name = os.path.split(os.path.abspath(file_path))
+    stem = os.path.splitext(file_name)[0]
+    cache_dir = os.path.join(directory, CACHE_DIR_NAME)
+    return os.path.join(cache_dir, f"{stem}.parquet"), os.path.join(cache_dir, f"{stem}.json")
+
+def _read_cache_meta(meta_path):
+    try:
+        with open(meta_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache_meta(meta_path, stat, sha256):
+    with open(meta_path, 'w') as f:
+        json.dump({
+            'version': CACHE_VERSION,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': sha256,
+        }, f)
+
+def read_table_cached(file_path):
+    """
+    Membaca file CSV melalui cache Parquet kolumnar dengan tipe data eksplisit.
+    
+    Cache dibuat ulang otomatis jika mtime/ukuran CSV berubah dan hash isinya berbeda.
+    Jika pyarrow tidak tersedia atau folder cache tidak dapat ditulis, CSV dibaca langsung.
+    
+    Args:
+        file_path: Path ke file data CSV
+    
+    Returns:
+        DataFrame: Data yang dimuat
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with stage('data_loader.read_csv'):
+            df = normalize_dtypes(pd.read_csv(file_path))
+        df.attrs['data_version'] = _file_sha256(file_path)[:16]
+        return df
+    
+    cache_path, meta_path = _cache_paths(file_path)
+    stat = os.stat(file_path)
+    meta = _read_cache_meta(meta_path)
+    sha256 = None
+    
+    if meta and meta.get('version') == CACHE_VERSION and os.path.exists(cache_path):
+        if meta.get('mtime_ns') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+            with stage('data_loader.read_parquet'):
+                return pd.read_parquet(cache_path)
+        
+        # File disentuh tetapi isinya mungkin sama: cek hash sebelum membuat ulang cache
+        sha256 = _file_sha256(file_path)
+        if meta.get('sha256') == sha256:
+            try:
+                _write_cache_meta(meta_path, stat, sha256)
+            except OSError:
+                pass
+            with stage('data_loader.read_parquet'):
+                return pd.read_parquet(cache_path)
+    
+    sha256 = sha256 or _file_sha256(file_path)
+    with stage('data_loader.read_csv'):
+        df = normalize_dtypes(pd.read_csv(file_path))
+    df.attrs['data_version'] = sha256[:16]
+    logger.info(format_memory_footprint(df))
+    
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with stage('data_loader.write_parquet'):
+            df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+        _write_cache_meta(meta_path, stat, sha256)
+    except OSError as e:
+        logger.warning("Cache Parquet tidak dapat ditulis: %s", e)
+    
+    return df
+
+def get_data_version(df):
+    """
+    Mengambil versi data (fingerprint isi file) untuk dijadikan kunci cache turunan.
+    
+    Args:
+        df: DataFrame hasil load_data
+    
+    Returns:
+        str: Fingerprint heksadesimal 16 karakter
+    """
+    version = df.attrs.get('data_version')
+    if version is None:
+        version = format(int(pd.util.hash_pandas_object(df, index=False).sum()), '016x')
+    return version
 
 @st.cache_data
 def load_data(file_path="data/optimal_risk_segmentation_result.csv"):
@@ -9,22 +219,12 @@ def load_data(file_path="data/optimal_risk_segmentation_result.csv"):
     
     Args:
         file_path: Path ke file data CSV
-        
+    
     Returns:
         DataFrame: Data yang dimuat
     """
     try:
-        df = pd.read_csv(file_path)
-        
-        # Menangani kolom Attrition jika ada dan memastikan formatnya benar
-        if 'Attrition' in df.columns and df['Attrition'].max() <= 1:
-            df['Attrition'] = df['Attrition'].astype(int)
-        
-        # Menangani kolom OverTime jika berupa string
-        if 'OverTime' in df.columns and df['OverTime'].dtype == 'object':
-            df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
-            
-        return df
+        return read_table_cached(file_path)
     except Exception as e:
         st.error(f"Error saat memuat data: {e}")
         return None
@@ -36,7 +236,7 @@ def get_feature_summary(df):
     
     Args:
         df: DataFrame yang akan dianalisis
-        
+    
     Returns:
         dict: Dictionary berisi ringkasan statistik
     """
@@ -45,12 +245,12 @@ def get_feature_summary(df):
     
     summary = {
         'total_rows': len(df),
-        'numeric_cols': len(df.select_dtypes(include=['int64', 'float64']).columns),
-        'categorical_cols': len(df.select_dtypes(include=['object']).columns),
+        'numeric_cols': len(df.select_dtypes(include='number').columns),
+        'categorical_cols': len(df.select_dtypes(include=['object', 'category']).columns),
         'missing_values': df.isnull().sum().sum(),
     }
     
     if 'Attrition' in df.columns:
         summary['attrition_rate'] = df['Attrition'].mean() * 100
     
-    return summary
\ No newline at end of file
+    return summary
@@ -1,32 +1,39 @@
 import streamlit as st
-import joblib
-import os
 
-@st.cache_resource
-def load_model_and_preprocessor():
+from scoring import get_live_model, timed
+
+def show_issues(issues):
+    """
+    Menampilkan masalah dari inti scoring (ScoringIssue) sebagai pesan Streamlit.
+    
+    Args:
+        issues: Iterable berisi ScoringIssue
+    """
+    for issue in issues:
+        getattr(st, issue.level)(issue.message)
+
+def start_model_preload():
     """
-    Memuat model machine learning dan preprocessor yang telah dilatih.
+    Memulai pemuatan versi model aktif di thread latar belakang.
+    
+    Dipanggil di awal setiap rerun; hanya rerun pertama di proses yang memulai thread,
+    sehingga halaman dashboard dapat dirender tanpa menunggu model selesai dimuat.
+    """
+    get_live_model()
+
+@timed('model_loader.load_model_artifacts')
+def load_model_artifacts():
+    """
+    Mengambil model dan preprocessor versi aktif di registry model.
+    
+    Versi baru yang diaktifkan lewat model_registry.py dimuat di latar belakang lalu
+    ditukar secara atomik (lihat scoring.LiveModel), sehingga fungsi ini tidak pernah
+    memuat file joblib kecuali pemuatan pertama belum selesai.
     
     Returns:
-        tuple: (model, preprocessor) jika berhasil dimuat, (None, None) jika gagal
+        ModelArtifacts: Model, preprocessor, dan versinya; pakai objek yang sama untuk
+        seluruh satu prediksi agar model dan versinya konsisten
     """
-    try:
-        model_path = 'model/best_model.joblib'
-        preprocessor_path = 'model/preprocessor.joblib'
-        
-        if os.path.exists(model_path):
-            model = joblib.load(model_path)
-        else:
-            st.warning(f"Model tidak ditemukan di {model_path}")
-            model = None
-            
-        if os.path.exists(preprocessor_path):
-            preprocessor = joblib.load(preprocessor_path)
-        else:
-            st.warning(f"Preprocessor tidak ditemukan di {preprocessor_path}")
-            preprocessor = None
-            
-        return model, preprocessor
-    except Exception as e:
-        st.error(f"Error saat memuat model atau preprocessor: {e}")
-        return None, None
\ No newline at end of file
+    artifacts = get_live_model().current()
+    show_issues(artifacts.issues)
+    return artifacts
@@ -0,0 +1,156 @@
+"""
+Mengelola registry versi model di folder model (manifest.json).
+
+Perintah:
+    list                 Daftar versi beserta metrik; versi aktif ditandai '*'
+    show [VERSI]         Detail satu versi (default: versi aktif) dalam format JSON
+    register             Mendaftarkan file model + preprocessor sebagai versi baru
+    activate VERSI       Menjadikan versi tersebut aktif; aplikasi dan layanan scoring
+                         yang sedang berjalan menukar model tanpa restart
+    verify [VERSI]       Memeriksa hash file sebuah versi terhadap manifest
+
+Metrik training dihitung ulang dengan pembagian data yang sama seperti notebook
+(train_test_split test_size=0.3, random_state=42 pada data referensi), kecuali
+diberikan langsung lewat --metrics.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python model_registry.py register --model ../model/ExtraTrees_model.joblib \\
+        --preprocessor ../model/preprocessor.joblib --name ExtraTrees --no-copy
+    python model_registry.py activate 2041ebb074e4694c
+"""
+import argparse
+import json
+
+import pandas as pd
+
+from compile_model import DEFAULT_REFERENCE, compile_version
+from scoring import DEFAULT_MODEL_DIR, get_registry
+
+TARGET_COLUMN = 'Cluster'
+NON_FEATURE_COLUMNS = ['Cluster', 'EmployeeId', 'RiskLevel', 'is_outlier']
+
+def evaluate_holdout(model, preprocessor, reference_df, test_size=0.3, random_state=42):
+    """
+    Menghitung metrik model pada pembagian train/test yang sama seperti saat training di notebook.
+    
+    Args:
+        model: Model klasifikasi sklearn
+        preprocessor: Preprocessor sklearn
+        reference_df: DataFrame hasil segmentasi (berisi kolom Cluster)
+        test_size: Proporsi data test
+        random_state: Seed pembagian data
+    
+    Returns:
+        dict: train_accuracy, accuracy, precision, recall, f1 (weighted), dan keterangan evaluasi
+    """
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+    from sklearn.model_selection import train_test_split
+    
+    X = reference_df.drop(columns=[c for c in NON_FEATURE_COLUMNS if c in reference_df.columns])
+    y = reference_df[TARGET_COLUMN]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+    
+    y_train_pred = model.predict(preprocessor.transform(X_train))
+    y_test_pred = model.predict(preprocessor.transform(X_test))
+    
+    return {
+        'train_accuracy': round(float(accuracy_score(y_train, y_train_pred)), 4),
+        'accuracy': round(float(accuracy_score(y_test, y_test_pred)), 4),
+        'precision': round(float(precision_score(y_test, y_test_pred, average='weighted')), 4),
+        'recall': round(float(recall_score(y_test, y_test_pred, average='weighted')), 4),
+        'f1': round(float(f1_score(y_test, y_test_pred, average='weighted')), 4),
+        'evaluation': f"train_test_split(test_size={test_size}, random_state={random_state}), "
+                      f"{len(X_test)} baris test",
+    }
+
+def cmd_list(registry, args):
+    active = registry.active_version()
+    print(f"  {'versi':<16} {'nama':<14} {'algoritma':<24} {'akurasi':>8} {'F1':>7}  dibuat")
+    for entry in registry.versions():
+        marker = '*' if entry.version == active else ' '
+        print(f"{marker} {entry.version:<16} {entry.name:<14} {entry.algorithm or '-':<24} "
+              f"{entry.metrics.get('accuracy', float('nan')):>8.4f} {entry.metrics.get('f1', float('nan')):>7.4f}  "
+              f"{entry.created_at or '-'}")
+
+def cmd_show(registry, args):
+    entry = registry.get(args.version)
+    if entry is None:
+        raise SystemExit(f"Versi {args.version or '(aktif)'} tidak terdaftar")
+    print(json.dumps(entry._asdict(), indent=2, ensure_ascii=False))
+
+def cmd_register(registry, args):
+    import joblib
+    
+    if args.metrics:
+        with open(args.metrics, encoding='utf-8') as f:
+            metrics = json.load(f)
+    else:
+        metrics = evaluate_holdout(joblib.load(args.model), joblib.load(args.preprocessor),
+                                   pd.read_csv(args.reference))
+    
+    try:
+        entry = registry.register(args.model, args.preprocessor, name=args.name, metrics=metrics,
+                                  copy_files=not args.no_copy)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"Versi {entry.version} ({entry.name}) terdaftar: akurasi {metrics.get('accuracy')}, F1 {metrics.get('f1')}")
+    
+    try:
+        compile_version(registry.model_dir, entry.version, args.reference)
+    except ValueError as e:
+        print(f"Versi {entry.version} tidak dikompilasi: {e}")
+    
+    if args.activate:
+        cmd_activate(registry, argparse.Namespace(version=entry.version))
+
+def cmd_activate(registry, args):
+    try:
+        registry.activate(args.version)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"Versi {args.version} sekarang aktif")
+
+def cmd_verify(registry, args):
+    problems = registry.verify(args.version)
+    for problem in problems:
+        print(problem)
+    if problems:
+        raise SystemExit(1)
+    print(f"Versi {registry.get(args.version).version} sesuai dengan manifest")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR)
+    commands = parser.add_subparsers(dest='command', required=True)
+    
+    commands.add_parser('list', help="Daftar versi model").set_defaults(handler=cmd_list)
+    
+    show = commands.add_parser('show', help="Detail satu versi")
+    show.add_argument('version', nargs='?')
+    show.set_defaults(handler=cmd_show)
+    
+    register = commands.add_parser('register', help="Mendaftarkan versi baru")
+    register.add_argument('--model', required=True, help="File model joblib")
+    register.add_argument('--preprocessor', required=True, help="File preprocessor joblib")
+    register.add_argument('--name', help="Nama model (default: nama kelas model)")
+    register.add_argument('--metrics', help="File JSON berisi metrik training")
+    register.add_argument('--reference', default=DEFAULT_REFERENCE,
+                          help="Data referensi untuk evaluasi dan paritas (default: %(default)s)")
+    register.add_argument('--activate', action='store_true', help="Langsung jadikan versi aktif")
+    register.add_argument('--no-copy', action='store_true',
+                          help="Catat path file apa adanya tanpa menyalinnya ke folder model/versions")
+    register.set_defaults(handler=cmd_register)
+    
+    activate = commands.add_parser('activate', help="Menjadikan sebuah versi aktif")
+    activate.add_argument('version')
+    activate.set_defaults(handler=cmd_activate)
+    
+    verify = commands.add_parser('verify', help="Memeriksa hash file sebuah versi")
+    verify.add_argument('version', nargs='?')
+    verify.set_defaults(handler=cmd_verify)
+    
+    args = parser.parse_args(argv)
+    args.handler(get_registry(args.model_dir), args)
+
+if __name__ == '__main__':
+    main()
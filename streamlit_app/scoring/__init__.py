@@ -0,0 +1,23 @@
+"""
+Inti scoring risiko attrition yang tidak bergantung pada Streamlit.
+
+Dipakai bersama oleh dashboard Streamlit (melalui model_loader), batch_scoring,
+dan scoring_service.
+"""
+from scoring.errors import ScoringIssue
+from scoring.timing import (
+    enable_timing, timing_enabled, timing_scope, record_timing, stage, timed, timing_summary, reset_timings
+)
+from scoring.registry import DEFAULT_MODEL_DIR, ModelRegistry, ModelVersion, get_registry
+from scoring.artifacts import ModelArtifacts, load_artifacts, clear_artifact_cache, artifact_version
+from scoring.live import LiveModel, get_live_model
+from scoring.shadow import ShadowScorer
+from scoring.compiled import CompiledForest, CompiledPreprocessor, compile_forest, compile_preprocessor
+from scoring.prediction import (
+    CLUSTER_MAPPING, EXPECTED_COLUMNS, COLUMN_DEFAULTS, RISK_FACTOR_RULES,
+    AnalysisResult, PredictionCache, prediction_cache, timed_stage,
+    create_engineered_features, create_engineered_features_df, fill_default_columns,
+    rule_based_risk_score, risk_score_to_cluster,
+    predict_attrition_risk, predict_attrition_risk_batch, analyze_employee,
+    generate_risk_factors, generate_risk_factors_batch, generate_recommendations,
+)
@@ -0,0 +1,172 @@
+import logging
+import os
+import threading
+from collections import namedtuple
+
+import joblib
+
+from scoring.compiled import compile_forest, compile_preprocessor, load_compiled
+from scoring.errors import record_issue
+from scoring.registry import (
+    DEFAULT_MODEL_DIR, MODEL_FILENAME, PREPROCESSOR_FILENAME, file_sha256, get_registry
+)
+from scoring.timing import timed
+
+logger = logging.getLogger(__name__)
+
+# Array NumPy di dalam compiled_model.joblib dibaca lewat memory map, sehingga proses-proses
+# yang memuat file yang sama berbagi halaman memori fisik yang sama. Model sklearn tidak
+# dapat dibagi: Tree.__setstate__ menyalin array node ke memori proses, sehingga file
+# joblib sklearn dimuat biasa
+MMAP_MODE = 'r'
+
+class ModelArtifacts(namedtuple('ModelArtifacts', ['model', 'preprocessor', 'version', 'issues'])):
+    """
+    Model, preprocessor, dan versinya yang dimuat dari satu versi di registry model.
+    
+    Attributes:
+        model: Model machine learning, atau None jika gagal dimuat
+        preprocessor: Preprocessor, atau None jika gagal dimuat
+        version: Versi model di registry, atau 'rules' jika tidak ada model
+        issues: Tuple ScoringIssue yang terjadi saat memuat
+    """
+    __slots__ = ()
+    
+    @property
+    def available(self):
+        return self.model is not None and self.preprocessor is not None
+
+# Cache level proses: setiap versi model hanya dimuat sekali per proses. Setiap kunci
+# punya lock sendiri, sehingga pemuatan versi baru di latar belakang tidak menahan
+# pemanggil yang memakai versi yang sudah ada di cache
+_artifact_cache = {}
+_artifact_locks = {}
+_artifact_lock = threading.Lock()
+
+def load_artifacts(model_dir=DEFAULT_MODEL_DIR, compiled=False, version=None):
+    """
+    Memuat model dan preprocessor sebuah versi di registry, memakai cache level proses.
+    
+    Args:
+        model_dir: Folder model berisi manifest.json (lihat scoring.registry); tanpa
+            manifest, best_model.joblib dan preprocessor.joblib yang dipakai
+        compiled: True untuk memakai versi terkompilasi (lihat scoring.compiled) yang
+            lebih cepat; file terkompilasi dipakai jika masih sesuai dengan file joblib,
+            selain itu model dikompilasi di memori
+        version: Versi model di registry; None untuk versi aktif
+    
+    Returns:
+        ModelArtifacts: Hasil pemuatan beserta masalah yang terjadi
+    """
+    registry = get_registry(model_dir)
+    entry = registry.get(version)
+    key = (registry.model_dir, entry.version if entry is not None else version, compiled)
+    
+    with _artifact_lock:
+        lock = _artifact_locks.setdefault(key, threading.Lock())
+    
+    with lock:
+        if key not in _artifact_cache:
+            if entry is None:
+                _artifact_cache[key] = _missing_artifacts(registry.model_dir, version)
+            elif compiled:
+                _artifact_cache[key] = _load_compiled_artifacts(registry.model_dir, entry)
+            else:
+                _artifact_cache[key] = _load_artifacts(entry)
+        return _artifact_cache[key]
+
+def clear_artifact_cache(model_dir=None, version=None):
+    """
+    Menghapus cache artefak sehingga pemanggilan berikutnya memuat ulang dari disk.
+    
+    Args:
+        model_dir: Hanya hapus artefak dari folder model ini; None untuk semua folder
+        version: Hanya hapus artefak versi ini; None untuk semua versi
+    """
+    model_dir = os.path.abspath(model_dir) if model_dir is not None else None
+    
+    with _artifact_lock:
+        for key in list(_artifact_cache):
+            if (model_dir is None or key[0] == model_dir) and (version is None or key[1] == version):
+                del _artifact_cache[key]
+
+def artifact_version(model_dir=DEFAULT_MODEL_DIR):
+    """
+    Mengembalikan versi model yang sedang aktif di registry.
+    
+    Args:
+        model_dir: Folder model
+    
+    Returns:
+        str: 16 karakter pertama hash SHA-256 file model dan preprocessor versi aktif,
+        atau 'rules' jika belum ada model
+    """
+    entry = get_registry(model_dir).get()
+    return entry.version if entry is not None else 'rules'
+
+def _missing_artifacts(model_dir, version):
+    issues = []
+    
+    if version is not None:
+        record_issue(issues, 'warning', 'artifact_missing', f"Versi model {version} tidak terdaftar di {model_dir}")
+    else:
+        for label, filename in (('Model', MODEL_FILENAME), ('Preprocessor', PREPROCESSOR_FILENAME)):
+            record_issue(issues, 'warning', 'artifact_missing',
+                         f"{label} tidak ditemukan di {os.path.join(model_dir, filename)}")
+    
+    return ModelArtifacts(None, None, 'rules', tuple(issues))
+
+@timed('artifacts.load_joblib')
+def _load_artifacts(entry):
+    issues = []
+    loaded = []
+    
+    for label, kind in (('Model', 'model'), ('Preprocessor', 'preprocessor')):
+        path = entry.files[kind]
+        artifact = None
+        
+        if not os.path.exists(path):
+            record_issue(issues, 'warning', 'artifact_missing', f"{label} tidak ditemukan di {path}")
+        elif kind in entry.sha256 and file_sha256(path) != entry.sha256[kind]:
+            # Jangan memakai file yang isinya berbeda dari yang tercatat di manifest
+            record_issue(issues, 'error', 'artifact_hash_mismatch',
+                         f"Isi {label.lower()} {path} tidak sesuai hash versi {entry.version} di manifest")
+        else:
+            try:
+                artifact = joblib.load(path)
+            except Exception as e:
+                record_issue(issues, 'error', 'artifact_load_failed',
+                             f"Error saat memuat {label.lower()} dari {path}: {e}")
+        
+        loaded.append(artifact)
+    
+    return ModelArtifacts(loaded[0], loaded[1], entry.version, tuple(issues))
+
+@timed('artifacts.load_compiled')
+def _load_compiled_artifacts(model_dir, entry):
+    path = entry.files['compiled']
+    
+    # File terkompilasi hanya dipakai jika dibuat dari file joblib yang sama
+    if os.path.exists(path):
+        try:
+            compiled = load_compiled(path, mmap_mode=MMAP_MODE)
+        except Exception as e:
+            logger.warning("Gagal membaca %s: %s", path, e)
+            compiled = None
+        if compiled is not None and compiled[2] == entry.version:
+            compiled_preprocessor, compiled_model, _ = compiled
+            return ModelArtifacts(compiled_model, compiled_preprocessor, entry.version, ())
+        logger.info("%s tidak sesuai dengan model versi %s, model dikompilasi ulang di memori", path, entry.version)
+    
+    artifacts = load_artifacts(model_dir, version=entry.version)
+    if not artifacts.available:
+        return artifacts
+    
+    # Model non-pohon (misalnya SVM) tetap bisa memakai preprocessor terkompilasi
+    for field, label, compile_fn in (('preprocessor', 'Preprocessor', compile_preprocessor),
+                                     ('model', 'Model', compile_forest)):
+        try:
+            artifacts = artifacts._replace(**{field: compile_fn(getattr(artifacts, field))})
+        except ValueError as e:
+            logger.info("%s tidak dapat dikompilasi (%s), memakai versi joblib", label, e)
+    return artifacts
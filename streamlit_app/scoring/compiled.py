@@ -0,0 +1,308 @@
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+COMPILED_FILENAME = 'compiled_model.joblib'
+COMPILED_FORMAT_VERSION = 2
+
+class CompiledPreprocessor:
+    """
+    Versi ringkas ColumnTransformer (StandardScaler + OneHotEncoder) berbasis array NumPy.
+    
+    Hasil transform identik dengan preprocessor sklearn asalnya, tanpa validasi input
+    per panggilan sehingga jauh lebih cepat untuk data kecil.
+    """
+    
+    def __init__(self, numeric_columns, mean, scale, categorical_columns, categories):
+        self.numeric_columns = list(numeric_columns)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.categorical_columns = list(categorical_columns)
+        self.categories = [pd.Index(values) for values in categories]
+        
+        sizes = [len(values) for values in self.categories]
+        self.offsets = len(self.numeric_columns) + np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(int)
+        self.n_features_out = len(self.numeric_columns) + sum(sizes)
+    
+    def transform(self, df):
+        """
+        Args:
+            df: DataFrame berisi kolom numerik dan kategorikal yang dipakai saat training
+        
+        Returns:
+            ndarray: Matriks fitur float64 berukuran (jumlah baris, n_features_out)
+        """
+        n_rows = len(df)
+        out = np.zeros((n_rows, self.n_features_out), dtype=np.float64)
+        out[:, :len(self.numeric_columns)] = (
+            (df[self.numeric_columns].to_numpy(dtype=np.float64) - self.mean) / self.scale
+        )
+        
+        rows = np.arange(n_rows)
+        for col, categories, offset in zip(self.categorical_columns, self.categories, self.offsets):
+            # Kategori yang tidak dikenal bernilai -1 dan dibiarkan nol (handle_unknown='ignore')
+            codes = categories.get_indexer(df[col])
+            known = codes >= 0
+            out[rows[known], offset + codes[known]] = 1.0
+        
+        return out
+
+class CompiledForest:
+    """
+    Ensemble pohon keputusan yang dipadatkan menjadi satu set array node.
+    
+    Node disusun ulang sehingga anak kanan selalu tepat setelah anak kiri
+    (children[node] + 1) dan daun menunjuk ke dirinya sendiri dengan threshold +inf.
+    Satu langkah penelusuran untuk semua baris dan semua pohon cukup berupa
+    node = children[node] + (x > threshold[node]), diulang max_depth kali.
+    """
+    
+    # Jumlah baris per blok agar array penelusuran tetap muat di cache CPU
+    BLOCK_ROWS = 1024
+    
+    def __init__(self, feature, threshold, children, missing_left, value, roots, classes, max_depth):
+        self.feature = np.asarray(feature, dtype=np.intp)
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.children = np.asarray(children, dtype=np.intp)
+        self.missing_left = np.asarray(missing_left, dtype=bool)
+        self.value = np.asarray(value, dtype=np.float64)
+        self.roots = np.asarray(roots, dtype=np.intp)
+        self.classes_ = np.asarray(classes)
+        self.max_depth = int(max_depth)
+    
+    def _leaves(self, X):
+        # Sama seperti sklearn, nilai fitur dibandingkan dalam presisi float32
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        has_missing = bool(np.isnan(X).any())
+        n_rows, n_features = X.shape
+        flat = X.ravel()
+        leaves = np.empty((n_rows, len(self.roots)), dtype=np.intp)
+        
+        for start in range(0, n_rows, self.BLOCK_ROWS):
+            block_rows = min(self.BLOCK_ROWS, n_rows - start)
+            base = (np.arange(start, start + block_rows) * n_features)[:, None]
+            nodes = np.repeat(self.roots[None, :], block_rows, axis=0)
+            
+            for _ in range(self.max_depth):
+                values = np.take(flat, base + np.take(self.feature, nodes))
+                go_right = values > np.take(self.threshold, nodes)
+                if has_missing:
+                    go_right = np.where(np.isnan(values), ~np.take(self.missing_left, nodes), go_right)
+                nodes = np.take(self.children, nodes) + go_right
+            
+            leaves[start:start + block_rows] = nodes
+        
+        return leaves
+    
+    def predict_proba(self, X):
+        """
+        Args:
+            X: Matriks fitur hasil preprocessing
+        
+        Returns:
+            ndarray: Probabilitas per kelas (rata-rata seluruh pohon)
+        """
+        leaves = self._leaves(X)
+        return np.column_stack([np.take(self.value[:, k], leaves).mean(axis=1)
+                                for k in range(self.value.shape[1])])
+    
+    def predict(self, X):
+        """
+        Args:
+            X: Matriks fitur hasil preprocessing
+        
+        Returns:
+            ndarray: Kelas hasil prediksi
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+def _pack_tree(tree, offset):
+    """
+    Menyusun ulang node satu pohon sklearn secara breadth-first dengan anak kiri dan kanan
+    bersebelahan.
+    
+    Returns:
+        dict: Array feature, threshold, children, missing_left, dan value pohon tersebut
+    """
+    n_nodes = tree.node_count
+    new_ids = np.zeros(n_nodes, dtype=np.intp)
+    order = [0]
+    next_id = 1
+    
+    for old in order:
+        left, right = tree.children_left[old], tree.children_right[old]
+        if left != -1:
+            new_ids[left], new_ids[right] = next_id, next_id + 1
+            next_id += 2
+            order.extend((left, right))
+    
+    old_ids = np.asarray(order)
+    leaf = tree.children_left[old_ids] == -1
+    missing = getattr(tree, 'missing_go_to_left', np.zeros(n_nodes, dtype=np.uint8))
+    
+    # Sama seperti DecisionTreeClassifier.predict_proba: nilai daun dinormalisasi
+    value = tree.value[old_ids, 0, :].astype(np.float64)
+    totals = value.sum(axis=1, keepdims=True)
+    totals[totals == 0] = 1.0
+    
+    return {
+        'feature': np.where(leaf, 0, tree.feature[old_ids]),
+        'threshold': np.where(leaf, np.inf, tree.threshold[old_ids]),
+        'children': np.where(leaf, np.arange(n_nodes), new_ids[np.maximum(tree.children_left[old_ids], 0)]) + offset,
+        'missing_left': np.where(leaf, True, missing[old_ids].astype(bool)),
+        'value': value / totals,
+    }
+
+def compile_preprocessor(preprocessor):
+    """
+    Mengubah ColumnTransformer hasil training menjadi CompiledPreprocessor.
+    
+    Args:
+        preprocessor: ColumnTransformer berisi StandardScaler ('num') dan OneHotEncoder ('cat')
+    
+    Returns:
+        CompiledPreprocessor
+    
+    Raises:
+        ValueError: Jika struktur preprocessor tidak didukung
+    """
+    steps = [(name, transformer, columns) for name, transformer, columns in preprocessor.transformers_
+             if transformer != 'drop']
+    kinds = [type(transformer).__name__ for _, transformer, _ in steps]
+    
+    if kinds != ['StandardScaler', 'OneHotEncoder']:
+        raise ValueError(f"Struktur preprocessor tidak didukung: {kinds}")
+    
+    (_, scaler, numeric_columns), (_, encoder, categorical_columns) = steps
+    if encoder.drop is not None or getattr(encoder, 'min_frequency', None) is not None \
+            or getattr(encoder, 'max_categories', None) is not None or encoder.handle_unknown != 'ignore':
+        raise ValueError("OneHotEncoder dengan drop/min_frequency/max_categories tidak didukung")
+    if not all(isinstance(value, str) for values in encoder.categories_ for value in values):
+        raise ValueError("Hanya kategori bertipe string yang didukung")
+    
+    n_numeric = len(numeric_columns)
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(n_numeric)
+    scale = scaler.scale_ if scaler.with_std else np.ones(n_numeric)
+    
+    return CompiledPreprocessor(numeric_columns, mean, scale, categorical_columns, encoder.categories_)
+
+def compile_forest(model):
+    """
+    Mengubah RandomForestClassifier/ExtraTreesClassifier menjadi CompiledForest.
+    
+    Args:
+        model: Ensemble pohon klasifikasi sklearn yang sudah dilatih
+    
+    Returns:
+        CompiledForest
+    
+    Raises:
+        ValueError: Jika model bukan ensemble pohon klasifikasi
+    """
+    estimators = getattr(model, 'estimators_', None)
+    if not estimators or not all(hasattr(tree, 'tree_') for tree in estimators) or model.n_outputs_ != 1:
+        raise ValueError(f"Model {type(model).__name__} tidak dapat dikompilasi")
+    
+    parts = {key: [] for key in ('feature', 'threshold', 'children', 'missing_left', 'value')}
+    roots = []
+    offset = 0
+    
+    for estimator in estimators:
+        for key, values in _pack_tree(estimator.tree_, offset).items():
+            parts[key].append(values)
+        roots.append(offset)
+        offset += estimator.tree_.node_count
+    
+    packed = {key: np.concatenate(values) for key, values in parts.items()}
+    max_depth = max(estimator.tree_.max_depth for estimator in estimators)
+    
+    return CompiledForest(roots=roots, classes=model.classes_, max_depth=max_depth, **packed)
+
+def save_compiled(path, preprocessor, forest, source_version):
+    """
+    Menyimpan preprocessor dan model terkompilasi ke satu file joblib tanpa kompresi.
+    
+    Isinya hanya array NumPy dan tipe dasar Python, sehingga array node dapat
+    di-memory-map oleh load_compiled dan dipakai bersama oleh banyak proses.
+    
+    Args:
+        path: Path file output
+        preprocessor: CompiledPreprocessor
+        forest: CompiledForest
+        source_version: Versi file joblib asal (lihat ModelArtifacts.version)
+    """
+    payload = {
+        'format_version': COMPILED_FORMAT_VERSION,
+        'source_version': source_version,
+        'numeric_columns': preprocessor.numeric_columns,
+        'mean': preprocessor.mean,
+        'scale': preprocessor.scale,
+        'categorical_columns': preprocessor.categorical_columns,
+        'categories': [values.tolist() for values in preprocessor.categories],
+        'feature': forest.feature,
+        'threshold': forest.threshold,
+        'children': forest.children,
+        'missing_left': forest.missing_left,
+        'value': forest.value,
+        'roots': forest.roots,
+        'classes': forest.classes_,
+        'max_depth': forest.max_depth,
+    }
+    # Tulis ke file sementara lalu ganti secara atomik: proses lain yang sedang
+    # memory-map file lama tetap membaca inode lama dan tidak melihat file setengah jadi
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    joblib.dump(payload, tmp_path, compress=0)
+    os.replace(tmp_path, path)
+
+def load_compiled(path, mmap_mode='r'):
+    """
+    Memuat file hasil save_compiled.
+    
+    Dengan mmap_mode='r' array node tidak disalin ke memori proses, melainkan dibaca
+    langsung dari page cache yang sama untuk semua proses yang memuat file ini.
+    
+    Args:
+        path: Path file compiled_model.joblib
+        mmap_mode: Diteruskan ke joblib.load; None untuk memuat salinan penuh
+    
+    Returns:
+        tuple: (CompiledPreprocessor, CompiledForest, source_version), atau None jika
+        format file tidak sesuai dengan versi kode ini
+    """
+    data = joblib.load(path, mmap_mode=mmap_mode)
+    if not isinstance(data, dict) or data.get('format_version') != COMPILED_FORMAT_VERSION:
+        return None
+    
+    preprocessor = CompiledPreprocessor(data['numeric_columns'], data['mean'], data['scale'],
+                                        data['categorical_columns'], data['categories'])
+    forest = CompiledForest(data['feature'], data['threshold'], data['children'], data['missing_left'],
+                            data['value'], data['roots'], data['classes'], data['max_depth'])
+    return preprocessor, forest, data['source_version']
+
+def check_parity(model, preprocessor, compiled_model, compiled_preprocessor, df):
+    """
+    Membandingkan prediksi model terkompilasi dengan model sklearn asalnya.
+    
+    Args:
+        model, preprocessor: Model dan preprocessor sklearn
+        compiled_model, compiled_preprocessor: Hasil kompilasi keduanya
+        df: DataFrame data karyawan mentah
+    
+    Returns:
+        dict: rows, mismatched_predictions, dan max_transform_diff / max_proba_diff
+    """
+    from scoring.prediction import create_engineered_features_df, fill_default_columns
+    
+    employee_df = fill_default_columns(create_engineered_features_df(df))
+    X = preprocessor.transform(employee_df)
+    X_compiled = compiled_preprocessor.transform(employee_df)
+    
+    return {
+        'rows': len(df),
+        'mismatched_predictions': int((model.predict(X) != compiled_model.predict(X_compiled)).sum()),
+        'max_transform_diff': float(np.abs(np.asarray(X) - X_compiled).max()),
+        'max_proba_diff': float(np.abs(model.predict_proba(X) - compiled_model.predict_proba(X_compiled)).max()),
+    }
@@ -0,0 +1,37 @@
+import logging
+from collections import namedtuple
+
+logger = logging.getLogger('scoring')
+
+class ScoringIssue(namedtuple('ScoringIssue', ['level', 'code', 'message'])):
+    """
+    Masalah yang terjadi saat memuat model atau melakukan scoring.
+    
+    Masalah dikembalikan sebagai data, bukan ditampilkan langsung, sehingga pemanggil
+    (Streamlit, layanan HTTP, atau batch job) menentukan sendiri cara menampilkannya.
+    
+    Attributes:
+        level: 'warning' jika scoring tetap berjalan dengan cara alternatif, 'error' jika gagal
+        code: Kode singkat yang stabil, misalnya 'artifact_missing' atau 'model_fallback'
+        message: Pesan untuk pengguna
+    """
+    __slots__ = ()
+
+def record_issue(issues, level, code, message):
+    """
+    Mencatat masalah ke log dan menambahkannya ke list issues jika diberikan.
+    
+    Args:
+        issues: List penampung ScoringIssue atau None
+        level: 'warning' atau 'error'
+        code: Kode masalah
+        message: Pesan untuk pengguna
+        
+    Returns:
+        ScoringIssue: Masalah yang dicatat
+    """
+    issue = ScoringIssue(level, code, message)
+    getattr(logger, level)(message)
+    if issues is not None:
+        issues.append(issue)
+    return issue
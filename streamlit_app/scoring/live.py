@@ -0,0 +1,152 @@
+import logging
+import os
+import threading
+
+from scoring.artifacts import ModelArtifacts, clear_artifact_cache, load_artifacts
+from scoring.errors import record_issue
+from scoring.registry import DEFAULT_MODEL_DIR, get_registry
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL_SECONDS = 2.0
+
+class LiveModel:
+    """
+    Artefak versi aktif registry yang ditukar secara atomik saat versi aktif berubah.
+    
+    Thread latar belakang memuat versi aktif lalu memantau manifest. Versi baru dimuat
+    penuh (termasuk kompilasi) di thread tersebut, baru kemudian referensinya ditukar,
+    sehingga request tidak pernah menunggu joblib.load kecuali sebelum pemuatan pertama
+    selesai. Jika versi baru gagal dimuat, versi lama tetap dipakai.
+    """
+    
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR, compiled=True, poll_interval=POLL_INTERVAL_SECONDS):
+        self.model_dir = os.path.abspath(model_dir)
+        self.compiled = compiled
+        self.poll_interval = poll_interval
+        self.registry = get_registry(model_dir)
+        self.swaps = 0
+        self._artifacts = None
+        self._target = None
+        self._failed_target = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+    
+    @property
+    def ready(self):
+        return self._ready.is_set()
+    
+    def start(self):
+        """
+        Memulai thread pemuatan dan pemantauan jika belum berjalan.
+        """
+        with self._start_lock:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._watch, name='model-preload', daemon=True)
+                self._thread.start()
+    
+    def stop(self):
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stopped.set()
+            thread.join()
+    
+    def current(self, timeout=None):
+        """
+        Mengembalikan artefak versi aktif yang sudah dimuat.
+        
+        Pemanggil sebaiknya memakai objek yang dikembalikan untuk seluruh satu request,
+        sehingga model, preprocessor, dan versinya selalu konsisten walaupun terjadi swap.
+        
+        Args:
+            timeout: Batas waktu (detik) menunggu pemuatan pertama; None untuk menunggu
+        
+        Returns:
+            ModelArtifacts: Artefak versi aktif, atau None jika timeout terlewati
+        """
+        self.start()
+        self._ready.wait(timeout)
+        return self._artifacts
+    
+    def refresh(self):
+        """
+        Memuat dan menukar ke versi aktif di manifest jika berbeda dengan versi saat ini.
+        
+        Returns:
+            bool: True jika terjadi swap
+        """
+        with self._refresh_lock:
+            target = self.registry.active_version()
+            if self._artifacts is not None and target in (self._target, self._failed_target):
+                return False
+            
+            artifacts = load_artifacts(self.model_dir, compiled=self.compiled, version=target)
+            previous = self._artifacts
+            
+            if previous is not None and not artifacts.available:
+                logger.error("Versi model %s gagal dimuat, tetap memakai versi %s: %s", target, previous.version,
+                             "; ".join(issue.message for issue in artifacts.issues))
+                self._failed_target = target
+                clear_artifact_cache(self.model_dir, artifacts.version)
+                return False
+            
+            # Penukaran referensi bersifat atomik; request yang sedang berjalan tetap
+            # memakai objek versi lama yang sudah dipegangnya
+            self._artifacts = artifacts
+            self._target, self._failed_target = target, None
+            self._ready.set()
+            
+            if previous is not None:
+                self.swaps += 1
+                logger.info("Model ditukar dari versi %s ke %s", previous.version, artifacts.version)
+                if previous.version != artifacts.version:
+                    clear_artifact_cache(self.model_dir, previous.version)
+            return True
+    
+    def _watch(self):
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.exception("Gagal memeriksa versi model di %s", self.model_dir)
+                if not self._ready.is_set():
+                    issues = []
+                    record_issue(issues, 'error', 'artifact_load_failed', f"Error saat memuat model: {e}")
+                    self._artifacts = ModelArtifacts(None, None, 'rules', tuple(issues))
+                    self._ready.set()
+            self._stopped.wait(self.poll_interval)
+    
+    def stats(self):
+        artifacts = self._artifacts
+        return {
+            'ready': self.ready,
+            'version': artifacts.version if artifacts is not None else None,
+            'active_version': self._target,
+            'failed_version': self._failed_target,
+            'swaps': self.swaps,
+        }
+
+# Satu LiveModel per folder model per proses
+_live_models = {}
+_live_models_lock = threading.Lock()
+
+def get_live_model(model_dir=DEFAULT_MODEL_DIR, compiled=True):
+    """
+    Mengembalikan LiveModel milik proses untuk folder model tersebut dan memulai
+    pemuatan di latar belakang jika belum berjalan.
+    
+    Returns:
+        LiveModel
+    """
+    key = (os.path.abspath(model_dir), compiled)
+    with _live_models_lock:
+        if key not in _live_models:
+            _live_models[key] = LiveModel(key[0], compiled)
+        live = _live_models[key]
+    live.start()
+    return live
@@ -0,0 +1,766 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+
+import pandas as pd
+import numpy as np
+
+from scoring.errors import record_issue
+from scoring.timing import record_timing, stage
+
+logger = logging.getLogger(__name__)
+
+SATISFACTION_COLUMNS = ['JobSatisfaction', 'EnvironmentSatisfaction',
+                        'WorkLifeBalance', 'RelationshipSatisfaction']
+
+MARITAL_RISK = {'Single': 2, 'Divorced': 1, 'Married': 0}
+
+def _bucket(values, conditions, labels, default):
+    # Nilai kosong tetap kosong, sehingga fill_default_columns mengisinya seperti kolom yang tidak ada
+    buckets = pd.Series(np.select(conditions, labels, default=default), index=values.index, dtype=object)
+    return buckets.where(values.notna())
+
+def create_engineered_features_df(df):
+    """
+    Membuat fitur-fitur turunan untuk banyak karyawan sekaligus secara vektorisasi.
+    
+    Hasilnya sama dengan kolom turunan pada optimal_risk_segmentation_result.csv, kecuali
+    SalaryPerLevel, SalaryToAgeRatio, dan DistanceWorkLifeImpact: di data latih ketiganya
+    dipotong pada kuantil 1% dan 99% seluruh data (berbeda pada 22, 22, dan 9 baris),
+    sedangkan di sini tidak dipotong karena kuantil tidak dapat dihitung dari satu karyawan.
+    Satu panggilan dapat memproses seluruh data karyawan tanpa loop Python.
+    
+    Args:
+        df: DataFrame berisi data input karyawan (satu baris per karyawan)
+    
+    Returns:
+        DataFrame: Salinan DataFrame dengan fitur tambahan
+    """
+    data = df.copy()
+    
+    # Data mentah HRIS menyimpan OverTime sebagai 'Yes'/'No'
+    if 'OverTime' in data.columns and data['OverTime'].dtype == 'object':
+        data['OverTime'] = data['OverTime'].map({'Yes': 1, 'No': 0})
+    
+    # Pastikan semua fitur dasar ada
+    if 'JobInvolvement' not in data.columns:
+        data['JobInvolvement'] = 3  # Nilai default
+    
+    # Membuat kategori gaji
+    if 'MonthlyIncome' in data.columns:
+        income = data['MonthlyIncome']
+        data['SalaryCategory'] = _bucket(
+            income,
+            [income < 5000, income < 10000, income < 15000],
+            ['Rendah (< 5000)', 'Sedang (5000-10000)', 'Tinggi (10000-15000)'],
+            default='Sangat Tinggi (>15000)'
+        )
+    
+    # Membuat kategori promosi
+    if 'YearsSinceLastPromotion' in data.columns:
+        years = data['YearsSinceLastPromotion']
+        data['PromotionCategory'] = _bucket(
+            years,
+            [years == 0, years <= 2, years <= 5],
+            ['Baru Dipromosikan', '1-2 Tahun', '3-5 Tahun'],
+            default='> 5 Tahun'
+        )
+    
+    # Membuat kategori usia
+    if 'Age' in data.columns:
+        age = data['Age']
+        data['AgeGroup'] = _bucket(
+            age,
+            [age < 30, age < 40, age < 50],
+            ['< 30', '30-39', '40-49'],
+            default='50+'
+        )
+    
+    # Membuat kategori jarak
+    if 'DistanceFromHome' in data.columns:
+        distance = data['DistanceFromHome']
+        data['DistanceCategory'] = _bucket(
+            distance,
+            [distance <= 5, distance <= 10, distance <= 20],
+            ['0-5 km', '6-10 km', '11-20 km'],
+            default='21-30 km'
+        )
+    
+    # Fitur-fitur turunan
+    if 'JobLevel' in data.columns and 'MonthlyIncome' in data.columns:
+        data['SalaryPerLevel'] = data['MonthlyIncome'] / data['JobLevel'].clip(lower=1)
+    
+    # Indeks dan variasi kepuasan (variansi sampel, sama seperti data latih)
+    satisfaction_cols = [col for col in SATISFACTION_COLUMNS if col in data.columns]
+    
+    if len(satisfaction_cols) >= 2:
+        values = data[satisfaction_cols]
+        data['SatisfactionIndex'] = values.mean(axis=1)
+        data['SatisfactionVariance'] = values.var(axis=1, ddof=1)
+    
+    # Fitur rasio promosi
+    if 'YearsSinceLastPromotion' in data.columns and 'YearsAtCompany' in data.columns:
+        data['PromotionRatio'] = data['YearsSinceLastPromotion'] / data['YearsAtCompany'].clip(lower=1)
+        data['YearsSincePromotionSq'] = data['YearsSinceLastPromotion'] ** 2
+    
+    # Kepuasan overtime
+    if 'OverTime' in data.columns and 'JobSatisfaction' in data.columns:
+        data['OvertimeSatisfaction'] = (5 - data['JobSatisfaction']) * data['OverTime']
+    
+    # Rasio gaji terhadap usia
+    if 'Age' in data.columns and 'MonthlyIncome' in data.columns:
+        data['SalaryToAgeRatio'] = data['MonthlyIncome'] / data['Age']
+    
+    # Transformasi log jarak
+    if 'DistanceFromHome' in data.columns:
+        data['LogDistance'] = np.log1p(data['DistanceFromHome'])
+    
+    # Faktor risiko status pernikahan
+    if 'MaritalStatus' in data.columns:
+        data['MaritalRiskFactor'] = data['MaritalStatus'].map(MARITAL_RISK).fillna(0).astype(int)
+    
+    # Dampak jarak terhadap work-life balance
+    if 'DistanceFromHome' in data.columns and 'WorkLifeBalance' in data.columns:
+        data['DistanceWorkLifeImpact'] = data['DistanceFromHome'] / data['WorkLifeBalance'].clip(lower=1)
+    
+    # Kuadrat job involvement
+    data['JobInvolvementSq'] = data['JobInvolvement'] ** 2
+    
+    return data
+
+def create_engineered_features(employee_data):
+    """
+    Membuat fitur-fitur turunan untuk prediksi.
+    
+    Args:
+        employee_data: Dictionary berisi data input karyawan
+    
+    Returns:
+        dict: Dictionary berisi data karyawan dengan fitur tambahan
+    """
+    engineered = create_engineered_features_df(pd.DataFrame([employee_data]))
+    return engineered.to_dict('records')[0]
+
+# Kolom yang diharapkan oleh model (dari error)
+EXPECTED_COLUMNS = [
+    'Age', 'BusinessTravel', 'DailyRate', 'Department', 'DistanceFromHome',
+    'Education', 'EducationField', 'EmployeeCount', 'EnvironmentSatisfaction',
+    'Gender', 'HourlyRate', 'JobInvolvement', 'JobLevel', 'JobRole',
+    'JobSatisfaction', 'MaritalStatus', 'MonthlyIncome', 'MonthlyRate',
+    'NumCompaniesWorked', 'Over18', 'OverTime', 'PercentSalaryHike',
+    'PerformanceRating', 'RelationshipSatisfaction', 'StandardHours',
+    'StockOptionLevel', 'TotalWorkingYears', 'TrainingTimesLastYear',
+    'WorkLifeBalance', 'YearsAtCompany', 'YearsInCurrentRole',
+    'YearsSinceLastPromotion', 'YearsWithCurrManager', 'SalaryCategory',
+    'PromotionCategory', 'AgeGroup', 'DistanceCategory', 'SalaryPerLevel',
+    'SatisfactionIndex', 'SatisfactionVariance', 'PromotionRatio',
+    'YearsSincePromotionSq', 'OvertimeSatisfaction', 'SalaryToAgeRatio',
+    'LogDistance', 'MaritalRiskFactor', 'DistanceWorkLifeImpact',
+    'JobInvolvementSq', 'Attrition'
+]
+
+# Nilai default untuk kolom yang tidak diisi oleh pengguna
+COLUMN_DEFAULTS = {
+    'BusinessTravel': 'Travel_Rarely',
+    'Over18': 'Y',
+    'Attrition': 0,  # Default: tidak attrition
+    'EmployeeCount': 1,
+    'StandardHours': 1,
+    'JobInvolvement': 3,  # Nilai default: cukup terlibat
+    'JobInvolvementSq': 9,  # 3^2 = 9
+    'StockOptionLevel': 0,
+    'PerformanceRating': 3,  # Nilai default: baik
+    'PercentSalaryHike': 15,  # Nilai median umum
+    'HourlyRate': 65,  # Nilai rata-rata
+    'DailyRate': 800,  # Nilai rata-rata
+    'MonthlyRate': 14000,  # Nilai rata-rata
+    'TrainingTimesLastYear': 3,  # Nilai rata-rata
+}
+
+# Mapping cluster ke level risiko
+CLUSTER_MAPPING = {
+    0: {"level": "Risiko Sangat Rendah", "percentage": "2-5%", "color": "#2DC653", 
+        "description": "Karyawan memiliki risiko attrition sangat rendah. Keberlanjutan dan loyalitas karyawan sangat baik."},
+    1: {"level": "Risiko Rendah", "percentage": "5-10%", "color": "#5097ED", 
+        "description": "Karyawan memiliki risiko attrition rendah. Kepuasan kerja dan loyalitas masih terjaga dengan baik."},
+    2: {"level": "Risiko Tinggi", "percentage": "10-20%", "color": "#FF9F1C", 
+        "description": "Karyawan memiliki risiko attrition tinggi. Perhatikan faktor-faktor ketidakpuasan kerja."},
+    3: {"level": "Risiko Sangat Tinggi", "percentage": "20-30%", "color": "#E63946", 
+        "description": "Karyawan memiliki risiko attrition sangat tinggi. Intervensi segera diperlukan untuk mempertahankan karyawan."}
+}
+
+def _column_default(df, col):
+    """
+    Nilai default kolom col untuk karyawan yang tidak mengisinya.
+    
+    Returns:
+        Nilai skalar, atau Series (per karyawan) untuk kolom yang diturunkan dari YearsAtCompany
+    """
+    if col in COLUMN_DEFAULTS:
+        return COLUMN_DEFAULTS[col]
+    if col in ('YearsInCurrentRole', 'YearsWithCurrManager'):
+        # Jika ada YearsAtCompany, gunakan 2/3 (peran) atau 1/2 (manajer) dari itu, jika tidak, gunakan 2
+        if 'YearsAtCompany' in df.columns:
+            ratio = 2/3 if col == 'YearsInCurrentRole' else 1/2
+            return (df['YearsAtCompany'] * ratio).fillna(2).astype(int).clip(lower=1)
+        return 2
+    # Untuk kolom turunan lainnya, nilai default 0
+    return 0
+
+def fill_default_columns(df):
+    """
+    Melengkapi kolom yang diharapkan model dengan nilai default secara kolom-per-kolom.
+    
+    Sel kosong diisi dengan default yang sama seperti kolom yang tidak ada, sehingga
+    karyawan yang tidak mengisi sebuah kolom mendapat nilai yang sama, baik dinilai
+    sendirian maupun dalam satu DataFrame bersama karyawan yang mengisinya.
+    
+    Args:
+        df: DataFrame berisi data karyawan (sudah melalui feature engineering)
+    
+    Returns:
+        DataFrame: Salinan DataFrame yang memiliki semua EXPECTED_COLUMNS
+    """
+    data = df.copy()
+    
+    for col in EXPECTED_COLUMNS:
+        if col not in data.columns:
+            data[col] = _column_default(df, col)
+            continue
+        
+        # Nilai kosong (misalnya Attrition yang belum diketahui) diisi default
+        missing = data[col].isna()
+        if missing.any():
+            data[col] = data[col].where(~missing, _column_default(df, col))
+    
+    return data
+
+def normalize_cluster(cluster):
+    """
+    Memetakan label cluster dari model ke salah satu dari 4 level risiko.
+    
+    Args:
+        cluster: Label cluster hasil prediksi model
+    
+    Returns:
+        int: Cluster dalam rentang 0-3
+    """
+    return cluster if cluster in CLUSTER_MAPPING else cluster % 4
+
+def rule_based_risk_score(data):
+    """
+    Menghitung skor risiko berbasis aturan sebagai alternatif jika model tidak tersedia.
+    
+    Args:
+        data: Dictionary data satu karyawan atau DataFrame banyak karyawan
+    
+    Returns:
+        int atau Series: Skor risiko 0-115
+    """
+    def get(col, default):
+        if col not in data:
+            return default
+        # Sel kosong di DataFrame diperlakukan sama seperti kolom yang tidak diisi
+        value = data[col]
+        return value.fillna(default) if isinstance(value, pd.Series) else value
+    
+    job_level = get('JobLevel', 1)
+    
+    risk_score = (
+        # Overtime adalah faktor risiko besar
+        30 * (get('OverTime', 0) == 1)
+        # Kepuasan kerja rendah
+        + 20 * (get('JobSatisfaction', 4) <= 2)
+        # Gaji rendah dibandingkan level
+        + 15 * ((job_level > 0) & (get('MonthlyIncome', 0) / job_level < 3000))
+        # Jarak dari rumah jauh
+        + 10 * (get('DistanceFromHome', 0) > 15)
+        # Waktu sejak promosi terakhir lama
+        + 15 * (get('YearsSinceLastPromotion', 0) >= 5)
+        # Work-life balance buruk
+        + 15 * (get('WorkLifeBalance', 4) <= 2)
+        # Berstatus single
+        + 10 * (get('MaritalStatus', "") == "Single")
+    )
+    
+    return risk_score
+
+def risk_score_to_cluster(risk_score):
+    """
+    Menentukan cluster berdasarkan skor risiko berbasis aturan.
+    
+    Args:
+        risk_score: Skor risiko (int, array atau Series)
+    
+    Returns:
+        ndarray: Cluster 0-3 untuk setiap skor
+    """
+    return np.digitize(risk_score, [25, 50, 75])
+
+@contextmanager
+def timed_stage(on_stage, name):
+    """
+    Mengukur durasi satu tahap pipeline prediksi dan melaporkannya ke callback.
+    
+    Jika pengukuran scoring.timing aktif, durasinya juga dicatat sebagai tahap
+    'prediction.<name>' untuk halaman diagnostik.
+    
+    Args:
+        on_stage: Callable on_stage(name, seconds) atau None jika tidak perlu dilaporkan
+        name: Nama tahap, misalnya 'feature_engineering' atau 'prediction'
+    """
+    start = time.perf_counter()
+    yield
+    seconds = time.perf_counter() - start
+    record_timing(f'prediction.{name}', seconds)
+    if on_stage is not None:
+        on_stage(name, seconds)
+
+def _predict_engineered(employee_data, employee_df, model, preprocessor, on_stage=None, issues=None):
+    """
+    Menjalankan preprocessing dan prediksi untuk karyawan yang fiturnya sudah dibuat.
+    
+    Args:
+        employee_data: Dictionary berisi data karyawan beserta fitur turunannya
+        employee_df: DataFrame satu baris dengan kolom default yang sudah terisi
+        model: Model machine learning yang telah dilatih
+        preprocessor: Preprocessor untuk mempersiapkan data
+        on_stage: Callback opsional on_stage(name, seconds) per tahap
+        issues: List opsional penampung ScoringIssue
+    
+    Returns:
+        tuple: (cluster, risk_info) berisi hasil prediksi
+    """
+    logger.debug("Data sebelum preprocessing: %s", employee_df.columns.tolist())
+    
+    # Coba gunakan model jika ada
+    if model is not None and preprocessor is not None:
+        try:
+            # Preprocessing data
+            with timed_stage(on_stage, 'preprocessing'):
+                X_processed = preprocessor.transform(employee_df)
+            
+            # Prediksi
+            with timed_stage(on_stage, 'prediction'):
+                cluster = normalize_cluster(int(model.predict(X_processed)[0]))
+            
+            return cluster, CLUSTER_MAPPING[cluster]
+        
+        except Exception as e:
+            record_issue(issues, 'warning', 'model_fallback',
+                         f"Error saat menggunakan model: {e}. Menggunakan prediksi alternatif.")
+            # Lanjutkan ke metode alternatif
+    
+    # Metode alternatif (rules-based)
+    with timed_stage(on_stage, 'prediction'):
+        cluster = int(risk_score_to_cluster(rule_based_risk_score(employee_data)))
+    
+    return cluster, CLUSTER_MAPPING[cluster]
+
+def predict_attrition_risk(employee_data, model, preprocessor, on_stage=None, issues=None):
+    """
+    Memprediksi risiko attrition untuk seorang karyawan.
+    
+    Args:
+        employee_data: Dictionary berisi data input karyawan
+        model: Model machine learning yang telah dilatih
+        preprocessor: Preprocessor untuk mempersiapkan data
+        on_stage: Callback opsional on_stage(name, seconds) yang dipanggil setelah tahap
+            'feature_engineering', 'preprocessing', dan 'prediction' selesai
+        issues: List opsional penampung ScoringIssue; jika terjadi error, hasil default
+            dikembalikan dan masalahnya dicatat di sini
+    
+    Returns:
+        tuple: (cluster, risk_info) berisi hasil prediksi
+    """
+    try:
+        with timed_stage(on_stage, 'feature_engineering'):
+            # Buat fitur-fitur turunan
+            employee_data = create_engineered_features(employee_data)
+            
+            # Konversi ke DataFrame dan isi nilai default untuk kolom yang hilang
+            employee_df = fill_default_columns(pd.DataFrame([employee_data]))
+        
+        return _predict_engineered(employee_data, employee_df, model, preprocessor, on_stage, issues)
+    
+    except Exception as e:
+        # Detail error dicatat di log, tampilan memakai hasil default
+        record_issue(issues, 'error', 'prediction_failed', f"Error saat memprediksi risiko attrition: {e}")
+        return 1, {"level": "Risiko Rendah", "percentage": "5-10%", "color": "#5097ED", 
+                  "description": "Prediksi default karena terjadi error dalam pemrosesan."}
+
+def _model_rows(engineered):
+    # Kolom teks tanpa default yang kosong membuat preprocessor gagal saat karyawan dinilai
+    # sendirian, jadi baris tersebut juga tidak dinilai model di dalam batch
+    text_columns = [col for col in EXPECTED_COLUMNS
+                    if col in engineered.columns and col not in COLUMN_DEFAULTS
+                    and not pd.api.types.is_numeric_dtype(engineered[col])]
+    return engineered[text_columns].notna().all(axis=1).to_numpy()
+
+def _predict_rows(employee_df, model, preprocessor):
+    clusters = np.full(len(employee_df), -1)
+    for i in range(len(employee_df)):
+        try:
+            X_processed = preprocessor.transform(employee_df.iloc[[i]])
+            clusters[i] = int(model.predict(X_processed)[0]) % 4
+        except Exception:
+            pass
+    return clusters
+
+def predict_attrition_risk_batch(df, model, preprocessor, on_scored=None, issues=None):
+    """
+    Memprediksi risiko attrition untuk banyak karyawan sekaligus.
+    
+    Feature engineering dan pengisian default dilakukan per kolom, lalu model
+    dipanggil sekali (satu transform dan satu predict) untuk seluruh baris. Seperti
+    predict_attrition_risk, skor berbasis aturan dipakai untuk karyawan yang tidak dapat
+    dinilai model (misalnya kolom kategorikal tanpa default tidak diisi); jika predict
+    seluruh batch gagal, baris lain dinilai satu per satu agar hasilnya tidak bergantung
+    pada karyawan lain di batch. Faktor risiko hanya dinilai dari kolom yang diisi, bukan
+    dari nilai default.
+    
+    Args:
+        df: DataFrame berisi data input karyawan (satu baris per karyawan)
+        model: Model machine learning yang telah dilatih (boleh None)
+        preprocessor: Preprocessor untuk mempersiapkan data (boleh None)
+        on_scored: Callback opsional on_scored(employee_df, clusters, seconds) yang dipanggil
+            setelah model memprediksi (hanya dengan baris yang dinilai model), misalnya
+            ShadowScorer.submit untuk scoring bayangan
+        issues: List opsional penampung ScoringIssue jika model gagal dipakai
+    
+    Returns:
+        DataFrame: Data input ditambah kolom Cluster, RiskLevel dan RiskFactors
+    """
+    with stage('prediction.batch_feature_engineering'):
+        engineered = create_engineered_features_df(df)
+        employee_df = fill_default_columns(engineered)
+    
+    # -1: baris yang tidak dapat dinilai model
+    clusters = np.full(len(df), -1)
+    usable = _model_rows(engineered)
+    if model is not None and preprocessor is not None and usable.any():
+        start = time.perf_counter()
+        try:
+            with stage('prediction.batch_preprocessing'):
+                X_processed = preprocessor.transform(employee_df[usable])
+            with stage('prediction.batch_prediction'):
+                clusters[usable] = np.asarray(model.predict(X_processed)).astype(int) % 4
+        except Exception as e:
+            record_issue(issues, 'warning', 'model_fallback',
+                         f"Error saat menggunakan model: {e}. Menggunakan prediksi alternatif.")
+            if usable.sum() > 1:
+                # Baris lain tetap dinilai model, sama seperti saat dinilai sendirian
+                with stage('prediction.batch_row_fallback'):
+                    clusters[usable] = _predict_rows(employee_df[usable], model, preprocessor)
+        
+        scored = clusters >= 0
+        if on_scored is not None and scored.any():
+            on_scored(employee_df[scored], clusters[scored], time.perf_counter() - start)
+    
+    if model is not None and preprocessor is not None and not usable.all():
+        record_issue(issues, 'warning', 'model_fallback',
+                     "Kolom kategorikal tidak diisi untuk sebagian karyawan. Menggunakan prediksi alternatif.")
+    
+    if (clusters < 0).any():
+        # Metode alternatif (rules-based), dari kolom yang diisi seperti jalur satu karyawan
+        rule_clusters = np.broadcast_to(risk_score_to_cluster(rule_based_risk_score(engineered)), clusters.shape)
+        clusters = np.where(clusters >= 0, clusters, rule_clusters)
+    
+    result = df.copy()
+    result['Cluster'] = clusters
+    result['RiskLevel'] = pd.Series(clusters, index=df.index).map(
+        {cluster: info['level'] for cluster, info in CLUSTER_MAPPING.items()})
+    with stage('prediction.batch_risk_factors'):
+        result['RiskFactors'] = generate_risk_factors_batch(engineered)
+    
+    return result
+
+# Aturan faktor risiko: (faktor, deskripsi, skor_dampak, kolom_wajib, kondisi).
+# Kondisi berlaku untuk dictionary satu karyawan maupun DataFrame banyak karyawan.
+RISK_FACTOR_RULES = [
+    ("Overtime", "Karyawan bekerja lembur yang meningkatkan risiko attrition sebesar 2-3x", 90,
+     ['OverTime'], lambda d: d['OverTime'] == 1),
+    ("Kepuasan Kerja Rendah", 
+     "Kepuasan kerja rendah berkontribusi signifikan terhadap keinginan untuk berpindah", 85,
+     ['JobSatisfaction'], lambda d: d['JobSatisfaction'] <= 2),
+    ("Stagnansi Karir", 
+     "Tidak ada promosi dalam 5 tahun atau lebih dapat menyebabkan frustrasi", 70,
+     ['YearsSinceLastPromotion'], lambda d: d['YearsSinceLastPromotion'] >= 5),
+    ("Kompensasi", 
+     "Gaji di bawah rata-rata untuk level jabatan dapat mendorong karyawan mencari peluang lain", 65,
+     ['MonthlyIncome', 'JobLevel'], lambda d: d['MonthlyIncome'] < 3000 * d['JobLevel']),
+    ("Jarak dari Rumah", 
+     "Jarak tempuh yang jauh meningkatkan stres dan menurunkan work-life balance", 55,
+     ['DistanceFromHome'], lambda d: d['DistanceFromHome'] > 15),
+    ("Work-Life Balance", 
+     "Keseimbangan kerja-hidup yang buruk meningkatkan kelelahan dan ketidakpuasan", 75,
+     ['WorkLifeBalance'], lambda d: d['WorkLifeBalance'] <= 2),
+    ("Lingkungan Kerja", 
+     "Ketidakpuasan dengan lingkungan kerja berkontribusi pada keinginan untuk keluar", 60,
+     ['EnvironmentSatisfaction'], lambda d: d['EnvironmentSatisfaction'] <= 2),
+    ("Usia Muda", 
+     "Karyawan berusia muda cenderung lebih terbuka terhadap kesempatan karir baru", 50,
+     ['Age'], lambda d: d['Age'] < 30),
+    ("Status Lajang", 
+     "Karyawan lajang memiliki lebih sedikit tanggung jawab keluarga dan lebih fleksibel untuk pindah", 45,
+     ['MaritalStatus'], lambda d: d['MaritalStatus'] == 'Single'),
+    ("Masa Kerja Pendek", 
+     "Karyawan baru memiliki ikatan yang lebih rendah dengan perusahaan", 55,
+     ['YearsAtCompany'], lambda d: d['YearsAtCompany'] < 2),
+]
+
+def generate_risk_factors(employee_data):
+    """
+    Mengidentifikasi faktor-faktor risiko utama untuk attrition.
+    
+    Args:
+        employee_data: Dictionary berisi data input karyawan
+    
+    Returns:
+        list: List berisi tuple (faktor, deskripsi, skor_dampak)
+    """
+    risk_factors = []
+    
+    for factor, description, impact, required, condition in RISK_FACTOR_RULES:
+        if all(col in employee_data for col in required) and condition(employee_data):
+            risk_factors.append((factor, description, impact))
+    
+    return risk_factors
+
+def generate_risk_factors_batch(df, separator="; "):
+    """
+    Mengidentifikasi faktor-faktor risiko untuk banyak karyawan sekaligus.
+    
+    Args:
+        df: DataFrame berisi data karyawan
+        separator: Pemisah antar nama faktor risiko
+    
+    Returns:
+        Series: Nama faktor risiko per karyawan, digabung dengan separator
+    """
+    factors = pd.Series("", index=df.index, dtype=object)
+    
+    for factor, _, _, required, condition in RISK_FACTOR_RULES:
+        if not all(col in df.columns for col in required):
+            continue
+        
+        mask = np.asarray(condition(df), dtype=bool)
+        factors[mask] = factors[mask] + factor + separator
+    
+    return factors.str[:-len(separator)]
+
+def generate_recommendations(employee_data, risk_level):
+    """
+    Menghasilkan rekomendasi berdasarkan profil karyawan dan level risikonya.
+    
+    Args:
+        employee_data: Dictionary berisi data input karyawan
+        risk_level: String yang menunjukkan level risiko
+    
+    Returns:
+        list: List berisi rekomendasi
+    """
+    recommendations = []
+    
+    # Rekomendasi berdasarkan level risiko
+    if risk_level in ["Risiko Tinggi", "Risiko Sangat Tinggi"]:
+        # Masalah kepuasan kerja
+        if 'JobSatisfaction' in employee_data and employee_data['JobSatisfaction'] <= 2:
+            recommendations.append("Lakukan survei kepuasan kerja untuk mengidentifikasi sumber ketidakpuasan dan tindakan perbaikan.")
+        
+        # Overtime sering
+        if 'OverTime' in employee_data and employee_data['OverTime'] == 1:
+            recommendations.append("Evaluasi beban kerja dan pertimbangkan penambahan staf atau distribusi tugas yang lebih merata.")
+        
+        # Masalah gaji
+        if 'MonthlyIncome' in employee_data and 'JobLevel' in employee_data:
+            if employee_data['MonthlyIncome'] < 3000 * employee_data['JobLevel']:
+                recommendations.append("Lakukan survei pasar gaji dan sesuaikan kompensasi untuk mengurangi kesenjangan dengan pasar.")
+        
+        # Stagnansi karir
+        if 'YearsSinceLastPromotion' in employee_data and employee_data['YearsSinceLastPromotion'] >= 5:
+            recommendations.append("Diskusikan jalur karir, berikan pelatihan pengembangan, dan buat target promosi yang jelas.")
+        
+        # Work-life balance buruk
+        if 'WorkLifeBalance' in employee_data and employee_data['WorkLifeBalance'] <= 2:
+            recommendations.append("Terapkan kebijakan kerja fleksibel dan program kesehatan mental untuk meningkatkan work-life balance.")
+    
+    elif risk_level in ["Risiko Rendah", "Risiko Sangat Rendah"]:
+        recommendations.append("Karyawan memiliki risiko attrition rendah. Pertahankan kondisi kerja dan lingkungan saat ini.")
+        
+        if 'JobSatisfaction' in employee_data and employee_data['JobSatisfaction'] >= 3:
+            recommendations.append("Karyawan memiliki kepuasan kerja yang baik. Lanjutkan memberikan pengakuan dan apresiasi secara konsisten.")
+        
+        if 'YearsSinceLastPromotion' in employee_data and employee_data['YearsSinceLastPromotion'] <= 2:
+            recommendations.append("Karyawan memiliki jalur karir yang jelas. Terus berikan tantangan baru untuk menjaga motivasi.")
+    
+    # Rekomendasi umum jika list rekomendasi masih kosong
+    if not recommendations:
+        if risk_level in ["Risiko Tinggi", "Risiko Sangat Tinggi"]:
+            recommendations = [
+                "Lakukan wawancara stay untuk mengidentifikasi masalah yang mungkin dihadapi karyawan.",
+                "Pertimbangkan untuk memberikan proyek yang lebih menantang atau pelatihan baru.",
+                "Tinjau paket kompensasi dan benefit karyawan."
+            ]
+        else:
+            recommendations = [
+                "Pertahankan engagement karyawan dengan memberikan feedback positif.",
+                "Terus berikan kesempatan pengembangan karir.",
+                "Pastikan karyawan merasa dihargai kontribusinya."
+            ]
+    
+    return recommendations
+
+PREDICTION_CACHE_SIZE = 512
+
+class PredictionCache:
+    """
+    Cache LRU berukuran tetap untuk hasil analisis satu karyawan.
+    
+    Satu instance dipakai bersama oleh semua sesi dalam proses yang sama, sehingga akses
+    dilindungi lock. Penghitung hit/miss dipakai oleh panel diagnostik.
+    """
+    
+    def __init__(self, maxsize=PREDICTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self):
+        """
+        Returns:
+            dict: hits, misses, hit_rate, size, dan maxsize cache saat ini
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+prediction_cache = PredictionCache()
+
+class AnalysisResult(namedtuple('AnalysisResult', ['cluster', 'risk_info', 'risk_factors',
+                                                   'recommendations', 'issues'])):
+    """
+    Hasil analisis lengkap satu karyawan.
+    
+    Attributes:
+        cluster: Cluster risiko hasil prediksi
+        risk_info: Dictionary level, persentase, warna, dan deskripsi risiko
+        risk_factors: List tuple (faktor, deskripsi, skor_dampak)
+        recommendations: List rekomendasi
+        issues: Tuple ScoringIssue yang terjadi selama analisis
+    """
+    __slots__ = ()
+
+def _canonical_value(value):
+    """
+    Menyeragamkan nilai fitur agar 30, 30.0, dan np.int64(30) menghasilkan kunci yang sama.
+    """
+    if pd.isna(value):
+        return None
+    if isinstance(value, (bool, np.bool_, int, float, np.integer, np.floating)):
+        return float(value)
+    return str(value)
+
+def profile_cache_key(employee_df, model_version):
+    """
+    Membuat kunci cache dari vektor fitur karyawan yang sudah dinormalisasi.
+    
+    Args:
+        employee_df: DataFrame satu baris berisi fitur turunan dan kolom default
+        model_version: Versi model yang dipakai untuk prediksi
+    
+    Returns:
+        str: Hash SHA-256 dari vektor fitur kanonik dan versi model
+    """
+    row = employee_df.iloc[0]
+    features = [[col, _canonical_value(row[col])] for col in sorted(employee_df.columns)]
+    payload = json.dumps([model_version, features], separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def analyze_employee(employee_data, model, preprocessor, model_version=None, on_stage=None, cache=None):
+    """
+    Menjalankan prediksi, faktor risiko, dan rekomendasi untuk satu karyawan dengan cache.
+    
+    Profil yang vektor fiturnya sama (untuk versi model yang sama) langsung diambil dari
+    cache tanpa menjalankan preprocessor.transform maupun model.predict. Hasil yang memakai
+    prediksi alternatif karena model gagal tidak disimpan di cache.
+    
+    Args:
+        employee_data: Dictionary berisi data input karyawan
+        model: Model machine learning yang telah dilatih
+        preprocessor: Preprocessor untuk mempersiapkan data
+        model_version: Versi model, bagian dari kunci cache
+        on_stage: Callback opsional on_stage(name, seconds) per tahap
+        cache: PredictionCache yang dipakai, default prediction_cache
+    
+    Returns:
+        AnalysisResult: Hasil prediksi beserta masalah yang terjadi
+    """
+    cache = prediction_cache if cache is None else cache
+    issues = []
+    
+    try:
+        with timed_stage(on_stage, 'feature_engineering'):
+            engineered = create_engineered_features(employee_data)
+            employee_df = fill_default_columns(pd.DataFrame([engineered]))
+        
+        with timed_stage(on_stage, 'cache_lookup'):
+            key = profile_cache_key(employee_df, model_version)
+            result = cache.get(key)
+        
+        if result is not None:
+            return result
+        
+        cluster, risk_info = _predict_engineered(engineered, employee_df, model, preprocessor,
+                                                 on_stage, issues)
+    except Exception:
+        # Error dicatat oleh jalur tanpa cache, dan hasil default-nya tidak disimpan
+        key = None
+        cluster, risk_info = predict_attrition_risk(employee_data, model, preprocessor, on_stage, issues)
+    
+    with timed_stage(on_stage, 'risk_factors'):
+        risk_factors = generate_risk_factors(employee_data)
+    with timed_stage(on_stage, 'recommendations'):
+        recommendations = generate_recommendations(employee_data, risk_info["level"])
+    
+    result = AnalysisResult(cluster, risk_info, risk_factors, recommendations, tuple(issues))
+    # Hasil alternatif (model gagal dipakai) tidak disimpan, sehingga kegagalan sementara
+    # tidak terus dipakai untuk profil ini
+    if key is not None and not issues:
+        cache.put(key, result)
+    
+    return result
@@ -0,0 +1,381 @@
+import copy
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections import namedtuple
+
+import joblib
+
+from scoring.compiled import COMPILED_FILENAME
+
+DEFAULT_MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'model')
+MODEL_FILENAME = 'best_model.joblib'
+PREPROCESSOR_FILENAME = 'preprocessor.joblib'
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_FORMAT_VERSION = 1
+
+# Versi baru yang didaftarkan dari luar folder model disalin ke versions/<versi>/
+VERSIONS_DIRNAME = 'versions'
+
+class ModelVersion(namedtuple('ModelVersion', ['version', 'name', 'algorithm', 'files', 'sha256',
+                                               'feature_schema', 'metrics', 'created_at'])):
+    """
+    Satu versi model yang tercatat di manifest registry.
+    
+    Attributes:
+        version: 16 karakter pertama hash SHA-256 file model dan preprocessor
+        name: Nama model, misalnya 'RandomForest'
+        algorithm: Nama kelas model, misalnya 'RandomForestClassifier'
+        files: Dictionary path absolut 'model', 'preprocessor', dan 'compiled'
+        sha256: Dictionary hash SHA-256 lengkap file 'model' dan 'preprocessor'
+        feature_schema: Kolom input dan bentuk output model (lihat feature_schema)
+        metrics: Metrik evaluasi saat training
+        created_at: Waktu pendaftaran (ISO 8601, UTC)
+    """
+    __slots__ = ()
+
+def file_sha256(path):
+    """
+    Returns:
+        str: Hash SHA-256 isi file dalam heksadesimal
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def content_version(model_path, preprocessor_path):
+    """
+    Menghitung versi model dari isi file model dan preprocessor.
+    
+    Args:
+        model_path: Path file model joblib
+        preprocessor_path: Path file preprocessor joblib
+    
+    Returns:
+        str: 16 karakter pertama hash SHA-256 kedua file, atau 'rules' jika tidak ada
+    """
+    digest = hashlib.sha256()
+    found = False
+    
+    for path in (model_path, preprocessor_path):
+        if os.path.exists(path):
+            found = True
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        digest.update(b'\0')
+    
+    return digest.hexdigest()[:16] if found else 'rules'
+
+def feature_schema(model, preprocessor):
+    """
+    Mendeskripsikan input yang diharapkan preprocessor dan output model.
+    
+    Args:
+        model: Model klasifikasi sklearn yang sudah dilatih
+        preprocessor: ColumnTransformer yang sudah di-fit
+    
+    Returns:
+        dict: numeric (list kolom), categorical (kolom -> list kategori),
+        n_features (jumlah fitur setelah preprocessing), dan classes
+    """
+    numeric, categorical = [], {}
+    
+    for _, transformer, columns in getattr(preprocessor, 'transformers_', []):
+        if transformer in ('drop', 'passthrough'):
+            continue
+        if hasattr(transformer, 'categories_'):
+            for column, values in zip(columns, transformer.categories_):
+                categorical[column] = [value.item() if hasattr(value, 'item') else value for value in values]
+        else:
+            numeric.extend(columns)
+    
+    return {
+        'numeric': list(numeric),
+        'categorical': categorical,
+        'n_features': int(getattr(model, 'n_features_in_', 0)),
+        'classes': [int(value) for value in getattr(model, 'classes_', [])],
+    }
+
+class ModelRegistry:
+    """
+    Registry versi model berbasis file manifest.json di folder model.
+    
+    Manifest mencatat setiap versi (file, hash, skema fitur, dan metrik training) serta
+    versi yang sedang aktif. Tanpa manifest, registry memperlakukan best_model.joblib dan
+    preprocessor.joblib sebagai satu-satunya versi, sesuai susunan folder model lama.
+    
+    Manifest selalu ditulis ulang secara atomik, sehingga proses lain yang sedang
+    membacanya (misalnya LiveModel) hanya melihat isi lama atau isi baru.
+    """
+    
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR):
+        self.model_dir = os.path.abspath(model_dir)
+        self.manifest_path = os.path.join(self.model_dir, MANIFEST_FILENAME)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._manifest = None
+    
+    @property
+    def has_manifest(self):
+        return os.path.exists(self.manifest_path)
+    
+    def read_manifest(self):
+        """
+        Membaca manifest, memakai hasil sebelumnya selama file tidak berubah.
+        
+        Returns:
+            dict: Isi manifest (format_version, active, versions)
+        """
+        signature = self._file_signature()
+        
+        with self._lock:
+            if signature != self._signature:
+                if self.has_manifest:
+                    with open(self.manifest_path, encoding='utf-8') as f:
+                        manifest = json.load(f)
+                    if manifest.get('format_version') != MANIFEST_FORMAT_VERSION:
+                        raise ValueError(f"Format manifest {self.manifest_path} tidak didukung")
+                else:
+                    manifest = self._legacy_manifest()
+                self._signature, self._manifest = signature, manifest
+            return self._manifest
+    
+    def active_version(self):
+        """
+        Returns:
+            str: Versi aktif, atau None jika belum ada model
+        """
+        return self.read_manifest().get('active')
+    
+    def versions(self):
+        """
+        Returns:
+            list: Semua ModelVersion yang terdaftar, terurut dari yang terlama
+        """
+        entries = self.read_manifest()['versions']
+        return sorted((self._to_version(version, entry) for version, entry in entries.items()),
+                      key=lambda item: item.created_at or '')
+    
+    def get(self, version=None):
+        """
+        Mengambil satu versi model.
+        
+        Args:
+            version: Versi yang dicari; None untuk versi aktif
+        
+        Returns:
+            ModelVersion: Versi tersebut, atau None jika tidak terdaftar
+        """
+        manifest = self.read_manifest()
+        version = version or manifest.get('active')
+        entry = manifest['versions'].get(version) if version else None
+        return self._to_version(version, entry) if entry is not None else None
+    
+    def register(self, model_path, preprocessor_path, name=None, metrics=None, activate=False, copy_files=True):
+        """
+        Mendaftarkan pasangan file model dan preprocessor sebagai versi baru.
+        
+        File di luar folder model disalin ke versions/<versi>/ (kecuali copy_files=False);
+        file yang isinya sudah dipakai versi lain (misalnya preprocessor yang sama) tidak
+        disalin ulang. Model terkompilasi versi dengan file di luar folder model selalu
+        ditulis ke versions/<versi>/.
+        
+        Args:
+            model_path: Path file model joblib
+            preprocessor_path: Path file preprocessor joblib
+            name: Nama model; default nama kelas model
+            metrics: Dictionary metrik evaluasi saat training
+            activate: True untuk langsung menjadikannya versi aktif
+            copy_files: False untuk mencatat path file di luar folder model apa adanya
+                (relatif terhadap folder model) tanpa menyalinnya, misalnya file yang
+                sudah tersimpan di repository
+        
+        Returns:
+            ModelVersion: Versi yang didaftarkan
+        
+        Raises:
+            ValueError: Jika file tidak ada atau versi tersebut sudah terdaftar
+        """
+        for path in (model_path, preprocessor_path):
+            if not os.path.exists(path):
+                raise ValueError(f"File {path} tidak ditemukan")
+        
+        version = content_version(model_path, preprocessor_path)
+        if self.has_manifest:
+            manifest = copy.deepcopy(self.read_manifest())
+        else:
+            manifest = {'format_version': MANIFEST_FORMAT_VERSION, 'active': None, 'versions': {}}
+        if version in manifest['versions']:
+            raise ValueError(f"Versi {version} sudah terdaftar")
+        
+        model = joblib.load(model_path)
+        preprocessor = joblib.load(preprocessor_path)
+        hashes = {'model': file_sha256(model_path), 'preprocessor': file_sha256(preprocessor_path)}
+        
+        files = {
+            'model': self._store(model_path, hashes['model'], version, manifest, copy_files),
+            'preprocessor': self._store(preprocessor_path, hashes['preprocessor'], version, manifest, copy_files),
+        }
+        if files['model'].startswith('..'):
+            files['compiled'] = f'{VERSIONS_DIRNAME}/{version}/{COMPILED_FILENAME}'
+        manifest['versions'][version] = {
+            'name': name or type(model).__name__,
+            'algorithm': type(model).__name__,
+            'files': files,
+            'sha256': hashes,
+            'feature_schema': feature_schema(model, preprocessor),
+            'metrics': metrics or {},
+            'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        }
+        if activate or not manifest.get('active'):
+            manifest['active'] = version
+        
+        self._write_manifest(manifest)
+        return self.get(version)
+    
+    def activate(self, version):
+        """
+        Menjadikan sebuah versi sebagai versi aktif.
+        
+        Proses yang memakai LiveModel memuat versi ini di latar belakang lalu
+        menukarnya tanpa restart.
+        
+        Args:
+            version: Versi yang sudah terdaftar
+        
+        Raises:
+            ValueError: Jika versi tidak terdaftar atau file-nya tidak sesuai hash di manifest
+        """
+        manifest = copy.deepcopy(self.read_manifest())
+        if version not in manifest['versions']:
+            raise ValueError(f"Versi {version} tidak terdaftar")
+        
+        problems = self.verify(version)
+        if problems:
+            raise ValueError("; ".join(problems))
+        
+        manifest['active'] = version
+        self._write_manifest(manifest)
+    
+    def verify(self, version=None):
+        """
+        Memeriksa bahwa file sebuah versi masih ada dan isinya sesuai hash di manifest.
+        
+        Args:
+            version: Versi yang diperiksa; None untuk versi aktif
+        
+        Returns:
+            list: Pesan masalah, kosong jika semua file sesuai
+        """
+        entry = self.get(version)
+        if entry is None:
+            return [f"Versi {version or '(aktif)'} tidak terdaftar"]
+        
+        problems = []
+        for kind, expected in entry.sha256.items():
+            path = entry.files[kind]
+            if not os.path.exists(path):
+                problems.append(f"File {kind} {path} tidak ditemukan")
+            elif file_sha256(path) != expected:
+                problems.append(f"Isi file {kind} {path} tidak sesuai hash di manifest")
+        return problems
+    
+    def set_compiled(self, version, path):
+        """
+        Mencatat lokasi file model terkompilasi sebuah versi di manifest.
+        
+        Args:
+            version: Versi yang sudah terdaftar
+            path: Path file hasil save_compiled
+        """
+        if not self.has_manifest:
+            return
+        
+        manifest = copy.deepcopy(self.read_manifest())
+        manifest['versions'][version]['files']['compiled'] = self._relative(path)
+        self._write_manifest(manifest)
+    
+    def _file_signature(self):
+        paths = [self.manifest_path] if self.has_manifest else [
+            os.path.join(self.model_dir, MODEL_FILENAME), os.path.join(self.model_dir, PREPROCESSOR_FILENAME)
+        ]
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((path, None, None))
+        return tuple(signature)
+    
+    def _legacy_manifest(self):
+        version = content_version(os.path.join(self.model_dir, MODEL_FILENAME),
+                                  os.path.join(self.model_dir, PREPROCESSOR_FILENAME))
+        manifest = {'format_version': MANIFEST_FORMAT_VERSION, 'active': None, 'versions': {}}
+        
+        if version != 'rules':
+            manifest['active'] = version
+            manifest['versions'][version] = {
+                'name': 'best_model',
+                'files': {'model': MODEL_FILENAME, 'preprocessor': PREPROCESSOR_FILENAME,
+                          'compiled': COMPILED_FILENAME},
+            }
+        return manifest
+    
+    def _to_version(self, version, entry):
+        files = {kind: os.path.join(self.model_dir, *path.split('/')) for kind, path in entry['files'].items()}
+        files.setdefault('compiled', os.path.join(os.path.dirname(files['model']), COMPILED_FILENAME))
+        
+        return ModelVersion(version, entry.get('name', version), entry.get('algorithm'), files,
+                            entry.get('sha256', {}), entry.get('feature_schema', {}),
+                            entry.get('metrics', {}), entry.get('created_at'))
+    
+    def _relative(self, path):
+        return os.path.relpath(os.path.abspath(path), self.model_dir).replace(os.sep, '/')
+    
+    def _store(self, path, sha256, version, manifest, copy_files=True):
+        for entry in manifest['versions'].values():
+            for kind, existing in entry.get('sha256', {}).items():
+                if existing == sha256:
+                    return entry['files'][kind]
+        
+        relative = self._relative(path)
+        if not relative.startswith('..') or not copy_files:
+            return relative
+        
+        target_dir = os.path.join(self.model_dir, VERSIONS_DIRNAME, version)
+        os.makedirs(target_dir, exist_ok=True)
+        target = os.path.join(target_dir, os.path.basename(path))
+        shutil.copyfile(path, target)
+        return self._relative(target)
+    
+    def _write_manifest(self, manifest):
+        tmp_path = f"{self.manifest_path}.tmp-{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        os.replace(tmp_path, self.manifest_path)
+        
+        with self._lock:
+            self._signature = None
+
+# Satu registry per folder model per proses, agar cache manifest dipakai bersama
+_registries = {}
+_registries_lock = threading.Lock()
+
+def get_registry(model_dir=DEFAULT_MODEL_DIR):
+    """
+    Returns:
+        ModelRegistry: Registry untuk folder model tersebut (dibuat sekali per proses)
+    """
+    key = os.path.abspath(model_dir)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = ModelRegistry(key)
+        return _registries[key]
@@ -0,0 +1,258 @@
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from scoring.artifacts import load_artifacts
+from scoring.registry import DEFAULT_MODEL_DIR, get_registry
+
+logger = logging.getLogger(__name__)
+
+SHADOW_MAX_PENDING = 32
+SHADOW_NICENESS = 19
+LATENCY_WINDOW = 1000
+N_CLUSTERS = 4
+
+class _ModelStats:
+    """
+    Akumulator statistik satu model (champion atau challenger) terhadap satu champion.
+    """
+    
+    def __init__(self):
+        self.batches = 0
+        self.rows = 0
+        self.agreements = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+        self.confusion = np.zeros((N_CLUSTERS, N_CLUSTERS), dtype=np.int64)
+    
+    def add(self, rows, seconds, agreements=None, champion_clusters=None, clusters=None):
+        self.batches += 1
+        self.rows += rows
+        self.seconds += seconds
+        self.latencies.append(seconds)
+        if agreements is not None:
+            self.agreements += agreements
+            np.add.at(self.confusion, (champion_clusters, clusters), 1)
+    
+    def summary(self):
+        latencies = np.asarray(self.latencies) * 1000
+        return {
+            'batches': self.batches,
+            'rows': self.rows,
+            'errors': self.errors,
+            'latency_p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'latency_p95_ms': float(np.percentile(latencies, 95)) if len(latencies) else None,
+            'ms_per_1k_rows': self.seconds / self.rows * 1e6 if self.rows else None,
+        }
+
+def _init_shadow_worker():
+    # Proses bayangan hanya memakai CPU yang tidak dipakai proses champion
+    if hasattr(os, 'nice'):
+        os.nice(SHADOW_NICENESS)
+
+def _warm_shadow_worker(model_dir, versions):
+    for version in versions:
+        load_artifacts(model_dir, compiled=True, version=version)
+
+def _score_in_shadow_worker(model_dir, version, employee_df):
+    artifacts = load_artifacts(model_dir, compiled=True, version=version)
+    if not artifacts.available:
+        raise RuntimeError("; ".join(issue.message for issue in artifacts.issues))
+    
+    start = time.perf_counter()
+    clusters = np.asarray(artifacts.model.predict(artifacts.preprocessor.transform(employee_df))).astype(int)
+    return clusters % N_CLUSTERS, time.perf_counter() - start
+
+class ShadowScorer:
+    """
+    Scoring bayangan (champion/challenger) untuk semua versi model di registry.
+    
+    Setiap batch yang sudah dinilai champion diserahkan ke submit(); semua versi di
+    registry (challenger, ditambah champion sebagai pembanding) menilai batch yang sama
+    secara paralel di proses terpisah berprioritas rendah (nice 19), lalu tingkat
+    kesepakatan dengan champion dan latensi tiap model dicatat. Karena semua model diukur
+    di kondisi yang sama, latensinya dapat dibandingkan langsung.
+    
+    Latensi yang dirasakan pemanggil champion tidak bertambah: submit() tidak pernah
+    menunggu, proses bayangan tidak berbagi GIL dengan champion dan hanya mendapat CPU
+    yang menganggur, dan jika antrean penuh batch tersebut dilewati (dihitung sebagai
+    dropped). versions membatasi challenger yang dinilai (default semua versi terdaftar).
+    """
+    
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR, versions=None, max_workers=None,
+                 max_pending=SHADOW_MAX_PENDING):
+        self.model_dir = os.path.abspath(model_dir)
+        self.registry = get_registry(model_dir)
+        self.versions = set(versions) if versions is not None else None
+        self.max_workers = max_workers or max(len(self.registry.versions()), 1)
+        self.max_pending = max_pending
+        self.submitted = 0
+        self.dropped = 0
+        self._pending = 0
+        self._stats = {}
+        self._serving = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._executor = None
+    
+    def start(self):
+        """
+        Menyalakan proses bayangan dan memuat semua versi model di dalamnya lebih awal,
+        agar batch pertama tidak menunggu import dan pemuatan model.
+        """
+        versions = [entry.version for entry in self.registry.versions()]
+        with self._lock:
+            executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(_warm_shadow_worker, self.model_dir, versions)
+    
+    def shadow_versions(self, champion_version):
+        """
+        Returns:
+            list: Versi yang dinilai di proses bayangan: champion lalu para challenger
+        """
+        challengers = [entry.version for entry in self.registry.versions()
+                       if entry.version != champion_version
+                       and (self.versions is None or entry.version in self.versions)]
+        return [champion_version] + challengers if challengers else []
+    
+    def submit(self, champion_version, employee_df, champion_clusters, champion_seconds):
+        """
+        Menjadwalkan scoring bayangan untuk satu batch tanpa menunggu hasilnya.
+        
+        Args:
+            champion_version: Versi model yang menghasilkan prediksi resmi
+            employee_df: DataFrame fitur karyawan yang sudah diisi default (input preprocessor)
+            champion_clusters: Prediksi cluster champion untuk setiap baris
+            champion_seconds: Durasi transform + predict champion di jalur request
+        
+        Returns:
+            bool: False jika batch dilewati karena antrean penuh atau tidak ada challenger
+        """
+        versions = self.shadow_versions(champion_version)
+        champion_clusters = np.asarray(champion_clusters, dtype=np.int64)
+        
+        with self._lock:
+            if champion_version not in self._serving:
+                self._serving[champion_version] = _ModelStats()
+            self._serving[champion_version].add(len(employee_df), champion_seconds)
+            if not versions:
+                return False
+            if self._pending + len(versions) > self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending += len(versions)
+            self.submitted += 1
+            executor = self._get_executor()
+        
+        scheduled = 0
+        try:
+            for version in versions:
+                future = executor.submit(_score_in_shadow_worker, self.model_dir, version, employee_df)
+                future.add_done_callback(functools.partial(self._record, champion_version, version, champion_clusters))
+                scheduled += 1
+        except Exception as e:
+            # Kegagalan scoring bayangan (misalnya pool rusak) tidak boleh mengganggu champion;
+            # pool dibuat ulang pada batch berikutnya
+            logger.warning("Scoring bayangan dilewati: %s", e)
+            with self._idle:
+                self._pending -= len(versions) - scheduled
+                self.dropped += 1
+                if self._executor is executor:
+                    self._executor = None
+                self._idle.notify_all()
+            executor.shutdown(wait=False, cancel_futures=True)
+            return False
+        return True
+    
+    def drain(self, timeout=None):
+        """
+        Menunggu semua scoring bayangan yang sudah dijadwalkan selesai.
+        
+        Returns:
+            bool: True jika antrean kosong sebelum timeout
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+    
+    def close(self):
+        """
+        Membatalkan scoring bayangan yang belum berjalan dan menghentikan proses bayangan.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def report(self):
+        """
+        Ringkasan perbandingan champion dan challenger.
+        
+        Returns:
+            list: Satu dictionary per pasangan (champion, model) berisi nama model, metrik
+            training dari manifest, tingkat kesepakatan, confusion matrix terhadap champion
+            (baris = champion, kolom = model), latensi di proses bayangan, dan untuk
+            champion juga latensinya di jalur request (serving_*)
+        """
+        entries = {entry.version: entry for entry in self.registry.versions()}
+        
+        with self._lock:
+            rows = []
+            for (champion, version), stats in sorted(self._stats.items(),
+                                                      key=lambda item: (item[0][0], item[0][0] != item[0][1])):
+                entry = entries.get(version)
+                row = {
+                    'champion': champion,
+                    'version': version,
+                    'role': 'champion' if version == champion else 'challenger',
+                    'name': entry.name if entry is not None else version,
+                    'training_f1': entry.metrics.get('f1') if entry is not None else None,
+                    'agreement_rate': stats.agreements / stats.rows if stats.rows else None,
+                    'confusion': stats.confusion.tolist(),
+                }
+                row.update(stats.summary())
+                if version == champion and champion in self._serving:
+                    serving = self._serving[champion].summary()
+                    row.update({f'serving_{key}': serving[key]
+                                for key in ('latency_p50_ms', 'latency_p95_ms', 'ms_per_1k_rows')})
+                rows.append(row)
+            return rows
+    
+    def stats(self):
+        with self._lock:
+            return {'submitted': self.submitted, 'dropped': self.dropped, 'pending': self._pending}
+    
+    def _get_executor(self):
+        # Proses dibuat saat batch pertama, dengan 'spawn' agar aman di proses yang sudah punya thread
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                 initializer=_init_shadow_worker)
+        return self._executor
+    
+    def _record(self, champion_version, version, champion_clusters, future):
+        with self._idle:
+            key = (champion_version, version)
+            if key not in self._stats:
+                self._stats[key] = _ModelStats()
+            
+            if future.cancelled():
+                pass
+            elif future.exception() is not None:
+                logger.warning("Scoring bayangan versi %s gagal: %s", version, future.exception())
+                self._stats[key].errors += 1
+            else:
+                clusters, seconds = future.result()
+                self._stats[key].add(len(clusters), seconds, int((clusters == champion_clusters).sum()),
+                                     champion_clusters, clusters)
+            
+            self._pending -= 1
+            self._idle.notify_all()
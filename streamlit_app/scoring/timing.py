@@ -0,0 +1,160 @@
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+# Jumlah durasi terakhir yang disimpan per tahap untuk menghitung p50/p95
+TIMING_WINDOW = 1000
+
+# Pengukuran aktif untuk seluruh proses jika SCORING_TIMING=1 atau enable_timing() dipanggil,
+# atau hanya di dalam timing_scope (misalnya rerun sesi dashboard yang membuka halaman
+# diagnostik). Saat tidak aktif, stage() dan timed() hanya memeriksa dua flag, sehingga
+# overhead di jalur panas dapat diabaikan
+_enabled = os.environ.get('SCORING_TIMING') == '1'
+_scope_enabled = contextvars.ContextVar('scoring_timing', default=False)
+_samples = {}
+_counts = {}
+_samples_lock = threading.Lock()
+
+def enable_timing(enabled=True):
+    """
+    Mengaktifkan atau menonaktifkan pengukuran durasi per tahap untuk seluruh proses.
+    """
+    global _enabled
+    _enabled = enabled
+
+@contextlib.contextmanager
+def timing_scope(enabled=True):
+    """
+    Mengaktifkan pengukuran hanya untuk kode di dalam blok ini.
+    
+    Berbeda dengan enable_timing, pengaturan ini tidak berlaku untuk thread lain, sehingga
+    rerun sesi dashboard lain yang berjalan bersamaan tidak ikut terukur.
+    
+    Contoh:
+        with timing_scope(diagnostics_visible()):
+            main()
+    
+    Args:
+        enabled: False untuk menjalankan blok tanpa pengukuran tambahan
+    """
+    token = _scope_enabled.set(enabled)
+    try:
+        yield
+    finally:
+        _scope_enabled.reset(token)
+
+def timing_enabled():
+    return _enabled or _scope_enabled.get()
+
+def record_timing(name, seconds):
+    """
+    Mencatat durasi satu tahap (diabaikan jika pengukuran tidak aktif).
+    
+    Args:
+        name: Nama tahap, misalnya 'prediction.preprocessing'
+        seconds: Durasi dalam detik
+    """
+    if not (_enabled or _scope_enabled.get()):
+        return
+    with _samples_lock:
+        if name not in _samples:
+            _samples[name] = deque(maxlen=TIMING_WINDOW)
+        _samples[name].append(seconds)
+        _counts[name] = _counts.get(name, 0) + 1
+
+class _Stage:
+    __slots__ = ('name', 'start')
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        record_timing(self.name, time.perf_counter() - self.start)
+        return False
+
+class _NullStage:
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+def stage(name):
+    """
+    Context manager untuk mengukur durasi satu tahap, misalnya satu groupby.
+    
+    Contoh:
+        with stage('aggregations.build_cube'):
+            cube = values.groupby(dims).sum()
+    
+    Args:
+        name: Nama tahap
+    """
+    return _Stage(name) if _enabled or _scope_enabled.get() else _NULL_STAGE
+
+def timed(name=None):
+    """
+    Decorator untuk mengukur durasi setiap panggilan fungsi sebagai satu tahap.
+    
+    Args:
+        name: Nama tahap (default: modul.nama_fungsi)
+    """
+    def decorator(func):
+        stage_name = name or f"{func.__module__}.{func.__qualname__}"
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (_enabled or _scope_enabled.get()):
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record_timing(stage_name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+def timing_summary():
+    """
+    Ringkasan durasi per tahap dari TIMING_WINDOW pengukuran terakhir.
+    
+    Returns:
+        list: Satu dictionary per tahap (urut nama) berisi stage, calls (total panggilan),
+        p50_ms, p95_ms, max_ms, last_ms, dan total_ms (jumlah durasi di jendela pengukuran)
+    """
+    with _samples_lock:
+        snapshot = [(name, np.asarray(samples) * 1000, _counts[name]) for name, samples in _samples.items()]
+    
+    summary = []
+    for name, durations, calls in sorted(snapshot, key=lambda item: item[0]):
+        if not len(durations):
+            continue
+        summary.append({
+            'stage': name,
+            'calls': calls,
+            'p50_ms': float(np.percentile(durations, 50)),
+            'p95_ms': float(np.percentile(durations, 95)),
+            'max_ms': float(durations.max()),
+            'last_ms': float(durations[-1]),
+            'total_ms': float(durations.sum()),
+        })
+    return summary
+
+def reset_timings():
+    with _samples_lock:
+        _samples.clear()
+        _counts.clear()
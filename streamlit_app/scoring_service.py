@@ -0,0 +1,336 @@
+import argparse
+import asyncio
+import functools
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from scoring import CLUSTER_MAPPING, DEFAULT_MODEL_DIR, LiveModel, ShadowScorer, predict_attrition_risk_batch
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+MAX_BATCH_ROWS = 10_000
+MICRO_BATCH_SIZE = 64
+MICRO_BATCH_WAIT_MS = 5
+
+class RequestError(Exception):
+    """
+    Error pada request klien yang dikembalikan sebagai respons JSON dengan status tertentu.
+    """
+    
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def score_records(records, model, preprocessor, on_scored=None):
+    """
+    Melakukan scoring untuk sekumpulan karyawan dengan satu panggilan predict.
+    
+    Record digabung dalam satu DataFrame; kolom yang tidak diisi sebuah record menjadi NaN
+    dan diisi default per sel oleh fill_default_columns, sehingga hasil setiap karyawan sama
+    seperti saat di-scoring sendirian meskipun record mengisi kolom opsional yang berbeda.
+    
+    Args:
+        records: List dictionary data input karyawan
+        model: Model machine learning yang telah dilatih (boleh None)
+        preprocessor: Preprocessor untuk mempersiapkan data (boleh None)
+        on_scored: Callback opsional, diteruskan ke predict_attrition_risk_batch
+    
+    Returns:
+        list: Satu dictionary hasil per karyawan, urutannya sama dengan input
+    """
+    scored = predict_attrition_risk_batch(pd.DataFrame.from_records(records),
+                                          model, preprocessor, on_scored)
+    results = []
+    for cluster, factors in zip(scored['Cluster'].tolist(), scored['RiskFactors'].tolist()):
+        info = CLUSTER_MAPPING[int(cluster)]
+        results.append({
+            'cluster': int(cluster),
+            'risk_level': info['level'],
+            'attrition_percentage': info['percentage'],
+            'risk_factors': factors.split('; ') if factors else [],
+        })
+    return results
+
+class MicroBatcher:
+    """
+    Menggabungkan request scoring tunggal yang datang bersamaan menjadi satu panggilan predict.
+    
+    Request pertama yang masuk membuka sebuah batch; batch dikirim ketika sudah berisi
+    max_batch_size karyawan atau setelah max_wait_ms berlalu.
+    """
+    
+    def __init__(self, score_fn, max_batch_size=MICRO_BATCH_SIZE, max_wait_ms=MICRO_BATCH_WAIT_MS):
+        self.score_fn = score_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.requests = 0
+        self._queue = None
+        self._task = None
+    
+    def start(self):
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+    
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def submit(self, record):
+        """
+        Mengantrekan satu karyawan dan menunggu hasil scoring-nya.
+        
+        Args:
+            record: Dictionary data input karyawan
+        
+        Returns:
+            dict: Hasil scoring karyawan tersebut
+        """
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+    
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = await self._collect()
+            records = [record for record, _ in batch]
+            self.batches += 1
+            self.requests += len(batch)
+            
+            try:
+                outcomes = await loop.run_in_executor(None, self.score_fn, records)
+            except Exception:
+                # Satu data yang rusak tidak boleh menggagalkan request lain dalam batch yang sama
+                outcomes = await loop.run_in_executor(None, self._score_individually, records)
+            
+            for (_, future), outcome in zip(batch, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+    
+    def _score_individually(self, records):
+        outcomes = []
+        for record in records:
+            try:
+                outcomes.extend(self.score_fn([record]))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+    
+    def stats(self):
+        return {
+            'batches': self.batches,
+            'requests': self.requests,
+            'mean_batch_size': self.requests / self.batches if self.batches else 0.0,
+        }
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Tipe {type(value).__name__} tidak dapat dikonversi ke JSON")
+
+class ScoringService:
+    """
+    Aplikasi ASGI untuk scoring risiko attrition.
+    
+    Endpoint:
+        GET  /health        status layanan, versi model, dan statistik micro-batching
+        GET  /shadow        perbandingan champion/challenger (jika scoring bayangan aktif)
+        POST /score         scoring satu karyawan (objek JSON)
+        POST /score/batch   scoring banyak karyawan ({"employees": [...]} atau list JSON)
+    
+    Model mengikuti versi aktif di registry: versi baru dimuat di latar belakang dan
+    ditukar tanpa restart. Setiap batch memakai satu snapshot model yang sama.
+    
+    Dengan shadow=True setiap batch juga dinilai oleh semua versi lain di registry
+    (lihat scoring.ShadowScorer) di thread latar belakang, setelah respons champion siap.
+    """
+    
+    def __init__(self, model_dir=DEFAULT_MODEL_DIR, max_batch_size=MICRO_BATCH_SIZE, max_wait_ms=MICRO_BATCH_WAIT_MS,
+                 shadow=False):
+        self.model_dir = model_dir
+        self.live = LiveModel(model_dir, compiled=True)
+        self.shadow = ShadowScorer(model_dir) if shadow else None
+        self.batcher = MicroBatcher(self._score, max_batch_size, max_wait_ms)
+    
+    def load(self):
+        """
+        Menunggu pemuatan pertama model versi aktif selesai.
+        
+        Returns:
+            ModelArtifacts: Artefak versi aktif
+        """
+        return self.live.current()
+    
+    def _score(self, records):
+        artifacts = self.live.current()
+        on_scored = functools.partial(self.shadow.submit, artifacts.version) if self.shadow is not None else None
+        return score_records(records, artifacts.model, artifacts.preprocessor, on_scored)
+    
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, receive, send)
+    
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    await asyncio.get_running_loop().run_in_executor(None, self.load)
+                    if self.shadow is not None:
+                        self.shadow.start()
+                    self.batcher.start()
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.batcher.stop()
+                await asyncio.get_running_loop().run_in_executor(None, self.live.stop)
+                if self.shadow is not None:
+                    await asyncio.get_running_loop().run_in_executor(None, self.shadow.close)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    async def _http(self, scope, receive, send):
+        try:
+            status, payload = await self._route(scope, receive)
+        except RequestError as e:
+            status, payload = e.status, {'error': e.message}
+        except Exception as e:
+            status, payload = 500, {'error': f"Error saat melakukan scoring: {e}"}
+        
+        body = json.dumps(payload, default=_json_default).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'),
+                        (b'content-length', str(len(body)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+    
+    async def _route(self, scope, receive):
+        path = scope['path'].rstrip('/') or '/'
+        method = scope['method']
+        routes = {'/health': 'GET', '/shadow': 'GET', '/score': 'POST', '/score/batch': 'POST'}
+        
+        if path not in routes:
+            raise RequestError(404, f"Endpoint {path} tidak ditemukan")
+        if method != routes[path]:
+            raise RequestError(405, f"Metode {method} tidak didukung untuk {path}")
+        
+        if path == '/health':
+            artifacts = self.live.current(timeout=0)
+            if artifacts is None:
+                return 503, {'status': 'loading', 'model': self.live.stats()}
+            return 200, {'status': 'ok' if artifacts.available else 'degraded',
+                         'model_version': artifacts.version,
+                         'model': self.live.stats(),
+                         'issues': [issue._asdict() for issue in artifacts.issues],
+                         'micro_batching': self.batcher.stats()}
+        
+        if path == '/shadow':
+            if self.shadow is None:
+                raise RequestError(404, "Scoring bayangan tidak aktif; jalankan layanan dengan --shadow")
+            return 200, {'queue': self.shadow.stats(), 'models': self.shadow.report()}
+        
+        data = await self._read_json(receive)
+        
+        if path == '/score':
+            if not isinstance(data, dict):
+                raise RequestError(400, "Body harus berupa objek JSON berisi data satu karyawan")
+            try:
+                return 200, await self.batcher.submit(data)
+            except Exception as e:
+                raise RequestError(422, f"Data karyawan tidak dapat diproses: {e}")
+        
+        records = data.get('employees') if isinstance(data, dict) else data
+        if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+            raise RequestError(400, "Body harus berupa list objek karyawan atau {\"employees\": [...]}")
+        if len(records) > MAX_BATCH_ROWS:
+            raise RequestError(413, f"Maksimal {MAX_BATCH_ROWS:,} karyawan per request")
+        if not records:
+            return 200, {'results': []}
+        
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(None, self._score, records)
+        except Exception as e:
+            raise RequestError(422, f"Data karyawan tidak dapat diproses: {e}")
+        return 200, {'results': results}
+    
+    async def _read_json(self, receive):
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            chunk = message.get('body', b'')
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise RequestError(413, "Body request terlalu besar")
+            chunks.append(chunk)
+            if not message.get('more_body', False):
+                break
+        
+        try:
+            return json.loads(b''.join(chunks) or b'null')
+        except ValueError as e:
+            raise RequestError(400, f"Body bukan JSON yang valid: {e}")
+
+# Untuk 'uvicorn scoring_service:app', scoring bayangan diaktifkan dengan SCORING_SHADOW=1
+app = ScoringService(shadow=os.environ.get('SCORING_SHADOW') == '1')
+
+def main():
+    """
+    Menjalankan layanan scoring dengan uvicorn.
+    """
+    parser = argparse.ArgumentParser(description="Layanan HTTP untuk scoring risiko attrition karyawan.")
+    parser.add_argument('--host', default='127.0.0.1', help="Alamat host (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="Port (default: 8000)")
+    parser.add_argument('--shadow', action='store_true',
+                        help="Nilai setiap batch juga dengan semua versi model lain di registry")
+    args = parser.parse_args()
+    
+    try:
+        import uvicorn
+    except ImportError:
+        parser.error("uvicorn belum terpasang; jalankan 'pip install uvicorn' terlebih dahulu")
+    
+    uvicorn.run(ScoringService(shadow=True) if args.shadow else app, host=args.host, port=args.port)
+
+if __name__ == '__main__':
+    main()
@@ -146,23 +146,25 @@ def load_css():
             font-size: 1.5rem;
         }
         
-        /* Tabs styling */
-        .stTabs [data-baseweb="tab-list"] {
+        /* Navigasi halaman (radio bergaya tab) */
+        .st-key-active_page div[role="radiogroup"] {
             gap: 8px;
         }
         
-        .stTabs [data-baseweb="tab"] {
+        .st-key-active_page label[data-baseweb="radio"] {
             height: 50px;
-            white-space: pre-wrap;
+            margin: 0;
             background-color: rgba(58, 134, 255, 0.1);
             border-radius: 8px 8px 0px 0px;
-            gap: 1px;
-            padding-top: 10px;
-            padding-bottom: 10px;
+            padding: 10px 16px;
             font-weight: 500;
         }
         
-        .stTabs [aria-selected="true"] {
+        .st-key-active_page label[data-baseweb="radio"] > div:first-child {
+            display: none;
+        }
+        
+        .st-key-active_page label[data-baseweb="radio"]:has(input:checked) {
             background-color: var(--primary-color) !important;
             color: white !important;
         }
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Modul aplikasi diimpor langsung (flat), sama seperti saat dijalankan dari folder streamlit_app
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+DATA_DIR = os.path.join(os.path.dirname(APP_DIR), 'data')
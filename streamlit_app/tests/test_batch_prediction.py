@@ -0,0 +1,49 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from scoring import generate_risk_factors, load_artifacts, predict_attrition_risk, predict_attrition_risk_batch
+
+PARTIAL_RECORDS = [
+    {'OverTime': 1, 'MonthlyIncome': 9000, 'JobLevel': 2, 'JobSatisfaction': 3, 'DistanceFromHome': 5},
+    {'OverTime': 0, 'JobSatisfaction': 1, 'WorkLifeBalance': 2, 'MaritalStatus': 'Single'},
+    {'Age': 25, 'YearsAtCompany': 1, 'MonthlyIncome': 2500, 'JobLevel': 1},
+]
+
+def _factor_names(record):
+    return '; '.join(factor for factor, _, _ in generate_risk_factors(record))
+
+@pytest.mark.parametrize('record', PARTIAL_RECORDS)
+def test_batch_risk_factors_match_single_record(record):
+    scored = predict_attrition_risk_batch(pd.DataFrame([record]), None, None)
+    
+    assert scored['RiskFactors'].iloc[0] == _factor_names(record)
+
+@pytest.mark.parametrize('record', PARTIAL_RECORDS)
+def test_batch_rule_based_cluster_matches_single_record(record):
+    scored = predict_attrition_risk_batch(pd.DataFrame([record]), None, None)
+    cluster, _ = predict_attrition_risk(record, None, None)
+    
+    assert scored['Cluster'].iloc[0] == cluster
+
+def test_full_records_risk_factors_match_single_record():
+    df = pd.read_csv(os.path.join(DATA_DIR, 'employee_data.csv')).head(50).drop(columns=['Attrition'])
+    df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
+    scored = predict_attrition_risk_batch(df, None, None)
+    
+    assert scored['RiskFactors'].tolist() == [_factor_names(record) for record in df.to_dict('records')]
+
+def test_partial_batch_falls_back_to_rules_like_single_record():
+    # Department, EducationField, dll. tidak memiliki default, sehingga preprocessor gagal
+    artifacts = load_artifacts()
+    issues, single_issues = [], []
+    scored = predict_attrition_risk_batch(pd.DataFrame(PARTIAL_RECORDS), artifacts.model, artifacts.preprocessor,
+                                          issues=issues)
+    
+    expected = [predict_attrition_risk(record, artifacts.model, artifacts.preprocessor, issues=single_issues)[0]
+                for record in PARTIAL_RECORDS]
+    assert scored['Cluster'].tolist() == expected
+    assert [issue.code for issue in issues] == ['model_fallback']
+    assert {issue.code for issue in single_issues} == {'model_fallback'}
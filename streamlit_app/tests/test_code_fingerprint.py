@@ -0,0 +1,27 @@
+from training import segmentation
+from training.cache import code_fingerprint
+from training.pipeline import STAGES
+
+def _stage_fingerprints():
+    return {stage.name: code_fingerprint(stage.func) for stage in STAGES}
+
+def test_fingerprint_is_stable():
+    assert _stage_fingerprints() == _stage_fingerprints()
+
+def test_clustering_only_change_keeps_earlier_stages(monkeypatch):
+    before = _stage_fingerprints()
+    monkeypatch.setitem(segmentation.CLUSTERERS, 'HDBSCAN', lambda: segmentation.HDBSCAN(min_cluster_size=12))
+    after = _stage_fingerprints()
+    
+    changed = [name for name in before if before[name] != after[name]]
+    assert changed == ['clustering']
+
+def test_helper_change_invalidates_dependent_stages(monkeypatch):
+    before = _stage_fingerprints()
+    fit_before = code_fingerprint(segmentation.fit_transformer)
+    monkeypatch.setitem(segmentation.TRANSFORMERS, 'RobustScaler', lambda: segmentation.RobustScaler(unit_variance=True))
+    after = _stage_fingerprints()
+    
+    changed = [name for name in before if before[name] != after[name]]
+    assert changed == ['transform', 'selection']
+    assert code_fingerprint(segmentation.fit_transformer) != fit_before
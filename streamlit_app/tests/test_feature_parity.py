@@ -0,0 +1,51 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from scoring import create_engineered_features, create_engineered_features_df
+
+ENGINEERED_COLUMNS = [
+    'SalaryCategory', 'PromotionCategory', 'AgeGroup', 'DistanceCategory', 'SalaryPerLevel',
+    'SatisfactionIndex', 'SatisfactionVariance', 'PromotionRatio', 'YearsSincePromotionSq',
+    'OvertimeSatisfaction', 'SalaryToAgeRatio', 'LogDistance', 'MaritalRiskFactor',
+    'DistanceWorkLifeImpact', 'JobInvolvementSq',
+]
+
+# Di data latih fitur rasio ini dipotong pada kuantil 1% dan 99% seluruh data, sedangkan
+# scoring tidak memotongnya; nilainya hanya sama setelah dipotong ke rentang data latih
+WINSORIZED_COLUMNS = ['SalaryPerLevel', 'SalaryToAgeRatio', 'DistanceWorkLifeImpact']
+
+@pytest.fixture(scope='module')
+def reference():
+    return pd.read_csv(os.path.join(DATA_DIR, 'optimal_risk_segmentation_result.csv'))
+
+@pytest.fixture(scope='module')
+def raw_input(reference):
+    return reference.drop(columns=ENGINEERED_COLUMNS + ['Cluster', 'RiskLevel'])
+
+def _assert_matches_reference(engineered, reference):
+    for col in ENGINEERED_COLUMNS:
+        expected = reference[col]
+        actual = engineered[col]
+        if expected.dtype == object:
+            assert (actual.to_numpy() == expected.to_numpy()).all(), col
+            continue
+        actual = actual.to_numpy(dtype=float)
+        if col in WINSORIZED_COLUMNS:
+            actual = np.clip(actual, expected.min(), expected.max())
+        np.testing.assert_allclose(actual, expected.to_numpy(dtype=float), rtol=1e-9, err_msg=col)
+
+def test_dataframe_path_matches_csv(raw_input, reference):
+    _assert_matches_reference(create_engineered_features_df(raw_input), reference)
+
+def test_dict_path_matches_csv(raw_input, reference):
+    engineered = pd.DataFrame([create_engineered_features(record) for record in raw_input.to_dict('records')])
+    _assert_matches_reference(engineered, reference)
+
+def test_winsorized_columns_differ_only_on_clipped_rows(raw_input, reference):
+    engineered = create_engineered_features_df(raw_input)
+    differing = {col: int((~np.isclose(engineered[col], reference[col])).sum()) for col in WINSORIZED_COLUMNS}
+    assert differing == {'SalaryPerLevel': 22, 'SalaryToAgeRatio': 22, 'DistanceWorkLifeImpact': 9}
@@ -0,0 +1,30 @@
+import os
+
+import pandas as pd
+
+from conftest import DATA_DIR
+from scoring import PredictionCache, analyze_employee, load_artifacts
+
+class FailingModel:
+    def predict(self, X):
+        raise RuntimeError("model tidak tersedia")
+
+def _record():
+    df = pd.read_csv(os.path.join(DATA_DIR, 'employee_data.csv')).head(1)
+    record = df.drop(columns=['Attrition', 'EmployeeId']).to_dict('records')[0]
+    record['OverTime'] = 1 if record['OverTime'] == 'Yes' else 0
+    return record
+
+def test_fallback_result_is_not_cached():
+    artifacts = load_artifacts()
+    cache = PredictionCache()
+    
+    fallback = analyze_employee(_record(), FailingModel(), artifacts.preprocessor, 'test', cache=cache)
+    assert [issue.code for issue in fallback.issues] == ['model_fallback']
+    assert cache.stats()['size'] == 0
+    
+    # Setelah model pulih, profil yang sama dinilai model, bukan hasil alternatif dari cache
+    result = analyze_employee(_record(), artifacts.model, artifacts.preprocessor, 'test', cache=cache)
+    assert result.issues == ()
+    assert cache.stats()['size'] == 1
+    assert analyze_employee(_record(), artifacts.model, artifacts.preprocessor, 'test', cache=cache) is result
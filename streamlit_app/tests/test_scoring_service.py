@@ -0,0 +1,57 @@
+import os
+
+import pandas as pd
+import pytest
+
+from conftest import DATA_DIR
+from scoring import load_artifacts
+from scoring_service import score_records
+
+# Kolom numerik yang dihapus dari sebagian record agar satu batch berisi record dengan kolom
+# berbeda (kolom kategorikal yang kosong tidak dapat diproses preprocessor)
+OPTIONAL_FIELDS = ['JobInvolvement', 'YearsInCurrentRole', 'YearsWithCurrManager', 'StockOptionLevel',
+                   'WorkLifeBalance', 'TrainingTimesLastYear']
+
+def _records(n=60):
+    df = pd.read_csv(os.path.join(DATA_DIR, 'employee_data.csv')).head(n)
+    df = df.drop(columns=['Attrition', 'EmployeeId'])
+    records = []
+    for i, record in enumerate(df.to_dict('records')):
+        # Setiap record kehilangan kombinasi kolom opsional yang berbeda
+        records.append({key: value for key, value in record.items()
+                        if key not in OPTIONAL_FIELDS[:i % (len(OPTIONAL_FIELDS) + 1)]})
+    return records
+
+@pytest.mark.parametrize('use_model', [True, False], ids=['model', 'rule_based'])
+def test_record_scores_same_alone_and_in_mixed_batch(use_model):
+    artifacts = load_artifacts()
+    model, preprocessor = (artifacts.model, artifacts.preprocessor) if use_model else (None, None)
+    records = _records()
+    
+    batched = score_records(records, model, preprocessor)
+    alone = [score_records([record], model, preprocessor)[0] for record in records]
+    assert batched == alone
+
+class CountingModel:
+    def __init__(self, model):
+        self.model = model
+        self.calls = 0
+    
+    def predict(self, X):
+        self.calls += 1
+        return self.model.predict(X)
+
+def test_mixed_records_use_one_predict_call():
+    artifacts = load_artifacts()
+    model = CountingModel(artifacts.model)
+    score_records(_records(), model, artifacts.preprocessor)
+    assert model.calls == 1
+
+def test_record_without_categorical_column_does_not_affect_others():
+    artifacts = load_artifacts()
+    records = _records(10)
+    records[3] = {key: value for key, value in records[3].items() if key != 'Department'}
+    
+    batched = score_records(records, artifacts.model, artifacts.preprocessor)
+    alone = [score_records([record], artifacts.model, artifacts.preprocessor)[0] for record in records]
+    assert batched == alone
@@ -0,0 +1,84 @@
+"""
+Menjalankan pipeline training (pengganti menjalankan ulang notebook.ipynb) dan menulis
+artefaknya: data_final_employee.csv, optimal_risk_segmentation_result.csv,
+<nama>_model.joblib, best_model.joblib, preprocessor.joblib, dan training_report.json.
+
+Hasil setiap tahap (clean, features, transform, selection, reduction, clustering,
+classification) disimpan di cache; run berikutnya hanya menghitung ulang tahap yang
+parameter, kode, atau datanya berubah beserta tahap-tahap sesudahnya.
+
+Parameter tahap dapat diganti lewat --params berupa JSON (teks atau path file), misalnya
+'{"classification": {"models": ["RandomForest", "ExtraTrees"]}}'.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python train_pipeline.py
+    python train_pipeline.py --params '{"selection": {"max_features": 10}}'
+    python train_pipeline.py --until clustering
+    python train_pipeline.py --until selection --params '{"selection": {"transformers": ["StandardScaler", "QuantileTransformer"]}}'
+    python train_pipeline.py --params '{"classification": {"models": ["RandomForest", "GradientBoosting"]}}'
+    python train_pipeline.py --params '{"classification": {"search": false}}'
+    python train_pipeline.py --force classification --register --activate
+"""
+import argparse
+import json
+import logging
+import os
+
+from scoring import DEFAULT_MODEL_DIR
+from training import DEFAULT_OUTPUT_DIR, DEFAULT_SOURCE, STAGES, export_artifacts, register_models, run_pipeline
+
+logger = logging.getLogger('train_pipeline')
+
+STAGE_NAMES = [stage.name for stage in STAGES]
+
+def load_params(value):
+    """
+    Returns:
+        dict: Isi JSON dari teks atau file --params (kosong jika tidak diberikan)
+    """
+    if not value:
+        return {}
+    if os.path.exists(value):
+        with open(value, encoding='utf-8') as f:
+            return json.load(f)
+    return json.loads(value)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--source', default=DEFAULT_SOURCE, help="CSV data karyawan mentah (default: %(default)s)")
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help="Folder artefak (default: %(default)s)")
+    parser.add_argument('--cache-dir', help="Folder cache tahap (default: <output-dir>/.cache)")
+    parser.add_argument('--params', help="Parameter tahap dalam JSON (teks atau path file)")
+    parser.add_argument('--force', nargs='+', default=[], choices=STAGE_NAMES + ['all'], metavar='TAHAP',
+                        help="Tahap yang dihitung ulang walaupun ada di cache ('all' untuk semua)")
+    parser.add_argument('--until', choices=STAGE_NAMES, help="Berhenti setelah tahap ini")
+    parser.add_argument('--n-jobs', type=int, default=-1,
+                        help="Proses paralel pencarian segmentasi dan hyperparameter (default: semua core)")
+    parser.add_argument('--register', action='store_true',
+                        help="Mendaftarkan model terbaik ke registry model aplikasi")
+    parser.add_argument('--activate', action='store_true', help="Jadikan versi yang didaftarkan aktif")
+    parser.add_argument('--model-dir', default=DEFAULT_MODEL_DIR, help="Folder registry model (default: %(default)s)")
+    parser.add_argument('--verbose', action='store_true', help="Tampilkan log detail setiap kandidat")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    logging.captureWarnings(True)
+    if (args.register or args.activate) and args.until and args.until != STAGE_NAMES[-1]:
+        parser.error("--register/--activate membutuhkan tahap classification (tanpa --until)")
+    
+    force = STAGE_NAMES if 'all' in args.force else args.force
+    try:
+        result = run_pipeline(args.source, args.cache_dir or os.path.join(args.output_dir, '.cache'),
+                              load_params(args.params), force=force, until=args.until, n_jobs=args.n_jobs)
+        paths = export_artifacts(result, args.output_dir)
+        logger.info("Dihitung: %s; dari cache: %s", ', '.join(result.computed) or '-', ', '.join(result.cached) or '-')
+        logger.info("Artefak ditulis ke %s", os.path.abspath(args.output_dir))
+        if args.register or args.activate:
+            register_models(result, paths, args.model_dir, activate=args.activate)
+    except Exception:
+        logger.exception("Pipeline training gagal")
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
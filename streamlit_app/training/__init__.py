@@ -0,0 +1,21 @@
+"""
+Pipeline training offline yang diekstrak dari notebook.ipynb.
+
+Setiap tahap (cleaning, feature engineering, transformasi, seleksi fitur, reduksi
+dimensi, clustering, dan klasifikasi) menyimpan hasilnya di cache disk dengan kunci
+hash isi input, parameter, dan kode tahap tersebut, sehingga menjalankan ulang pipeline
+hanya menghitung ulang tahap yang berubah beserta tahap-tahap sesudahnya.
+Dijalankan lewat train_pipeline.py.
+
+Segmentasi hasil pipeline dapat diperbarui setiap ada snapshot data karyawan baru tanpa
+clustering ulang (training.incremental, dijalankan lewat update_segmentation.py).
+"""
+from training.cache import StageCache, stage_key
+from training.incremental import (
+    SEGMENTATION_STATE_FILE, create_segmentation_state, load_segmentation_state, save_segmentation_state,
+    update_segmentation,
+)
+from training.pipeline import (
+    DEFAULT_CACHE_DIR, DEFAULT_OUTPUT_DIR, DEFAULT_PARAMS, DEFAULT_SOURCE, STAGES,
+    PipelineResult, Stage, export_artifacts, register_models, resolve_params, run_pipeline,
+)
@@ -0,0 +1,175 @@
+import hashlib
+import inspect
+import json
+import logging
+import os
+
+import joblib
+
+logger = logging.getLogger(__name__)
+
+# Jumlah entri cache terbaru yang disimpan per tahap; entri lama dihapus otomatis
+CACHE_KEEP_ENTRIES = 3
+
+def _is_training_code(value):
+    module = getattr(value, '__module__', None) or ''
+    return (inspect.isfunction(value) or inspect.isclass(value)) and module.split('.')[0] == 'training'
+
+def _referenced_names(code):
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _referenced_names(const)
+    return names
+
+def _describe(value, parts, seen):
+    """
+    Deskripsi stabil sebuah nilai global. Fungsi dan kelas training.* diwakili namanya dan
+    kode sumbernya ikut dikumpulkan ke parts; konstanta diwakili nilainya.
+    """
+    if _is_training_code(value):
+        _collect(value, parts, seen)
+        return f'{value.__module__}.{value.__qualname__}'
+    if inspect.ismodule(value):
+        return value.__name__
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{getattr(value, "__module__", None)}.{value.__qualname__}'
+    if isinstance(value, dict):
+        items = ', '.join(f'{_describe(k, parts, seen)}: {_describe(v, parts, seen)}' for k, v in value.items())
+        return f'{{{items}}}'
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}({', '.join(_describe(v, parts, seen) for v in value)})"
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({', '.join(sorted(_describe(v, parts, seen) for v in value))})"
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    # Objek lain (logger, lock, dsb.) tidak memengaruhi hasil tahap
+    return type(value).__qualname__
+
+def _collect(obj, parts, seen):
+    """
+    Mengumpulkan kode sumber fungsi/kelas training.* beserta fungsi, kelas, dan konstanta
+    global yang dipakainya (rekursif, termasuk lintas modul training.*).
+    """
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+    parts.add(f'{obj.__module__}.{obj.__qualname__}\n{inspect.getsource(obj)}')
+    if inspect.isclass(obj):
+        for base in obj.__bases__:
+            _describe(base, parts, seen)
+        for attr in vars(obj).values():
+            for func in (getattr(attr, '__func__', attr), getattr(attr, 'fget', None), getattr(attr, 'fset', None)):
+                if inspect.isfunction(func):
+                    _collect(func, parts, seen)
+        return
+    
+    names = _referenced_names(obj.__code__)
+    for name in sorted(names):
+        if name not in obj.__globals__:
+            continue
+        value = obj.__globals__[name]
+        if inspect.ismodule(value) and value.__name__.split('.')[0] == 'training':
+            # Atribut modul (mis. segmentation.silhouette) ikut tercatat di co_names
+            for attr in sorted(names):
+                if hasattr(value, attr):
+                    parts.add(f'{obj.__module__}:{name}.{attr}={_describe(getattr(value, attr), parts, seen)}')
+        else:
+            parts.add(f'{obj.__module__}:{name}={_describe(value, parts, seen)}')
+    for cell in obj.__closure__ or ():
+        parts.add(f'{obj.__module__}.{obj.__qualname__}:closure={_describe(cell.cell_contents, parts, seen)}')
+
+def code_fingerprint(func):
+    """
+    Hash kode sumber fungsi beserta fungsi, kelas, dan konstanta global yang dipakainya,
+    secara rekursif termasuk yang berada di modul training.* lain.
+    
+    Hanya kode yang benar-benar dijangkau fungsi yang di-hash, sehingga perubahan fungsi
+    pembantu (termasuk di modul lain seperti training.models) membuat tahap dihitung
+    ulang, sedangkan perubahan kode tahap lain di modul yang sama tidak.
+    
+    Returns:
+        str: Hash SHA-256 heksadesimal
+    """
+    parts = set()
+    _collect(func, parts, set())
+    digest = hashlib.sha256()
+    for part in sorted(parts):
+        digest.update(part.encode('utf-8'))
+    return digest.hexdigest()
+
+def stage_key(name, code, params, upstream_keys, environment=None):
+    """
+    Menghitung kunci cache satu tahap dari semua hal yang memengaruhi hasilnya.
+    
+    Args:
+        name: Nama tahap
+        code: Fingerprint kode tahap (lihat code_fingerprint)
+        params: Parameter tahap (harus dapat diserialisasi ke JSON)
+        upstream_keys: Kunci tahap-tahap input, berurutan
+        environment: Versi library yang memengaruhi hasil
+    
+    Returns:
+        str: 16 karakter pertama hash SHA-256
+    """
+    payload = json.dumps({
+        'stage': name,
+        'code': code,
+        'params': params,
+        'inputs': list(upstream_keys),
+        'environment': environment,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+class StageCache:
+    """
+    Cache hasil tahap pipeline di disk: <cache_dir>/<tahap>/<kunci>.joblib.
+    
+    File ditulis ke file sementara lalu dipindahkan secara atomik, sehingga proses yang
+    terhenti di tengah jalan tidak meninggalkan entri cache yang rusak.
+    """
+    
+    def __init__(self, cache_dir, keep=CACHE_KEEP_ENTRIES):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.keep = keep
+    
+    def path(self, stage, key):
+        return os.path.join(self.cache_dir, stage, f'{key}.joblib')
+    
+    def contains(self, stage, key):
+        return os.path.exists(self.path(stage, key))
+    
+    def load(self, stage, key):
+        """
+        Returns:
+            tuple: (True, hasil) jika entri ada dan dapat dibaca, selain itu (False, None)
+        """
+        path = self.path(stage, key)
+        if not os.path.exists(path):
+            return False, None
+        try:
+            return True, joblib.load(path)
+        except Exception as e:
+            logger.warning("Cache tahap %s (%s) tidak dapat dibaca, dihitung ulang: %s", stage, key, e)
+            return False, None
+    
+    def save(self, stage, key, value):
+        path = self.path(stage, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        joblib.dump(value, tmp_path)
+        os.replace(tmp_path, path)
+        self.prune(stage)
+    
+    def prune(self, stage):
+        """
+        Menghapus entri cache tahap tersebut selain self.keep entri terbaru.
+        """
+        directory = os.path.join(self.cache_dir, stage)
+        entries = sorted((entry for entry in os.scandir(directory) if entry.name.endswith('.joblib')),
+                         key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for entry in entries[self.keep:]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
@@ -0,0 +1,170 @@
+import logging
+
+from sklearn.compose import ColumnTransformer
+from sklearn.metrics import accuracy_score, confusion_matrix, f1_score, precision_score, recall_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from training.models import MODEL_NAMES, create_model
+from training.search import MEMORIZATION_ACCURACY, tune_models
+
+logger = logging.getLogger(__name__)
+
+TARGET_COLUMN = 'Cluster'
+NON_FEATURE_COLUMNS = ['Cluster', 'EmployeeId', 'RiskLevel', 'is_outlier']
+
+def split_features(data, test_size=0.3, random_state=42):
+    """
+    Memisahkan fitur dan target dari data hasil segmentasi lalu membaginya menjadi train/test.
+    
+    Args:
+        data: DataFrame hasil segmentasi (berisi kolom Cluster)
+        test_size: Proporsi data test
+        random_state: Seed pembagian data
+    
+    Returns:
+        tuple: (X_train, X_test, y_train, y_test, fitur numerik, fitur kategorikal)
+    """
+    X = data.drop(columns=[c for c in NON_FEATURE_COLUMNS if c in data.columns])
+    y = data[TARGET_COLUMN]
+    numeric_features = X.select_dtypes(include=['int64', 'float64']).columns.tolist()
+    categorical_features = X.select_dtypes(include=['object']).columns.tolist()
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=random_state)
+    return X_train, X_test, y_train, y_test, numeric_features, categorical_features
+
+def preprocess_data(X_train, X_test, numeric_features, categorical_features):
+    """
+    Returns:
+        tuple: (X_train hasil preprocessing, X_test hasil preprocessing, preprocessor yang sudah di-fit)
+    """
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ('num', StandardScaler(), numeric_features),
+            ('cat', OneHotEncoder(handle_unknown='ignore'), categorical_features)
+        ])
+    
+    X_train_processed = preprocessor.fit_transform(X_train)
+    X_test_processed = preprocessor.transform(X_test)
+    return X_train_processed, X_test_processed, preprocessor
+
+def detect_overfitting(train_accuracy, test_accuracy, threshold=0.05):
+    """
+    Returns:
+        tuple: (overfitting atau tidak, skor overfitting 0-1)
+    """
+    if train_accuracy >= MEMORIZATION_ACCURACY:
+        return True, 1.0
+    
+    diff = train_accuracy - test_accuracy
+    return diff > threshold, min(1.0, diff / 0.2)
+
+def evaluate_model_with_overfitting_check(model, X_train, X_test, y_train, y_test, model_name="Model"):
+    """
+    Melatih model lalu menghitung metrik test dan skor overfitting.
+    
+    F1 model yang mencapai akurasi training 100% diberi penalti (f1 * (1 - skor overfitting)),
+    sehingga model tersebut tidak terpilih sebagai model terbaik.
+    
+    Returns:
+        dict: train_accuracy, accuracy, precision, recall, f1 (weighted), is_overfitting,
+        overfitting_score, penalized_f1, confusion_matrix, dan model
+    """
+    model.fit(X_train, y_train)
+    
+    train_accuracy = accuracy_score(y_train, model.predict(X_train))
+    y_test_pred = model.predict(X_test)
+    test_accuracy = accuracy_score(y_test, y_test_pred)
+    f1 = f1_score(y_test, y_test_pred, average='weighted')
+    is_overfitting, overfitting_score = detect_overfitting(train_accuracy, test_accuracy)
+    
+    penalized_f1 = f1
+    if is_overfitting:
+        logger.warning("%s menunjukkan tanda overfitting (skor %.4f, selisih train-test %.4f)",
+                       model_name, overfitting_score, train_accuracy - test_accuracy)
+        if train_accuracy >= MEMORIZATION_ACCURACY:
+            penalized_f1 = f1 * (1 - overfitting_score)
+    
+    metrics = {
+        'train_accuracy': train_accuracy,
+        'accuracy': test_accuracy,
+        'precision': precision_score(y_test, y_test_pred, average='weighted'),
+        'recall': recall_score(y_test, y_test_pred, average='weighted'),
+        'f1': f1,
+        'is_overfitting': bool(is_overfitting),
+        'overfitting_score': overfitting_score,
+        'penalized_f1': penalized_f1,
+        'confusion_matrix': confusion_matrix(y_test, y_test_pred),
+        'model': model,
+    }
+    logger.info("%s: train acc %.4f, test acc %.4f, precision %.4f, recall %.4f, F1 %.4f",
+                model_name, train_accuracy, test_accuracy, metrics['precision'], metrics['recall'], f1)
+    return metrics
+
+def registry_metrics(metrics, evaluation):
+    """
+    Mengubah hasil evaluate_model_with_overfitting_check ke format metrik manifest registry
+    (sama seperti model_registry.evaluate_holdout).
+    """
+    result = {key: round(float(metrics[key]), 4)
+              for key in ('train_accuracy', 'accuracy', 'precision', 'recall', 'f1', 'penalized_f1')}
+    result['evaluation'] = evaluation
+    return result
+
+def classification_stage(clustering, models, test_size=0.3, random_state=42, search=True, cv=5, factor=3,
+                         scoring='f1_weighted', grids=None, n_jobs=-1, memory=None):
+    """
+    Tahap klasifikasi: mencari hyperparameter, melatih model yang memprediksi cluster risiko
+    dari data karyawan, dan memilih model terbaik berdasarkan F1 dengan penalti overfitting.
+    
+    Pencarian hyperparameter (lihat training.search) hanya memakai data training; data test
+    tetap dipakai hanya untuk evaluasi akhir.
+    
+    Args:
+        clustering: Hasil clustering_stage
+        models: Nama model dari training.models.MODEL_NAMES yang dilatih
+        test_size: Proporsi data test
+        random_state: Seed pembagian data dan model
+        search: False untuk memakai parameter default model (seperti notebook)
+        cv: Jumlah fold CV pencarian
+        factor: Faktor successive halving
+        scoring: Scorer sklearn untuk pencarian
+        grids: Ruang pencarian yang mengganti SEARCH_SPACES per model
+        n_jobs: Jumlah proses paralel
+        memory: joblib.Memory untuk hasil CV per fold
+    
+    Returns:
+        dict: preprocessor, models (nama -> model), metrics (nama -> metrik format registry),
+        confusion_matrices, best_model (nama), dan search (nama -> hasil pencarian)
+    """
+    unknown = [name for name in models if name not in MODEL_NAMES]
+    if unknown:
+        raise ValueError(f"Model tidak dikenal: {', '.join(unknown)} (pilihan: {', '.join(MODEL_NAMES)})")
+    
+    X_train, X_test, y_train, y_test, numeric_features, categorical_features = split_features(
+        clustering['data'], test_size, random_state)
+    X_train_processed, X_test_processed, preprocessor = preprocess_data(
+        X_train, X_test, numeric_features, categorical_features)
+    
+    tuned = {}
+    if search:
+        tuned = tune_models(X_train_processed, y_train, models, memory, cv, factor, scoring, grids,
+                            random_state, n_jobs)
+    
+    evaluation = f"train_test_split(test_size={test_size}, random_state={random_state}), {len(X_test)} baris test"
+    results = {}
+    for name in models:
+        params = tuned[name]['best_params'] if name in tuned else None
+        results[name] = evaluate_model_with_overfitting_check(create_model(name, random_state, n_jobs, params),
+                                                              X_train_processed, X_test_processed,
+                                                              y_train, y_test, name)
+    best = max(results, key=lambda name: results[name]['penalized_f1'])
+    logger.info("Model terbaik: %s (F1 %.4f, F1 dengan penalti %.4f)",
+                best, results[best]['f1'], results[best]['penalized_f1'])
+    return {
+        'preprocessor': preprocessor,
+        'models': {name: result['model'] for name, result in results.items()},
+        'metrics': {name: registry_metrics(result, evaluation) for name, result in results.items()},
+        'confusion_matrices': {name: result['confusion_matrix'] for name, result in results.items()},
+        'best_model': best,
+        'search': tuned,
+    }
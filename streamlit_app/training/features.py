@@ -0,0 +1,200 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Kolom numerik yang bukan fitur segmentasi (target, ID, dan kolom konstan)
+NON_FEATURE_COLUMNS = ['Attrition', 'EmployeeId', 'EmployeeCount', 'StandardHours', 'Cluster']
+
+SATISFACTION_COLUMNS = ['JobSatisfaction', 'EnvironmentSatisfaction', 'WorkLifeBalance', 'RelationshipSatisfaction']
+
+MARITAL_RISK = {'Single': 2, 'Divorced': 1, 'Married': 0}
+
+def salary_category(income):
+    if income < 5000:
+        return 'Rendah (< 5000)'
+    elif income < 10000:
+        return 'Sedang (5000-10000)'
+    elif income < 15000:
+        return 'Tinggi (10000-15000)'
+    else:
+        return 'Sangat Tinggi (>15000)'
+
+def promotion_category(years):
+    if years == 0:
+        return 'Baru Dipromosikan'
+    elif years <= 2:
+        return '1-2 Tahun'
+    elif years <= 5:
+        return '3-5 Tahun'
+    else:
+        return '> 5 Tahun'
+
+def age_category(age):
+    if age < 30:
+        return '< 30'
+    elif age < 40:
+        return '30-39'
+    elif age < 50:
+        return '40-49'
+    else:
+        return '50+'
+
+def clean_stage(source, required_columns=None):
+    """
+    Tahap cleaning: membaca data mentah, menghapus baris dengan missing value, dan
+    menambahkan kolom kategori (isi data_final_employee.csv di notebook).
+    
+    Args:
+        source: Path CSV data karyawan mentah (employee_data.csv)
+        required_columns: Kolom yang wajib terisi (None: semua kolom, seperti notebook)
+    
+    Returns:
+        DataFrame: Data bersih beserta SalaryCategory, PromotionCategory, AgeGroup,
+        dan DistanceCategory
+    """
+    df = pd.read_csv(source)
+    rows = len(df)
+    df = df.dropna(subset=required_columns).reset_index(drop=True)
+    logger.info("Cleaning: %d dari %d baris dipakai setelah menghapus missing value", len(df), rows)
+    
+    df['SalaryCategory'] = df['MonthlyIncome'].apply(salary_category)
+    df['PromotionCategory'] = df['YearsSinceLastPromotion'].apply(promotion_category)
+    df['AgeGroup'] = df['Age'].apply(age_category)
+    # Disimpan sebagai object (bukan category) agar tipe kolomnya sama dengan saat
+    # data dibaca ulang dari CSV dan tetap dianggap fitur kategorikal oleh preprocessor
+    df['DistanceCategory'] = pd.cut(
+        df['DistanceFromHome'],
+        bins=[0, 5, 10, 20, 30],
+        labels=['0-5 km', '6-10 km', '11-20 km', '21-30 km']
+    ).astype(object)
+    return df
+
+def _clip_quantiles(series, lower=0.01, upper=0.99):
+    return series.clip(lower=series.quantile(lower), upper=series.quantile(upper))
+
+def engineer_features(df):
+    """
+    Feature engineering untuk segmentasi, sama seperti notebook (fitur rasio di-clip
+    pada kuantil 1% dan 99%).
+    
+    Args:
+        df: DataFrame hasil clean_stage
+    
+    Returns:
+        tuple: (DataFrame dengan fitur baru, daftar fitur numerik asli, daftar fitur hasil
+        engineering)
+    """
+    df = df.copy()
+    if df['Attrition'].dtype == 'object':
+        df['Attrition'] = df['Attrition'].map({'Yes': 1, 'No': 0})
+    elif df['Attrition'].max() > 1:
+        df['Attrition'] = (df['Attrition'] > 0).astype(int)
+    
+    numerical_features = [col for col in df.select_dtypes(include=['int64', 'float64']).columns
+                          if col not in NON_FEATURE_COLUMNS]
+    
+    df['SalaryPerLevel'] = _clip_quantiles(df['MonthlyIncome'] / df['JobLevel'].replace(0, 1))
+    df['SatisfactionIndex'] = df[SATISFACTION_COLUMNS].mean(axis=1)
+    df['SatisfactionVariance'] = df[SATISFACTION_COLUMNS].var(axis=1)
+    
+    promotion_ratio = df['YearsSinceLastPromotion'] / df['YearsAtCompany'].replace(0, 1)
+    df['PromotionRatio'] = promotion_ratio.clip(lower=0, upper=promotion_ratio.quantile(0.99))
+    df['YearsSincePromotionSq'] = np.square(df['YearsSinceLastPromotion'])
+    
+    if df['OverTime'].dtype == 'object':
+        df['OverTime'] = df['OverTime'].map({'Yes': 1, 'No': 0})
+    df['OvertimeSatisfaction'] = (5 - df['JobSatisfaction']) * df['OverTime']
+    
+    df['SalaryToAgeRatio'] = _clip_quantiles(df['MonthlyIncome'] / df['Age'])
+    df['LogDistance'] = np.log1p(df['DistanceFromHome'])
+    if df['MaritalStatus'].isin(MARITAL_RISK.keys()).all():
+        df['MaritalRiskFactor'] = df['MaritalStatus'].map(MARITAL_RISK)
+    df['DistanceWorkLifeImpact'] = _clip_quantiles(df['DistanceFromHome'] / df['WorkLifeBalance'])
+    df['JobInvolvementSq'] = np.square(df['JobInvolvement'])
+    
+    # OverTime ikut terhitung sebagai fitur engineering karena baru menjadi numerik di sini
+    engineered_features = [col for col in df.columns
+                           if col not in numerical_features and col not in NON_FEATURE_COLUMNS
+                           and df[col].dtype != 'object']
+    return df, numerical_features, engineered_features
+
+def iqr_bounds(df, features):
+    """
+    Returns:
+        tuple: (batas bawah, batas atas) 1.5 x IQR per kolom features, berupa Series
+    """
+    q1 = df[features].quantile(0.25)
+    q3 = df[features].quantile(0.75)
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+def handle_infinite_values(df, features, bounds=None):
+    """
+    Mengganti nilai tak terhingga/NaN (median jika skewness > 1, selain itu mean) lalu
+    memotong nilai ekstrem pada batas 1.5 x IQR.
+    
+    Batas IQR dihitung dari data sebelum penggantian, sama seperti di notebook.
+    
+    Args:
+        df: DataFrame sumber
+        features: Daftar kolom yang dibersihkan
+        bounds: Batas dari iqr_bounds data lain, misalnya data training saat menambahkan
+            karyawan baru (None: dihitung dari df)
+    
+    Returns:
+        DataFrame: Salinan df dengan kolom features yang sudah dibersihkan
+    """
+    df_clean = df.copy()
+    lower_bounds, upper_bounds = bounds if bounds is not None else iqr_bounds(df_clean, features)
+    
+    values = df_clean[features]
+    if np.isinf(values.values).any() or values.isna().any().any():
+        for col in features:
+            df_clean[col] = df_clean[col].replace([np.inf, -np.inf], np.nan)
+            if not df_clean[col].isna().any():
+                continue
+            if df_clean[col].notna().any():
+                fill_value = df_clean[col].median() if df_clean[col].skew() > 1 else df_clean[col].mean()
+                logger.info("Kolom '%s': nilai tak terhingga/NaN diganti dengan %s", col, fill_value)
+                df_clean[col] = df_clean[col].fillna(fill_value)
+            else:
+                logger.warning("Semua nilai di kolom '%s' tidak valid, diganti dengan 0", col)
+                df_clean[col] = 0
+    
+    for col in features:
+        if not pd.api.types.is_numeric_dtype(df_clean[col]):
+            continue
+        lower, upper = lower_bounds[col], upper_bounds[col]
+        outliers = int(((df_clean[col] < lower) | (df_clean[col] > upper)).sum())
+        if outliers:
+            logger.debug("Kolom '%s': %d outlier dipotong ke batas IQR", col, outliers)
+            df_clean[col] = df_clean[col].clip(lower=lower, upper=upper)
+    return df_clean
+
+def feature_stage(clean):
+    """
+    Tahap feature engineering.
+    
+    Args:
+        clean: DataFrame hasil clean_stage
+    
+    Returns:
+        dict: data (DataFrame dengan fitur baru), features (semua fitur segmentasi),
+        numerical_features, engineered_features, X (fitur setelah handle_infinite_values),
+        dan y (Attrition)
+    """
+    data, numerical_features, engineered_features = engineer_features(clean)
+    features = numerical_features + engineered_features
+    logger.info("Feature engineering: %d fitur numerik asli + %d fitur baru",
+                len(numerical_features), len(engineered_features))
+    return {
+        'data': data,
+        'features': features,
+        'numerical_features': numerical_features,
+        'engineered_features': engineered_features,
+        'X': handle_infinite_values(data[features], features),
+        'y': data['Attrition'],
+    }
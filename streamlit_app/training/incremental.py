@@ -0,0 +1,186 @@
+import copy
+import datetime
+import logging
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+
+from scoring import CLUSTER_MAPPING
+from training.features import clean_stage, engineer_features, handle_infinite_values, iqr_bounds
+
+logger = logging.getLogger(__name__)
+
+SEGMENTATION_STATE_FILE = 'segmentation_state.joblib'
+
+# Kolom identitas karyawan untuk mencocokkan snapshot dengan state sebelumnya
+ID_COLUMN = 'EmployeeId'
+
+# Kolom yang tidak ikut menentukan apakah data karyawan berubah (Attrition baru diketahui
+# setelah karyawan keluar dan tidak dipakai segmentasi)
+UNHASHED_COLUMNS = ['Attrition']
+
+def row_hashes(df):
+    """
+    Returns:
+        Series: Hash isi setiap baris (tanpa UNHASHED_COLUMNS), untuk mendeteksi karyawan
+        yang datanya berubah
+    """
+    columns = sorted(col for col in df.columns if col not in UNHASHED_COLUMNS)
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+def _reduce(state, X):
+    X_transformed = state['transformer'].transform(X)
+    return state['reducer'].transform(X_transformed[:, state['selected_indices']])
+
+def create_segmentation_state(outputs, batch_size=1024, random_state=42):
+    """
+    Membuat state segmentasi inkremental dari hasil pipeline training.
+    
+    Transformasi, seleksi fitur, dan reduksi dimensi hasil pipeline dibekukan. Cluster hasil
+    tahap clustering diwakili centroid-nya di ruang hasil reduksi dan menjadi inisialisasi
+    MiniBatchKMeans, sehingga indeks centroid sama dengan nomor Cluster (urut risiko).
+    partial_fit tidak pernah mengubah urutan centroid, jadi pemetaan Cluster -> RiskLevel
+    tetap sama di setiap update.
+    
+    Args:
+        outputs: PipelineResult.outputs yang berisi tahap features sampai clustering
+        batch_size: batch_size MiniBatchKMeans
+        random_state: Seed MiniBatchKMeans
+    
+    Returns:
+        dict: State untuk update_segmentation
+    
+    Raises:
+        ValueError: Jika reduksi dimensi terpilih tidak dapat mentransformasi data baru
+    """
+    features, reduction, clustering = outputs['features'], outputs['reduction'], outputs['clustering']
+    if not hasattr(reduction['reducer'], 'transform'):
+        raise ValueError(f"Reduksi dimensi {reduction['name']} tidak mendukung transform data baru")
+    
+    data = clustering['data']
+    clusters = data['Cluster'].to_numpy()
+    X_reduced = reduction['X']
+    centroids = np.vstack([X_reduced[clusters == cluster].mean(axis=0) for cluster in sorted(CLUSTER_MAPPING)])
+    model = MiniBatchKMeans(n_clusters=len(centroids), init=centroids, n_init=1, batch_size=batch_size,
+                            random_state=random_state)
+    model.partial_fit(X_reduced)
+    
+    all_features = features['features']
+    return {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'clustering_method': clustering['name'],
+        'features': all_features,
+        'bounds': iqr_bounds(features['data'], all_features),
+        'transformer': outputs['selection']['transformer'],
+        'selected_indices': [all_features.index(f) for f in outputs['selection']['features']],
+        'reducer': reduction['reducer'],
+        'model': model,
+        'assignments': pd.DataFrame({
+            ID_COLUMN: data[ID_COLUMN].to_numpy(),
+            'RowHash': row_hashes(outputs['clean']),
+            'Cluster': clusters,
+        }),
+        'updates': [],
+    }
+
+def update_segmentation(state, source, max_centroid_shift=0.25):
+    """
+    Menyerap snapshot data karyawan terbaru tanpa clustering ulang.
+    
+    Karyawan yang datanya tidak berubah sejak update sebelumnya mempertahankan Cluster-nya.
+    Hanya karyawan baru atau yang datanya berubah yang ditransformasi, ditambahkan ke
+    MiniBatchKMeans dengan partial_fit, lalu ditempatkan di Cluster dengan centroid
+    terdekat. Karyawan yang tidak ada lagi di snapshot dihapus dari state. Attrition boleh
+    kosong (karyawan baru).
+    
+    Feature engineering tetap dijalankan pada seluruh snapshot karena batas clipping fitur
+    rasio dihitung dari kuantil data; batas IQR memakai nilai dari data training.
+    
+    Args:
+        state: State dari create_segmentation_state atau update sebelumnya (tidak diubah)
+        source: Path CSV snapshot lengkap data karyawan
+        max_centroid_shift: Pergeseran centroid (jarak di ruang hasil reduksi) di atas nilai
+            ini dicatat sebagai peringatan
+    
+    Returns:
+        tuple: (DataFrame hasil segmentasi dengan format optimal_risk_segmentation_result.csv,
+        state baru, ringkasan update)
+    
+    Raises:
+        ValueError: Jika snapshot tidak memiliki EmployeeId yang unik
+    """
+    state = copy.deepcopy(state)
+    features = state['features']
+    required_columns = [col for col in pd.read_csv(source, nrows=0).columns if col not in UNHASHED_COLUMNS]
+    clean = clean_stage(source, required_columns=required_columns)
+    if ID_COLUMN not in clean.columns or clean[ID_COLUMN].duplicated().any():
+        raise ValueError(f"Snapshot harus memiliki kolom {ID_COLUMN} yang unik")
+    
+    data, _, _ = engineer_features(clean)
+    previous = state['assignments'].set_index(ID_COLUMN)
+    hashes = row_hashes(clean)
+    is_new = ~data[ID_COLUMN].isin(previous.index).to_numpy()
+    known = previous.loc[data.loc[~is_new, ID_COLUMN]]
+    clusters = np.zeros(len(data), dtype=int)
+    clusters[~is_new] = known['Cluster'].to_numpy()
+    changed = is_new.copy()
+    changed[~is_new] = known['RowHash'].to_numpy() != hashes[~is_new]
+    
+    centroids = state['model'].cluster_centers_.copy()
+    if changed.any():
+        X = handle_infinite_values(data.loc[changed, features], features, state['bounds'])
+        X_reduced = _reduce(state, X)
+        state['model'].partial_fit(X_reduced)
+        clusters[changed] = state['model'].predict(X_reduced)
+    
+    data['Cluster'] = clusters
+    data['RiskLevel'] = data['Cluster'].map({cluster: info['level'] for cluster, info in CLUSTER_MAPPING.items()})
+    state['assignments'] = pd.DataFrame({ID_COLUMN: data[ID_COLUMN].to_numpy(), 'RowHash': hashes,
+                                         'Cluster': data['Cluster'].to_numpy()})
+    
+    shifts = np.linalg.norm(state['model'].cluster_centers_ - centroids, axis=1)
+    rates = data.groupby('Cluster')['Attrition'].mean()
+    summary = {
+        'updated': datetime.datetime.now().isoformat(timespec='seconds'),
+        'source': os.path.abspath(source),
+        'employees': len(data),
+        'new': int(is_new.sum()),
+        'changed': int((changed & ~is_new).sum()),
+        'unchanged': int((~changed).sum()),
+        'removed': int((~previous.index.isin(data[ID_COLUMN])).sum()),
+        'centroid_shift': [round(float(shift), 4) for shift in shifts],
+        'attrition_rate': {int(cluster): round(float(rate), 4) for cluster, rate in rates.dropna().items()},
+    }
+    state['updates'].append(summary)
+    
+    logger.info("Update segmentasi: %d karyawan (%d baru, %d berubah, %d tetap, %d keluar)", summary['employees'],
+                summary['new'], summary['changed'], summary['unchanged'], summary['removed'])
+    for cluster, count in data['Cluster'].value_counts().sort_index().items():
+        logger.info("  Cluster %d (%s): %d karyawan, attrition %s", cluster, CLUSTER_MAPPING[cluster]['level'],
+                    count, f"{rates[cluster] * 100:.2f}%" if pd.notna(rates.get(cluster)) else '-')
+    if shifts.max() > max_centroid_shift:
+        logger.warning("Centroid bergeser hingga %.3f sejak update sebelumnya; pertimbangkan training ulang",
+                       shifts.max())
+    if not rates.dropna().is_monotonic_increasing:
+        logger.warning("Urutan attrition antar cluster tidak lagi sesuai level risiko; jalankan train_pipeline.py "
+                       "untuk segmentasi ulang")
+    return data, state, summary
+
+def load_segmentation_state(path):
+    """
+    Returns:
+        dict: State segmentasi yang disimpan dengan save_segmentation_state
+    """
+    return joblib.load(path)
+
+def save_segmentation_state(state, path):
+    """
+    Menyimpan state segmentasi (ditulis ke file sementara lalu dipindahkan secara atomik).
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.tmp'
+    joblib.dump(state, tmp_path)
+    os.replace(tmp_path, path)
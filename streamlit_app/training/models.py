@@ -0,0 +1,108 @@
+from sklearn.ensemble import (
+    BaggingClassifier, ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier,
+    StackingClassifier, VotingClassifier,
+)
+from sklearn.linear_model import LogisticRegression
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+def create_base_models(random_state=42, n_jobs=-1):
+    """
+    Membuat model dasar dengan parameter anti-overfitting, sama seperti notebook.
+    
+    Returns:
+        dict: Nama model -> estimator yang belum di-fit
+    """
+    return {
+        'RandomForest': RandomForestClassifier(
+            n_estimators=100,
+            max_depth=6,
+            min_samples_split=8,
+            min_samples_leaf=6,
+            max_features='sqrt',
+            bootstrap=True,
+            oob_score=True,
+            class_weight='balanced',
+            random_state=random_state,
+            n_jobs=n_jobs
+        ),
+        'SVM': SVC(
+            C=0.5,
+            kernel='rbf',
+            gamma='scale',
+            probability=True,
+            class_weight='balanced',
+            random_state=random_state
+        ),
+        'ExtraTrees': ExtraTreesClassifier(
+            n_estimators=100,
+            max_depth=6,
+            min_samples_split=8,
+            min_samples_leaf=6,
+            max_features='sqrt',
+            bootstrap=True,
+            class_weight='balanced',
+            random_state=random_state,
+            n_jobs=n_jobs
+        ),
+    }
+
+def create_ensemble_models(random_state=42, n_jobs=-1):
+    """
+    Ensemble lain yang diimpor di notebook. Voting dan Stacking menggabungkan model dasar,
+    sehingga semua model tetap memiliki predict_proba yang dipakai aplikasi.
+    
+    Returns:
+        dict: Nama model -> estimator yang belum di-fit
+    """
+    base_models = list(create_base_models(random_state, n_jobs).items())
+    return {
+        'GradientBoosting': GradientBoostingClassifier(
+            n_estimators=100,
+            learning_rate=0.1,
+            max_depth=3,
+            subsample=0.8,
+            random_state=random_state
+        ),
+        'Bagging': BaggingClassifier(
+            estimator=DecisionTreeClassifier(max_depth=6, min_samples_leaf=6, class_weight='balanced'),
+            n_estimators=50,
+            max_samples=0.8,
+            random_state=random_state,
+            n_jobs=n_jobs
+        ),
+        'Voting': VotingClassifier(estimators=base_models, voting='soft', n_jobs=n_jobs),
+        'Stacking': StackingClassifier(
+            estimators=base_models,
+            final_estimator=LogisticRegression(C=1.0, max_iter=1000),
+            cv=5,
+            n_jobs=n_jobs
+        ),
+    }
+
+MODEL_NAMES = list(create_base_models()) + list(create_ensemble_models())
+
+def create_model(name, random_state=42, n_jobs=-1, params=None):
+    """
+    Membuat satu model dengan parameter default-nya, ditimpa params (hasil pencarian
+    hyperparameter) jika diberikan.
+    
+    Args:
+        name: Salah satu MODEL_NAMES
+        random_state: Seed model
+        n_jobs: Jumlah proses paralel model
+        params: Dictionary parameter untuk set_params
+    
+    Returns:
+        Estimator sklearn yang belum di-fit
+    
+    Raises:
+        ValueError: Jika nama model tidak dikenal
+    """
+    models = {**create_base_models(random_state, n_jobs), **create_ensemble_models(random_state, n_jobs)}
+    if name not in models:
+        raise ValueError(f"Model tidak dikenal: {name} (pilihan: {', '.join(MODEL_NAMES)})")
+    model = models[name]
+    if params:
+        model.set_params(**params)
+    return model
@@ -0,0 +1,347 @@
+import copy
+import datetime
+import json
+import logging
+import os
+import platform
+import time
+from collections import namedtuple
+from importlib import metadata
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from scoring.registry import DEFAULT_MODEL_DIR, file_sha256, get_registry
+from training.cache import StageCache, code_fingerprint, stage_key
+from training.classification import classification_stage
+from training.features import clean_stage, feature_stage
+from training.incremental import SEGMENTATION_STATE_FILE, create_segmentation_state, save_segmentation_state
+from training.segmentation import (
+    CLUSTERERS, REDUCERS, SILHOUETTE_SAMPLE_SIZE, TRANSFORMERS, UMAP, clustering_stage, reduction_stage,
+    selection_stage, transform_stage,
+)
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_SOURCE = os.path.join(REPO_ROOT, 'data', 'employee_data.csv')
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'training_output')
+DEFAULT_CACHE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, '.cache')
+
+# inputs: nama tahap sebelumnya yang hasilnya menjadi argumen posisional fungsi tahap;
+# 'source' adalah path data mentah (kuncinya hash isi file). runtime: argumen yang
+# disediakan run_pipeline dan tidak memengaruhi hasil, sehingga tidak ikut kunci cache
+# (n_jobs dan memory, yaitu joblib.Memory untuk hasil fit transformasi dan CV per fold)
+Stage = namedtuple('Stage', ['name', 'func', 'inputs', 'runtime'], defaults=((),))
+
+STAGES = [
+    Stage('clean', clean_stage, ('source',)),
+    Stage('features', feature_stage, ('clean',)),
+    Stage('transform', transform_stage, ('features',), ('n_jobs', 'memory')),
+    Stage('selection', selection_stage, ('features', 'transform'), ('n_jobs', 'memory')),
+    Stage('reduction', reduction_stage, ('selection',)),
+    Stage('clustering', clustering_stage, ('features', 'reduction')),
+    Stage('classification', classification_stage, ('clustering',), ('n_jobs', 'memory')),
+]
+
+STAGE_NAMES = [stage.name for stage in STAGES]
+
+# Parameter default setiap tahap (sama seperti notebook). Semua nilai harus dapat
+# diserialisasi ke JSON karena ikut membentuk kunci cache
+DEFAULT_PARAMS = {
+    'clean': {},
+    'features': {},
+    'transform': {'candidates': list(TRANSFORMERS), 'n_clusters': 2, 'n_init': 20, 'random_state': 42,
+                  'silhouette_method': 'sampled', 'sample_size': SILHOUETTE_SAMPLE_SIZE},
+    'selection': {'n_estimators': 100, 'min_features': 3, 'max_features': 20,
+                  'n_clusters': 2, 'n_init': 20, 'random_state': 42,
+                  'silhouette_method': 'sampled', 'sample_size': SILHOUETTE_SAMPLE_SIZE, 'transformers': None},
+    'reduction': {'candidates': list(REDUCERS), 'n_clusters': 2, 'n_init': 20, 'random_state': 42,
+                  'silhouette_method': 'sampled', 'sample_size': SILHOUETTE_SAMPLE_SIZE},
+    'clustering': {'candidates': list(CLUSTERERS), 'silhouette_method': 'sampled',
+                   'sample_size': SILHOUETTE_SAMPLE_SIZE, 'random_state': 42},
+    'classification': {'models': ['RandomForest', 'SVM', 'ExtraTrees'], 'test_size': 0.3, 'random_state': 42,
+                       'search': True, 'cv': 5, 'factor': 3, 'scoring': 'f1_weighted', 'grids': {}},
+}
+
+PipelineResult = namedtuple('PipelineResult', ['source', 'outputs', 'keys', 'params', 'computed', 'cached',
+                                               'durations', 'wall_clock'])
+
+def resolve_params(overrides=None):
+    """
+    Menggabungkan parameter tahap yang diberikan dengan DEFAULT_PARAMS.
+    
+    Args:
+        overrides: Dictionary nama tahap -> dictionary parameter yang diganti
+    
+    Returns:
+        dict: Parameter lengkap semua tahap
+    
+    Raises:
+        ValueError: Jika nama tahap atau nama parameter tidak dikenal
+    """
+    params = copy.deepcopy(DEFAULT_PARAMS)
+    for name, values in (overrides or {}).items():
+        if name not in params:
+            raise ValueError(f"Tahap tidak dikenal: {name} (pilihan: {', '.join(STAGE_NAMES)})")
+        unknown = [key for key in values if key not in params[name]]
+        if unknown:
+            raise ValueError(f"Parameter tahap {name} tidak dikenal: {', '.join(unknown)}")
+        params[name].update(values)
+    return params
+
+def environment_info():
+    """
+    Versi library yang memengaruhi hasil training; perubahan versi membuat semua tahap dihitung ulang.
+    """
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+        'umap': metadata.version('umap-learn') if UMAP is not None else None,
+    }
+
+def run_pipeline(source=DEFAULT_SOURCE, cache_dir=DEFAULT_CACHE_DIR, params=None, force=(), until=None, n_jobs=-1):
+    """
+    Menjalankan tahap-tahap training secara berurutan dengan cache per tahap.
+    
+    Kunci cache suatu tahap bergantung pada parameter dan kode tahap tersebut serta kunci
+    tahap-tahap inputnya, sehingga perubahan pada satu tahap hanya menghitung ulang tahap
+    itu dan tahap-tahap sesudahnya; tahap lain dimuat dari cache.
+    
+    Args:
+        source: Path CSV data karyawan mentah
+        cache_dir: Folder cache hasil tahap
+        params: Parameter tahap yang mengganti DEFAULT_PARAMS (lihat resolve_params)
+        force: Nama tahap yang selalu dihitung ulang walaupun ada di cache
+        until: Nama tahap terakhir yang dijalankan (default: semua tahap)
+        n_jobs: Jumlah proses paralel pencarian transformasi, seleksi fitur, hyperparameter,
+            dan model (-1: semua core)
+    
+    Returns:
+        PipelineResult: Hasil semua tahap yang dijalankan beserta kunci cache, daftar tahap
+        yang dihitung/dimuat dari cache, durasi per tahap, dan total waktu (detik)
+    
+    Raises:
+        ValueError: Jika nama tahap atau parameter tidak dikenal, atau suatu tahap tidak
+            menemukan kandidat yang valid
+    """
+    run_start = time.perf_counter()
+    params = resolve_params(params)
+    unknown = [name for name in list(force) + ([until] if until else []) if name not in STAGE_NAMES]
+    if unknown:
+        raise ValueError(f"Tahap tidak dikenal: {', '.join(unknown)} (pilihan: {', '.join(STAGE_NAMES)})")
+    if not os.path.exists(source):
+        raise ValueError(f"File data {source} tidak ditemukan")
+    
+    stages = STAGES[:STAGE_NAMES.index(until) + 1] if until else STAGES
+    cache = StageCache(cache_dir)
+    environment = environment_info()
+    runtime = {'n_jobs': n_jobs, 'memory': joblib.Memory(os.path.join(cache_dir, 'memory'), verbose=0)}
+    
+    keys = {'source': file_sha256(source)[:16]}
+    for stage in stages:
+        keys[stage.name] = stage_key(stage.name, code_fingerprint(stage.func), params[stage.name],
+                                     [keys[name] for name in stage.inputs], environment)
+    
+    outputs = {'source': source}
+    computed, cached, durations = [], [], {}
+    for stage in stages:
+        key = keys[stage.name]
+        start = time.perf_counter()
+        hit, value = (False, None) if stage.name in force else cache.load(stage.name, key)
+        if hit:
+            cached.append(stage.name)
+            logger.info("Tahap %s: dimuat dari cache (%s)", stage.name, key)
+        else:
+            logger.info("Tahap %s: menghitung (%s)", stage.name, key)
+            value = stage.func(*(outputs[name] for name in stage.inputs), **params[stage.name],
+                               **{name: runtime[name] for name in stage.runtime})
+            cache.save(stage.name, key, value)
+            computed.append(stage.name)
+        durations[stage.name] = time.perf_counter() - start
+        outputs[stage.name] = value
+        if not hit:
+            logger.info("Tahap %s selesai dalam %.1f detik", stage.name, durations[stage.name])
+    
+    wall_clock = time.perf_counter() - run_start
+    logger.info("Total waktu pipeline: %.1f detik (%d tahap dihitung, %d dari cache)",
+                wall_clock, len(computed), len(cached))
+    return PipelineResult(source, outputs, keys, params, computed, cached, durations, wall_clock)
+
+def _atomic_write(path, write):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def _json_scores(scores):
+    return {str(name): round(float(score), 4) for name, score in scores.items()}
+
+def training_report(result):
+    """
+    Ringkasan satu run pipeline (pilihan setiap tahap, skor kandidat, dan metrik model)
+    yang dapat diserialisasi ke JSON.
+    """
+    outputs = result.outputs
+    report = {
+        'created_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'source': os.path.abspath(result.source),
+        'source_sha256': file_sha256(result.source),
+        'environment': environment_info(),
+        'params': result.params,
+        'stage_keys': {name: key for name, key in result.keys.items() if name != 'source'},
+        'computed': result.computed,
+        'cached': result.cached,
+        'durations_s': {name: round(seconds, 3) for name, seconds in result.durations.items()},
+        'wall_clock_s': round(result.wall_clock, 3),
+    }
+    if 'transform' in outputs:
+        report['transform'] = {'best': outputs['transform']['name'],
+                               'silhouette': _json_scores(outputs['transform']['scores'])}
+    if 'selection' in outputs:
+        selection = outputs['selection']
+        report['selection'] = {'transform': selection['transform'], 'features': selection['features'],
+                               'silhouette': _json_scores(selection['scores']),
+                               'top': json.loads(selection['ranking'].head(10).to_json(orient='records'))}
+    if 'reduction' in outputs:
+        report['reduction'] = {'best': outputs['reduction']['name'],
+                               'silhouette': _json_scores(outputs['reduction']['scores'])}
+    if 'clustering' in outputs:
+        clustering = outputs['clustering']
+        report['clustering'] = {
+            'best': clustering['name'],
+            'silhouette': round(float(clustering['silhouette']), 4),
+            'candidates': json.loads(clustering['scores'].to_json(orient='records')),
+            'segments': json.loads(clustering['summary'].to_json(orient='records')),
+        }
+    if 'classification' in outputs:
+        classification = outputs['classification']
+        report['classification'] = {
+            'best_model': classification['best_model'],
+            'metrics': classification['metrics'],
+            'confusion_matrices': {name: matrix.tolist()
+                                   for name, matrix in classification['confusion_matrices'].items()},
+            'search': {name: {
+                'best_params': search['best_params'],
+                'best_score': round(search['best_score'], 4),
+                'candidates': search['candidates'],
+                'evaluations': search['evaluations'],
+                'cached_evaluations': search['cached_evaluations'],
+                'seconds': round(search['seconds'], 3),
+                'history': json.loads(search['history'].to_json(orient='records')),
+            } for name, search in classification.get('search', {}).items()},
+        }
+    return report
+
+def export_artifacts(result, output_dir=DEFAULT_OUTPUT_DIR):
+    """
+    Menulis artefak hasil pipeline dengan nama file yang sama seperti notebook.
+    
+    Struktur output_dir:
+        data/data_final_employee.csv             Data bersih (tahap clean)
+        data/segmentation_search.csv              Peringkat transformasi x jumlah fitur (tahap selection)
+        data/optimal_risk_segmentation_result.csv Data hasil segmentasi (tahap clustering)
+        model/segmentation_state.joblib           State segmentasi inkremental (update_segmentation.py)
+        model/<nama>_model.joblib                 Setiap model klasifikasi
+        model/best_model.joblib                   Model terbaik
+        model/preprocessor.joblib                 Preprocessor klasifikasi
+        training_report.json                      Lihat training_report
+    
+    Setiap file ditulis ke file sementara lalu dipindahkan secara atomik.
+    
+    Args:
+        result: PipelineResult dari run_pipeline (boleh berhenti sebelum tahap terakhir;
+            hanya artefak tahap yang dijalankan yang ditulis)
+        output_dir: Folder tujuan
+    
+    Returns:
+        dict: Path file yang ditulis (data, search, segmentation, segmentation_state, models,
+        best_model, preprocessor, report)
+    """
+    outputs = result.outputs
+    paths = {}
+    if 'clean' in outputs:
+        paths['data'] = os.path.join(output_dir, 'data', 'data_final_employee.csv')
+        _atomic_write(paths['data'], lambda path: outputs['clean'].to_csv(path, index=False))
+    if 'selection' in outputs:
+        paths['search'] = os.path.join(output_dir, 'data', 'segmentation_search.csv')
+        _atomic_write(paths['search'], lambda path: outputs['selection']['ranking'].to_csv(path, index=False))
+    if 'clustering' in outputs:
+        paths['segmentation'] = os.path.join(output_dir, 'data', 'optimal_risk_segmentation_result.csv')
+        _atomic_write(paths['segmentation'], lambda path: outputs['clustering']['data'].to_csv(path, index=False))
+        try:
+            state = create_segmentation_state(outputs)
+        except ValueError as e:
+            logger.warning("State segmentasi inkremental tidak dibuat: %s", e)
+        else:
+            paths['segmentation_state'] = os.path.join(output_dir, 'model', SEGMENTATION_STATE_FILE)
+            save_segmentation_state(state, paths['segmentation_state'])
+    if 'classification' in outputs:
+        classification = outputs['classification']
+        model_dir = os.path.join(output_dir, 'model')
+        paths['models'] = {}
+        for name, model in classification['models'].items():
+            paths['models'][name] = os.path.join(model_dir, f'{name}_model.joblib')
+            _atomic_write(paths['models'][name], lambda path, model=model: joblib.dump(model, path))
+        best = classification['models'][classification['best_model']]
+        paths['best_model'] = os.path.join(model_dir, 'best_model.joblib')
+        _atomic_write(paths['best_model'], lambda path: joblib.dump(best, path))
+        paths['preprocessor'] = os.path.join(model_dir, 'preprocessor.joblib')
+        _atomic_write(paths['preprocessor'], lambda path: joblib.dump(classification['preprocessor'], path))
+    
+    paths['report'] = os.path.join(output_dir, 'training_report.json')
+    report = training_report(result)
+    report['artifacts'] = paths
+    _atomic_write(paths['report'], lambda path: _write_json(path, report))
+    return paths
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def register_models(result, paths, model_dir=DEFAULT_MODEL_DIR, activate=False):
+    """
+    Mendaftarkan model terbaik hasil pipeline ke registry model aplikasi.
+    
+    Kunci cache tahap classification dicatat di metrik versi (pipeline_key), sehingga run
+    ulang tanpa perubahan tidak mendaftarkan versi baru. Hash file tidak dapat dipakai untuk
+    ini karena file joblib model berbasis pohon tidak identik byte-per-byte setiap kali ditulis.
+    
+    Args:
+        result: PipelineResult yang berisi tahap classification
+        paths: Hasil export_artifacts
+        model_dir: Folder model (registry)
+        activate: True untuk menjadikan versi tersebut aktif
+    
+    Returns:
+        ModelVersion: Versi yang didaftarkan (atau yang sudah ada)
+    """
+    from compile_model import compile_version
+    
+    classification = result.outputs['classification']
+    name = classification['best_model']
+    model_path, preprocessor_path = paths['models'][name], paths['preprocessor']
+    registry = get_registry(model_dir)
+    
+    pipeline_key = result.keys['classification']
+    entry = next((entry for entry in registry.versions()
+                  if entry.name == name and entry.metrics.get('pipeline_key') == pipeline_key), None)
+    if entry is not None:
+        logger.info("Model %s dari run ini sudah terdaftar sebagai versi %s", name, entry.version)
+    else:
+        metrics = dict(classification['metrics'][name], pipeline_key=pipeline_key)
+        entry = registry.register(model_path, preprocessor_path, name=name, metrics=metrics)
+        logger.info("Model %s terdaftar sebagai versi %s", name, entry.version)
+        try:
+            compile_version(model_dir, entry.version, paths['segmentation'], report=logger.info)
+        except ValueError as e:
+            logger.warning("Versi %s tidak dikompilasi: %s", entry.version, e)
+    
+    if activate and registry.active_version() != entry.version:
+        registry.activate(entry.version)
+        logger.info("Versi %s sekarang aktif", entry.version)
+    return entry
@@ -0,0 +1,203 @@
+import json
+import logging
+import math
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from sklearn.metrics import accuracy_score, get_scorer
+from sklearn.model_selection import ParameterGrid, StratifiedKFold, train_test_split
+
+from training.models import create_model
+
+logger = logging.getLogger(__name__)
+
+# Ruang pencarian per model (parameter lain tetap seperti di training.models). Kombinasi
+# parameter notebook untuk RandomForest, ExtraTrees, dan SVM termasuk di dalamnya
+SEARCH_SPACES = {
+    'RandomForest': {'n_estimators': [100, 200], 'max_depth': [4, 6, 10], 'min_samples_leaf': [2, 6]},
+    'ExtraTrees': {'n_estimators': [100, 200], 'max_depth': [4, 6, 10], 'min_samples_leaf': [2, 6]},
+    'SVM': {'C': [0.1, 0.5, 1.0, 5.0, 10.0], 'gamma': ['scale', 0.01, 0.1]},
+    'GradientBoosting': {'n_estimators': [100, 200], 'learning_rate': [0.05, 0.1], 'max_depth': [2, 3]},
+    'Bagging': {'n_estimators': [20, 50], 'max_samples': [0.5, 0.8, 1.0]},
+    'Voting': {'weights': [None, [2, 1, 1], [1, 1, 2]]},
+    'Stacking': {'final_estimator__C': [0.1, 1.0, 10.0]},
+}
+
+# Akurasi training yang dianggap menghafal data. Model seperti ini diberi skor 0, baik saat
+# pencarian maupun saat pemilihan model terbaik (lihat training.classification)
+MEMORIZATION_ACCURACY = 0.999
+
+def penalized_score(score, train_accuracy):
+    """
+    Returns:
+        float: score, atau 0 jika train_accuracy >= MEMORIZATION_ACCURACY
+    """
+    return 0.0 if train_accuracy >= MEMORIZATION_ACCURACY else score
+
+def halving_schedule(n_candidates, n_samples, min_resources, factor=3):
+    """
+    Jumlah sampel training per putaran successive halving.
+    
+    Setiap putaran menyisakan 1/factor kandidat terbaik dan memakai factor kali lebih
+    banyak sampel; putaran terakhir selalu memakai semua sampel.
+    
+    Returns:
+        list: Jumlah sampel per putaran
+    """
+    n_rounds = 1
+    while factor ** n_rounds <= n_candidates:
+        n_rounds += 1
+    min_resources = min(min_resources, n_samples)
+    schedule = [max(min_resources, n_samples // factor ** (n_rounds - 1 - i)) for i in range(n_rounds - 1)]
+    return schedule + [n_samples]
+
+def subsample_indices(y, resources, random_state=42):
+    """
+    Indeks subsampel terstratifikasi berukuran resources (semua indeks jika resources >= len(y)).
+    """
+    indices = np.arange(len(y))
+    if resources >= len(y):
+        return indices
+    subsample, _ = train_test_split(indices, train_size=resources, stratify=y, random_state=random_state)
+    return np.sort(subsample)
+
+def evaluate_fold(family, params, model_config, data_key, resources, fold, cv, scoring, random_state, X, y):
+    """
+    Melatih dan menilai satu kandidat pada satu fold CV dari subsampel berukuran resources.
+    
+    Hasilnya dimemoisasi di disk (lihat successive_halving) dengan kunci semua argumen
+    kecuali X dan y, yang diwakili data_key. model_config (hash konfigurasi default model
+    family) membuat hasil dihitung ulang hanya jika model family tersebut berubah.
+    
+    Returns:
+        dict: score (fold test), train_accuracy (fold training), dan fit_seconds
+    """
+    subsample = subsample_indices(y, resources, random_state)
+    X_sub, y_sub = X[subsample], y[subsample]
+    folds = StratifiedKFold(n_splits=cv, shuffle=True, random_state=random_state).split(X_sub, y_sub)
+    train, test = next(split for i, split in enumerate(folds) if i == fold)
+    
+    model = create_model(family, random_state, n_jobs=1, params=params)
+    start = time.perf_counter()
+    model.fit(X_sub[train], y_sub[train])
+    fit_seconds = time.perf_counter() - start
+    return {
+        'score': float(get_scorer(scoring)(model, X_sub[test], y_sub[test])),
+        'train_accuracy': float(accuracy_score(y_sub[train], model.predict(X_sub[train]))),
+        'fit_seconds': fit_seconds,
+    }
+
+def successive_halving(family, space, X, y, memory=None, cv=5, factor=3, scoring='f1_weighted',
+                       random_state=42, n_jobs=-1):
+    """
+    Pencarian hyperparameter successive halving untuk satu model.
+    
+    Semua kandidat dinilai dengan CV pada subsampel kecil, lalu hanya 1/factor kandidat
+    terbaik yang lanjut ke putaran berikutnya dengan sampel factor kali lebih banyak.
+    Setiap pasangan (kandidat, ukuran sampel, fold) dievaluasi paralel dan hasilnya disimpan
+    di memory, sehingga mengubah ruang pencarian satu model tidak menghitung ulang
+    evaluasi model lain maupun kandidat yang sudah pernah dinilai.
+    
+    Skor fold kandidat yang menghafal data training fold tersebut dijadikan 0 (lihat
+    penalized_score), aturan yang sama dengan pemilihan model terbaik, sehingga pencarian
+    tidak memilih parameter yang kemudian dibuang karena overfitting.
+    
+    Args:
+        family: Nama model (lihat training.models.MODEL_NAMES)
+        space: Ruang parameter dalam format ParameterGrid
+        X: Fitur training hasil preprocessing
+        y: Target training
+        memory: joblib.Memory untuk hasil per fold (None: tanpa cache)
+        cv: Jumlah fold StratifiedKFold
+        factor: Faktor pengurangan kandidat per putaran
+        scoring: Nama scorer sklearn
+        random_state: Seed subsampel, fold, dan model
+        n_jobs: Jumlah proses paralel (-1: semua core)
+    
+    Returns:
+        dict: best_params, best_score, candidates, evaluations, cached_evaluations, seconds,
+        dan history (DataFrame skor per putaran dan kandidat)
+    """
+    start = time.perf_counter()
+    y = np.asarray(y)
+    candidates = list(ParameterGrid(space))
+    evaluate = (memory or Memory(None)).cache(evaluate_fold, ignore=['X', 'y'])
+    data_key = joblib.hash((X, y))
+    model_config = joblib.hash(create_model(family, random_state, n_jobs=1))
+    
+    # Setiap fold subsampel terkecil harus tetap berisi semua cluster
+    min_class_count = np.bincount(pd.factorize(y)[0]).min()
+    min_resources = math.ceil(cv * len(y) / min_class_count)
+    schedule = halving_schedule(len(candidates), len(y), min_resources, factor)
+    
+    history, evaluations, cached = [], 0, 0
+    for round_index, resources in enumerate(schedule):
+        calls = [(family, params, model_config, data_key, resources, fold, cv, scoring, random_state, X, y)
+                 for params in candidates for fold in range(cv)]
+        cached += sum(evaluate.check_call_in_cache(*args) for args in calls)
+        evaluations += len(calls)
+        results = Parallel(n_jobs=n_jobs)(delayed(evaluate)(*args) for args in calls)
+        
+        scores = []
+        for i, params in enumerate(candidates):
+            fold_results = results[i * cv:(i + 1) * cv]
+            fold_scores = [penalized_score(result['score'], result['train_accuracy']) for result in fold_results]
+            scores.append(float(np.mean(fold_scores)))
+            history.append({
+                'round': round_index,
+                'resources': resources,
+                'params': json.dumps(params, sort_keys=True),
+                'score': scores[-1],
+                'std': float(np.std(fold_scores)),
+                'unpenalized_score': float(np.mean([result['score'] for result in fold_results])),
+                'train_accuracy': float(np.mean([result['train_accuracy'] for result in fold_results])),
+                'fit_seconds': float(sum(result['fit_seconds'] for result in fold_results)),
+            })
+        
+        ranking = sorted(range(len(candidates)), key=lambda i: -scores[i])
+        if round_index == len(schedule) - 1:
+            best_params, best_score = candidates[ranking[0]], scores[ranking[0]]
+        else:
+            candidates = [candidates[i] for i in ranking[:math.ceil(len(candidates) / factor)]]
+    
+    seconds = time.perf_counter() - start
+    logger.info("  %s: %d kandidat, sampel %s, %d evaluasi fold (%d dari cache), terbaik %s (%s CV %.4f) "
+                "dalam %.1f detik", family, len(ParameterGrid(space)), schedule, evaluations, cached,
+                best_params, scoring, best_score, seconds)
+    return {
+        'best_params': best_params,
+        'best_score': best_score,
+        'candidates': len(ParameterGrid(space)),
+        'evaluations': evaluations,
+        'cached_evaluations': cached,
+        'seconds': seconds,
+        'history': pd.DataFrame(history),
+    }
+
+def tune_models(X, y, families, memory=None, cv=5, factor=3, scoring='f1_weighted', grids=None,
+                random_state=42, n_jobs=-1):
+    """
+    Menjalankan successive_halving untuk setiap model.
+    
+    Args:
+        families: Nama model yang dicari hyperparameternya
+        grids: Dictionary nama model -> parameter ruang pencarian yang mengganti SEARCH_SPACES
+        (argumen lain lihat successive_halving)
+    
+    Returns:
+        dict: Nama model -> hasil successive_halving
+    """
+    grids = grids or {}
+    unknown = [name for name in list(families) + list(grids) if name not in SEARCH_SPACES]
+    if unknown:
+        raise ValueError(f"Tidak ada ruang pencarian untuk model: {', '.join(unknown)}")
+    
+    results = {}
+    for family in families:
+        space = dict(SEARCH_SPACES[family])
+        space.update(grids.get(family, {}))
+        results[family] = successive_halving(family, space, X, y, memory, cv, factor, scoring, random_state, n_jobs)
+    return results
@@ -0,0 +1,535 @@
+import logging
+import math
+import time
+
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from sklearn.base import BaseEstimator, ClusterMixin, clone
+from sklearn.cluster import (
+    DBSCAN, HDBSCAN, OPTICS, AffinityPropagation, AgglomerativeClustering, Birch, KMeans, SpectralClustering,
+)
+from sklearn.decomposition import PCA, KernelPCA
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import pairwise_distances, silhouette_score
+from sklearn.mixture import BayesianGaussianMixture, GaussianMixture
+from sklearn.preprocessing import PowerTransformer, QuantileTransformer, RobustScaler, StandardScaler
+
+from scoring import CLUSTER_MAPPING
+from training.cache import code_fingerprint
+
+try:
+    from umap import UMAP
+except ImportError:  # umap-learn opsional; kandidat UMAP dilewati jika tidak terpasang
+    UMAP = None
+
+logger = logging.getLogger(__name__)
+
+SILHOUETTE_METHODS = ('exact', 'sampled', 'simplified')
+
+# Ukuran sampel default silhouette 'sampled'. Data yang lebih kecil dinilai utuh (sama
+# dengan 'exact'), sehingga hasil pada data bawaan (1.058 baris) identik dengan notebook
+SILHOUETTE_SAMPLE_SIZE = 10_000
+
+def stratified_sample(labels, sample_size, random_state=42):
+    """
+    Indeks sampel berukuran kira-kira sample_size dengan proporsi setiap cluster dipertahankan
+    (minimal 2 anggota per cluster, atau seluruh anggota cluster yang lebih kecil).
+    
+    Returns:
+        ndarray: Indeks terurut; semua indeks jika sample_size >= jumlah data
+    """
+    labels = np.asarray(labels)
+    if sample_size >= len(labels):
+        return np.arange(len(labels))
+    rng = np.random.default_rng(random_state)
+    clusters, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    quotas = np.maximum(np.minimum(counts, 2), np.floor(counts * sample_size / len(labels)).astype(int))
+    members = np.split(np.argsort(inverse, kind='stable'), np.cumsum(counts)[:-1])
+    return np.sort(np.concatenate([rng.choice(index, size=quota, replace=False)
+                                   for index, quota in zip(members, quotas)]))
+
+def simplified_silhouette(X, labels):
+    """
+    Simplified silhouette: a(i) dan b(i) diukur ke centroid cluster, bukan ke semua titik,
+    sehingga biayanya O(n * k) alih-alih O(n^2).
+    
+    Nilainya bukan estimasi silhouette exact (tidak ada batas error formal); untuk cluster
+    yang kompak dan terpisah (seperti hasil KMeans) urutan kandidat umumnya sama, tetapi
+    nilainya cenderung lebih tinggi. Titik di cluster beranggota satu bernilai 0, sama
+    seperti silhouette_score.
+    
+    Returns:
+        float: Rata-rata simplified silhouette
+    """
+    X = np.asarray(X, dtype=float)
+    clusters, inverse, counts = np.unique(np.asarray(labels), return_inverse=True, return_counts=True)
+    centroids = np.vstack([X[inverse == i].mean(axis=0) for i in range(len(clusters))])
+    distances = pairwise_distances(X, centroids)
+    rows = np.arange(len(X))
+    a = distances[rows, inverse].copy()
+    distances[rows, inverse] = np.inf
+    b = distances.min(axis=1)
+    denominator = np.maximum(a, b)
+    values = np.divide(b - a, denominator, out=np.zeros_like(a), where=denominator > 0)
+    values[counts[inverse] == 1] = 0
+    return float(values.mean())
+
+def silhouette_error_bound(sample_size, confidence=0.95):
+    """
+    Batas error silhouette 'sampled' akibat pemilihan titik yang dinilai (ketaksamaan
+    Hoeffding untuk rata-rata nilai dalam [-1, 1]): dengan peluang >= confidence,
+    |sampled - exact| <= sqrt(2 * ln(2 / (1 - confidence)) / sample_size).
+    
+    a(i) dan b(i) juga dihitung dari titik sampel, sehingga error sebenarnya bisa sedikit
+    lebih besar untuk cluster yang hanya terwakili sedikit titik; untuk sample_size 10.000
+    batasnya 0,027 (5.000: 0,038; 2.000: 0,061).
+    
+    Returns:
+        float: Batas error absolut
+    """
+    return math.sqrt(2 * math.log(2 / (1 - confidence)) / sample_size)
+
+def _check_silhouette_method(method):
+    if method not in SILHOUETTE_METHODS:
+        raise ValueError(f"Metode silhouette tidak dikenal: {method} (pilihan: {', '.join(SILHOUETTE_METHODS)})")
+
+def silhouette(X, labels, method='sampled', sample_size=SILHOUETTE_SAMPLE_SIZE, random_state=42):
+    """
+    Silhouette score dengan biaya yang dapat dibatasi untuk data besar.
+    
+    Args:
+        X: Data yang di-cluster
+        labels: Label cluster
+        method: 'exact' (silhouette_score, O(n^2)), 'sampled' (silhouette_score pada sampel
+            terstratifikasi per cluster berukuran sample_size, O(sample_size^2); lihat
+            silhouette_error_bound), atau 'simplified' (berbasis centroid, O(n * k); lihat
+            simplified_silhouette)
+        sample_size: Ukuran sampel untuk 'sampled'
+        random_state: Seed sampel
+    
+    Returns:
+        float: Silhouette score, atau -1 jika hanya ada satu cluster
+    
+    Raises:
+        ValueError: Jika method tidak dikenal
+    """
+    _check_silhouette_method(method)
+    labels = np.asarray(labels)
+    if len(np.unique(labels)) < 2:
+        return -1
+    if method == 'simplified':
+        return simplified_silhouette(X, labels)
+    if method == 'sampled':
+        sample = stratified_sample(labels, sample_size, random_state)
+        X, labels = np.asarray(X)[sample], labels[sample]
+    return float(silhouette_score(X, labels))
+
+class KMeansWithSilhouette(BaseEstimator, ClusterMixin):
+    """
+    KMeans yang sekaligus menghitung silhouette score hasil clustering-nya.
+    
+    Dipakai sebagai pembanding cepat antar transformasi, subset fitur, dan metode reduksi
+    dimensi (silhouette -1 jika semua data masuk satu cluster). Cara menghitung silhouette
+    diatur silhouette_method dan sample_size (lihat silhouette).
+    """
+    
+    def __init__(self, n_clusters=2, random_state=42, n_init=10, silhouette_method='sampled',
+                 sample_size=SILHOUETTE_SAMPLE_SIZE):
+        self.n_clusters = n_clusters
+        self.random_state = random_state
+        self.n_init = n_init
+        self.silhouette_method = silhouette_method
+        self.sample_size = sample_size
+    
+    def fit(self, X, y=None):
+        self.kmeans_ = KMeans(
+            n_clusters=self.n_clusters,
+            random_state=self.random_state,
+            n_init=self.n_init
+        )
+        self.labels_ = self.kmeans_.fit_predict(X)
+        self.silhouette_ = silhouette(X, self.labels_, self.silhouette_method, self.sample_size, self.random_state)
+        return self
+    
+    def predict(self, X):
+        return self.kmeans_.predict(X)
+    
+    def fit_predict(self, X, y=None):
+        self.fit(X)
+        return self.labels_
+
+# Kandidat setiap pencarian, sama seperti notebook. Nama kandidat dipakai di parameter
+# tahap (dan kunci cache), sehingga nilainya berupa factory, bukan objek estimator
+TRANSFORMERS = {
+    'StandardScaler': lambda: StandardScaler(),
+    'RobustScaler': lambda: RobustScaler(),
+    'QuantileTransformer': lambda: QuantileTransformer(output_distribution='normal'),
+    'PowerTransformer': lambda: PowerTransformer(method='yeo-johnson'),
+}
+
+REDUCERS = {
+    'PCA': lambda: PCA(n_components=2, random_state=42),
+    'UMAP-1': lambda: UMAP(n_components=2, random_state=42, n_neighbors=15, min_dist=0.1),
+    'UMAP-2': lambda: UMAP(n_components=2, random_state=42, n_neighbors=30, min_dist=0.3),
+    'UMAP-3': lambda: UMAP(n_components=2, random_state=42, n_neighbors=50, min_dist=0.5),
+    'KernelPCA': lambda: KernelPCA(n_components=2, kernel='rbf', random_state=42),
+}
+
+# Notebook memakai paket hdbscan; HDBSCAN bawaan sklearn (>= 1.3) menghasilkan partisi
+# yang sama pada data ini tanpa dependensi tambahan
+CLUSTERERS = {
+    'KMeans-1': lambda: KMeans(n_clusters=2, random_state=42, n_init=50, max_iter=300),
+    'KMeans-2': lambda: KMeans(n_clusters=2, random_state=42, n_init=50, max_iter=500, algorithm='elkan'),
+    'GaussianMixture-full': lambda: GaussianMixture(n_components=2, covariance_type='full', random_state=42, max_iter=500, n_init=10),
+    'GaussianMixture-tied': lambda: GaussianMixture(n_components=2, covariance_type='tied', random_state=42, max_iter=500, n_init=10),
+    'GaussianMixture-diag': lambda: GaussianMixture(n_components=2, covariance_type='diag', random_state=42, max_iter=500, n_init=10),
+    'GaussianMixture-spherical': lambda: GaussianMixture(n_components=2, covariance_type='spherical', random_state=42, max_iter=500, n_init=10),
+    'VBGM-full': lambda: BayesianGaussianMixture(n_components=2, covariance_type='full', random_state=42, max_iter=500, n_init=10),
+    'VBGM-tied': lambda: BayesianGaussianMixture(n_components=2, covariance_type='tied', random_state=42, max_iter=500, n_init=10),
+    'VBGM-diag': lambda: BayesianGaussianMixture(n_components=2, covariance_type='diag', random_state=42, max_iter=500, n_init=10),
+    'VBGM-spherical': lambda: BayesianGaussianMixture(n_components=2, covariance_type='spherical', random_state=42, max_iter=500, n_init=10),
+    'SpectralClustering-rbf': lambda: SpectralClustering(n_clusters=2, random_state=42, affinity='rbf', n_init=50),
+    'SpectralClustering-nearest': lambda: SpectralClustering(n_clusters=2, random_state=42, affinity='nearest_neighbors', n_init=50),
+    'DBSCAN-1': lambda: DBSCAN(eps=0.5, min_samples=5),
+    'DBSCAN-2': lambda: DBSCAN(eps=0.7, min_samples=10),
+    'HDBSCAN': lambda: HDBSCAN(min_cluster_size=10, min_samples=5),
+    'OPTICS-1': lambda: OPTICS(min_samples=5, xi=0.05, min_cluster_size=0.05),
+    'OPTICS-2': lambda: OPTICS(min_samples=10, xi=0.1, min_cluster_size=0.1),
+    'AgglomerativeClustering-ward': lambda: AgglomerativeClustering(n_clusters=2, linkage='ward'),
+    'AgglomerativeClustering-complete': lambda: AgglomerativeClustering(n_clusters=2, linkage='complete'),
+    'AgglomerativeClustering-average': lambda: AgglomerativeClustering(n_clusters=2, linkage='average'),
+    'AgglomerativeClustering-single': lambda: AgglomerativeClustering(n_clusters=2, linkage='single'),
+    'BIRCH-1': lambda: Birch(n_clusters=2, threshold=0.01, branching_factor=50),
+    'BIRCH-2': lambda: Birch(n_clusters=2, threshold=0.05, branching_factor=100),
+    'AffinityPropagation-1': lambda: AffinityPropagation(damping=0.9, preference=-50, random_state=42),
+    'AffinityPropagation-2': lambda: AffinityPropagation(damping=0.7, preference=-10, random_state=42),
+}
+
+def available_candidates(registry, names):
+    """
+    Menyaring nama kandidat yang dapat dibuat di lingkungan ini.
+    
+    Args:
+        registry: TRANSFORMERS, REDUCERS, atau CLUSTERERS
+        names: Nama kandidat yang diminta
+    
+    Returns:
+        list: Nama kandidat yang tersedia, urutan dipertahankan
+    
+    Raises:
+        ValueError: Jika ada nama yang tidak dikenal
+    """
+    unknown = [name for name in names if name not in registry]
+    if unknown:
+        raise ValueError(f"Kandidat tidak dikenal: {', '.join(unknown)}")
+    if UMAP is None:
+        skipped = [name for name in names if name.startswith('UMAP')]
+        if skipped:
+            logger.warning("umap-learn tidak terpasang, kandidat %s dilewati", ', '.join(skipped))
+        names = [name for name in names if not name.startswith('UMAP')]
+    return list(names)
+
+def _pick_best(scores, stage_name):
+    if not scores:
+        raise ValueError(f"Tidak ada kandidat {stage_name} yang berhasil dievaluasi")
+    return max(scores, key=scores.get)
+
+def fit_transformer(name, code, X):
+    """
+    Fit satu kandidat TRANSFORMERS pada X.
+    
+    Dimemoisasi di disk oleh transform_stage dan selection_stage dengan kunci nama, code
+    (sidik kode fungsi ini beserta TRANSFORMERS), dan isi X, sehingga setiap transformasi
+    hanya di-fit sekali walaupun parameter pencarian berubah.
+    
+    Returns:
+        tuple: (transformer yang sudah di-fit, X hasil transformasi)
+    """
+    transformer = TRANSFORMERS[name]()
+    return transformer, transformer.fit_transform(X)
+
+def rank_features(code, X, y, features, n_estimators=100, random_state=42):
+    """
+    Mengurutkan fitur berdasarkan importance Random Forest terhadap Attrition
+    (dimemoisasi seperti fit_transformer).
+    
+    Returns:
+        DataFrame: Feature dan Importance, terurut dari importance tertinggi
+    """
+    rf = RandomForestClassifier(n_estimators=n_estimators, random_state=random_state, class_weight='balanced')
+    rf.fit(X, y)
+    return pd.DataFrame({
+        'Feature': features,
+        'Importance': rf.feature_importances_
+    }).sort_values('Importance', ascending=False)
+
+def _cached(func, memory):
+    return (memory or Memory(None)).cache(func)
+
+def _evaluate_transformer(fit, name, code, X, kmeans):
+    # Dijalankan di proses worker; kegagalan dikembalikan agar kandidat lain tetap dinilai
+    try:
+        start = time.perf_counter()
+        transformer, X_transformed = fit(name, code, X)
+        score = clone(kmeans).fit(X_transformed).silhouette_
+        return transformer, X_transformed, score, time.perf_counter() - start, None
+    except Exception as e:
+        return None, None, None, None, e
+
+def _evaluate_subset(X, kmeans):
+    start = time.perf_counter()
+    return clone(kmeans).fit(X).silhouette_, time.perf_counter() - start
+
+def transform_stage(features, candidates, n_clusters=2, n_init=20, random_state=42, silhouette_method='sampled',
+                    sample_size=SILHOUETTE_SAMPLE_SIZE, n_jobs=-1, memory=None):
+    """
+    Tahap transformasi: memilih transformasi dengan silhouette KMeans tertinggi.
+    
+    Kandidat dinilai paralel, dan hasil fit setiap transformasi disimpan di memory untuk
+    dipakai ulang oleh selection_stage.
+    
+    Args:
+        features: Hasil feature_stage
+        candidates: Nama kandidat dari TRANSFORMERS
+        n_clusters: Jumlah cluster KMeans pembanding
+        n_init: n_init KMeans pembanding
+        random_state: Seed KMeans pembanding
+        silhouette_method: Cara menghitung silhouette (lihat silhouette)
+        sample_size: Ukuran sampel silhouette 'sampled'
+        n_jobs: Jumlah proses paralel (-1: semua core)
+        memory: joblib.Memory untuk hasil fit_transformer (None: tanpa cache)
+    
+    Returns:
+        dict: name, transformer (sudah di-fit), X (hasil transformasi), dan scores
+    """
+    _check_silhouette_method(silhouette_method)
+    names = available_candidates(TRANSFORMERS, candidates)
+    fit, code = _cached(fit_transformer, memory), code_fingerprint(fit_transformer)
+    kmeans = KMeansWithSilhouette(n_clusters, random_state, n_init, silhouette_method, sample_size)
+    evaluations = Parallel(n_jobs=n_jobs)(
+        delayed(_evaluate_transformer)(fit, name, code, features['X'], kmeans) for name in names)
+    
+    results, scores = {}, {}
+    for name, (transformer, X_transformed, score, seconds, error) in zip(names, evaluations):
+        if error is not None:
+            logger.warning("  %s gagal: %s", name, error)
+            continue
+        scores[name] = score
+        results[name] = (transformer, X_transformed)
+        logger.info("  %s: silhouette %.3f (%.2f detik)", name, score, seconds)
+    
+    best = _pick_best(scores, 'transformasi')
+    logger.info("Transformasi terbaik: %s (silhouette %.3f)", best, scores[best])
+    return {'name': best, 'transformer': results[best][0], 'X': results[best][1], 'scores': scores}
+
+def selection_stage(features, transform, n_estimators=100, min_features=3, max_features=20,
+                    n_clusters=2, n_init=20, random_state=42, silhouette_method='sampled',
+                    sample_size=SILHOUETTE_SAMPLE_SIZE, transformers=None, n_jobs=-1, memory=None):
+    """
+    Tahap seleksi fitur: mengurutkan fitur berdasarkan importance Random Forest terhadap
+    Attrition, lalu memilih jumlah fitur teratas dengan silhouette KMeans tertinggi.
+    
+    Setiap kombinasi transformasi x jumlah fitur dinilai paralel. Transformasi dan urutan
+    fitur (bagian yang sama untuk semua jumlah fitur) dihitung sekali per transformasi dan
+    disimpan di memory, sehingga mengubah rentang jumlah fitur atau parameter KMeans hanya
+    menghitung ulang silhouette.
+    
+    Args:
+        features: Hasil feature_stage
+        transform: Hasil transform_stage
+        n_estimators: Jumlah pohon Random Forest
+        min_features: Jumlah fitur minimum yang dicoba
+        max_features: Jumlah fitur maksimum yang dicoba
+        n_clusters: Jumlah cluster KMeans pembanding
+        n_init: n_init KMeans pembanding
+        random_state: Seed Random Forest dan KMeans
+        silhouette_method: Cara menghitung silhouette (lihat silhouette)
+        sample_size: Ukuran sampel silhouette 'sampled'
+        transformers: Nama transformasi yang dicari bersama jumlah fitur; None hanya memakai
+            transformasi terbaik tahap transform (seperti notebook)
+        n_jobs: Jumlah proses paralel (-1: semua core)
+        memory: joblib.Memory untuk hasil fit_transformer dan rank_features (None: tanpa cache)
+    
+    Returns:
+        dict: transform (nama transformasi terpilih), transformer (sudah di-fit), features
+        (fitur terpilih), X (kolom terpilih dari hasil transformasi), importance (DataFrame
+        Feature/Importance), scores (jumlah fitur -> silhouette untuk transformasi terpilih),
+        dan ranking (DataFrame semua kombinasi, terurut dari silhouette tertinggi)
+    """
+    _check_silhouette_method(silhouette_method)
+    all_features = features['features']
+    names = available_candidates(TRANSFORMERS, transformers) if transformers is not None else [transform['name']]
+    fit, rank = _cached(fit_transformer, memory), _cached(rank_features, memory)
+    code, rank_code = code_fingerprint(fit_transformer), code_fingerprint(rank_features)
+    
+    prepared = {}
+    for name in names:
+        if name == transform['name']:
+            transformer, X_transformed = transform['transformer'], transform['X']
+        else:
+            transformer, X_transformed = fit(name, code, features['X'])
+        importance = rank(rank_code, X_transformed, features['y'], all_features, n_estimators, random_state)
+        prepared[name] = (transformer, X_transformed, importance, importance['Feature'].tolist())
+    
+    counts = range(min_features, min(max_features, len(all_features)) + 1)
+    combinations = [(name, n_features) for name in names for n_features in counts]
+    kmeans = KMeansWithSilhouette(n_clusters, random_state, n_init, silhouette_method, sample_size)
+    columns = {name: [all_features.index(f) for f in prepared[name][3]] for name in names}
+    evaluations = Parallel(n_jobs=n_jobs)(
+        delayed(_evaluate_subset)(prepared[name][1][:, columns[name][:n_features]], kmeans)
+        for name, n_features in combinations)
+    
+    rows = []
+    for (name, n_features), (score, seconds) in zip(combinations, evaluations):
+        rows.append({
+            'transformer': name,
+            'n_features': n_features,
+            'silhouette': score,
+            'features': ', '.join(prepared[name][3][:n_features]),
+            'seconds': seconds,
+        })
+        logger.debug("  %s, %d fitur: silhouette %.3f", name, n_features, score)
+    if not rows:
+        raise ValueError("Tidak ada kombinasi seleksi fitur yang dapat dievaluasi")
+    ranking = pd.DataFrame(rows).sort_values('silhouette', ascending=False, kind='stable').reset_index(drop=True)
+    ranking.insert(0, 'rank', range(1, len(ranking) + 1))
+    
+    best = ranking.iloc[0]
+    transformer, X_transformed, importance, ranked = prepared[best['transformer']]
+    selected = ranked[:best['n_features']]
+    scores = {row['n_features']: row['silhouette'] for row in rows if row['transformer'] == best['transformer']}
+    logger.info("Jumlah fitur optimal: %d dengan %s (silhouette %.3f): %s", best['n_features'],
+                best['transformer'], best['silhouette'], ', '.join(selected))
+    return {
+        'transform': best['transformer'],
+        'transformer': transformer,
+        'features': selected,
+        'X': X_transformed[:, columns[best['transformer']][:best['n_features']]],
+        'importance': importance,
+        'scores': scores,
+        'ranking': ranking,
+    }
+
+def reduction_stage(selection, candidates, n_clusters=2, n_init=20, random_state=42, silhouette_method='sampled',
+                    sample_size=SILHOUETTE_SAMPLE_SIZE):
+    """
+    Tahap reduksi dimensi: memilih metode reduksi ke 2 dimensi dengan silhouette KMeans tertinggi.
+    
+    Args:
+        selection: Hasil selection_stage
+        candidates: Nama kandidat dari REDUCERS
+        n_clusters: Jumlah cluster KMeans pembanding
+        n_init: n_init KMeans pembanding
+        random_state: Seed KMeans pembanding
+        silhouette_method: Cara menghitung silhouette (lihat silhouette)
+        sample_size: Ukuran sampel silhouette 'sampled'
+    
+    Returns:
+        dict: name, reducer (sudah di-fit), X (hasil reduksi), dan scores
+    """
+    _check_silhouette_method(silhouette_method)
+    results, scores = {}, {}
+    for name in available_candidates(REDUCERS, candidates):
+        try:
+            start = time.perf_counter()
+            reducer = REDUCERS[name]()
+            X_reduced = reducer.fit_transform(selection['X'])
+            scores[name] = KMeansWithSilhouette(n_clusters, random_state, n_init, silhouette_method,
+                                                sample_size).fit(X_reduced).silhouette_
+            results[name] = (reducer, X_reduced)
+            logger.info("  %s: silhouette %.3f (%.2f detik)", name, scores[name], time.perf_counter() - start)
+        except Exception as e:
+            logger.warning("  %s gagal: %s", name, e)
+    
+    best = _pick_best(scores, 'reduksi dimensi')
+    logger.info("Reduksi dimensi terbaik: %s (silhouette %.3f)", best, scores[best])
+    return {'name': best, 'reducer': results[best][0], 'X': results[best][1], 'scores': scores}
+
+def _fit_labels(model, X):
+    if isinstance(model, (GaussianMixture, BayesianGaussianMixture)):
+        model.fit(X)
+        return model.predict(X)
+    return model.fit_predict(X)
+
+def order_clusters_by_risk(labels, attrition):
+    """
+    Menomori ulang cluster berdasarkan tingkat attrition (naik), sehingga nomor cluster
+    sesuai dengan CLUSTER_MAPPING (0 = Risiko Sangat Rendah, ..., 3 = Risiko Sangat Tinggi).
+    
+    Args:
+        labels: Label cluster hasil clustering
+        attrition: Nilai Attrition (0/1) per baris
+    
+    Returns:
+        ndarray: Label cluster yang sudah dinomori ulang
+    """
+    rates = pd.Series(np.asarray(attrition, dtype=float)).groupby(np.asarray(labels)).mean()
+    remap = {cluster: rank for rank, cluster in enumerate(rates.sort_values(kind='stable').index)}
+    return np.array([remap[label] for label in labels])
+
+def clustering_stage(features, reduction, candidates, silhouette_method='sampled', sample_size=SILHOUETTE_SAMPLE_SIZE,
+                     random_state=42):
+    """
+    Tahap clustering: memilih metode dengan silhouette tertinggi di antara kandidat yang
+    menghasilkan tepat satu cluster per level risiko tanpa noise.
+    
+    Args:
+        features: Hasil feature_stage
+        reduction: Hasil reduction_stage
+        candidates: Nama kandidat dari CLUSTERERS
+        silhouette_method: Cara menghitung silhouette (lihat silhouette)
+        sample_size: Ukuran sampel silhouette 'sampled'
+        random_state: Seed sampel silhouette
+    
+    Returns:
+        dict: name, data (DataFrame hasil segmentasi dengan kolom Cluster dan RiskLevel),
+        silhouette, scores (DataFrame ringkasan semua kandidat), dan summary (per cluster)
+    """
+    _check_silhouette_method(silhouette_method)
+    X_reduced = reduction['X']
+    y = features['y'].to_numpy()
+    n_segments = len(CLUSTER_MAPPING)
+    
+    rows, results = [], {}
+    for name in available_candidates(CLUSTERERS, candidates):
+        try:
+            start = time.perf_counter()
+            labels = _fit_labels(CLUSTERERS[name](), X_reduced)
+            elapsed = time.perf_counter() - start
+            clusters = np.unique(labels)
+            score = silhouette(X_reduced, labels, silhouette_method, sample_size, random_state)
+            rates = pd.Series(y).groupby(labels).mean() * 100
+            eligible = len(clusters) == n_segments and -1 not in clusters
+            rows.append({
+                'method': name,
+                'silhouette': score,
+                'clusters': len(clusters),
+                'noise': int((labels == -1).sum()),
+                'attrition_diff': float(rates.max() - rates.min()),
+                'eligible': eligible,
+                'seconds': elapsed,
+            })
+            if eligible:
+                results[name] = labels
+            logger.info("  %s: silhouette %.3f, %d cluster, selisih attrition %.1f%% (%.2f detik)",
+                        name, score, len(clusters), rows[-1]['attrition_diff'], elapsed)
+        except Exception as e:
+            logger.warning("  %s gagal: %s", name, e)
+    
+    scores = pd.DataFrame(rows)
+    eligible_scores = {row['method']: row['silhouette'] for row in rows if row['eligible']}
+    if not eligible_scores:
+        raise ValueError(f"Tidak ada metode clustering yang menghasilkan {n_segments} cluster tanpa noise")
+    best = _pick_best(eligible_scores, 'clustering')
+    
+    data = features['data'].copy()
+    data['Cluster'] = order_clusters_by_risk(results[best], y)
+    data['RiskLevel'] = data['Cluster'].map({cluster: info['level'] for cluster, info in CLUSTER_MAPPING.items()})
+    summary = data.groupby(['Cluster', 'RiskLevel']).agg(
+        employees=('Attrition', 'size'), attrition_rate=('Attrition', 'mean')).reset_index()
+    logger.info("Metode clustering terbaik: %s (silhouette %.3f)", best, eligible_scores[best])
+    for row in summary.itertuples():
+        logger.info("  Cluster %d (%s): %d karyawan, attrition %.2f%%",
+                    row.Cluster, row.RiskLevel, row.employees, row.attrition_rate * 100)
+    return {'name': best, 'data': data, 'silhouette': eligible_scores[best], 'scores': scores, 'summary': summary}
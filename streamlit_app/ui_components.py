@@ -1,188 +1,221 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import io
 import time
+from data_loader import RISK_LEVEL_ORDER
+from model_loader import show_issues
+from scoring import stage, timing_scope
 from visualizations import create_gauge_chart
 
-def create_sidebar_inputs(df_ref=None):
+def create_sidebar_inputs(df_ref=None, measure=False):
     """
     Membuat panel input pada sidebar untuk data karyawan.
     
+    Form dirender sebagai fragment, sehingga perubahan input hanya menjalankan ulang
+    form itu sendiri. Rerun seluruh halaman hanya terjadi saat tombol prediksi ditekan.
+    
     Args:
         df_ref: DataFrame referensi yang berisi data untuk dropdown dinamis
-        
+        measure: True untuk mengukur rerun fragment form (lihat timing_scope)
+    
     Returns:
         tuple: (employee_data, predict_button) data karyawan dan status tombol prediksi
     """
     with st.sidebar:
-        # Gambar header
-        st.image("https://img.freepik.com/free-vector/human-resources-concept-illustration_114360-4792.jpg", width=280)
-        
-        st.markdown("<h3 style='text-align: center;'>Prediksi Risiko Attrition</h3>", unsafe_allow_html=True)
-        st.markdown("<p style='text-align: center; font-size: 0.9rem; color: #555555;'>Masukkan data karyawan untuk analisis</p>", unsafe_allow_html=True)
-        st.markdown("<hr>", unsafe_allow_html=True)
-        
-        employee_data = {}
-        
-        # Data Personal dengan accordion
-        with st.expander("📋 Data Pribadi", expanded=True):
-            col1, col2 = st.columns(2)
-            with col1:
-                employee_data['Age'] = st.number_input('Usia', min_value=18, max_value=65, value=35, 
-                                                      help="Usia karyawan dalam tahun")
-            with col2:
-                employee_data['Gender'] = st.selectbox('Jenis Kelamin', ['Male', 'Female'],
-                                                     help="Jenis kelamin karyawan")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                employee_data['MaritalStatus'] = st.selectbox('Status Pernikahan', 
-                                                           ['Single', 'Married', 'Divorced'],
-                                                           help="Status pernikahan karyawan")
-            with col2:
-                employee_data['DistanceFromHome'] = st.number_input('Jarak dari Rumah (km)', 
-                                                                  min_value=1, max_value=30, value=10,
-                                                                  help="Jarak tempuh dari rumah ke kantor dalam kilometer")
-        
-        # Data Pekerjaan dengan accordion
-        with st.expander("💼 Data Pekerjaan", expanded=True):
-            # Mapping departemen ke posisi
-            dept_to_jobs = {
-                'Sales': ['Sales Executive', 'Sales Representative', 'Manager'],
-                'Research & Development': ['Research Scientist', 'Laboratory Technician', 'Manufacturing Director', 'Research Director', 'Manager'],
-                'Human Resources': ['Human Resources', 'Manager']
-            }
-            
-            # Default jobs jika belum ada data referensi
-            all_jobs = ['Sales Executive', 'Research Scientist', 'Laboratory Technician', 
-                      'Manufacturing Director', 'Healthcare Representative', 'Manager', 
-                      'Sales Representative', 'Research Director', 'Human Resources']
-            
-            # Cek jika ada data referensi untuk mapping departemen-posisi yang lebih akurat
-            if df_ref is not None and 'Department' in df_ref.columns and 'JobRole' in df_ref.columns:
-                try:
-                    # Buat mapping dari data
-                    dept_to_jobs = {}
-                    for dept in df_ref['Department'].unique():
-                        dept_jobs = df_ref[df_ref['Department'] == dept]['JobRole'].unique().tolist()
-                        if dept_jobs:  # Hanya tambahkan jika daftar tidak kosong
-                            dept_to_jobs[dept] = dept_jobs
-                    
-                    # Update all_jobs
-                    all_jobs = sorted(df_ref['JobRole'].unique().tolist())
-                except Exception as e:
-                    st.warning(f"Tidak dapat memuat data posisi dari referensi: {e}")
-            
-            # Departments berdasarkan key dari dept_to_jobs mapping
-            departments = list(dept_to_jobs.keys()) if dept_to_jobs else ['Sales', 'Research & Development', 'Human Resources']
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                # Department selection
-                selected_dept = st.selectbox('Departemen', departments,
-                                           help="Departemen tempat karyawan bekerja")
-                employee_data['Department'] = selected_dept
-            
-            with col2:
-                # Job role selection based on selected department
-                available_jobs = dept_to_jobs.get(selected_dept, all_jobs) if dept_to_jobs else all_jobs
-                # Pastikan list tidak kosong
-                if not available_jobs:
-                    available_jobs = all_jobs
-                
-                selected_job = st.selectbox('Posisi/Jabatan', available_jobs,
-                                          help="Posisi/jabatan karyawan")
-                employee_data['JobRole'] = selected_job
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                employee_data['JobLevel'] = st.number_input('Level Jabatan', 
-                                                          min_value=1, max_value=5, value=2,
-                                                          help="Level jabatan (1-5)")
-            with col2:
-                employee_data['MonthlyIncome'] = st.number_input('Gaji Bulanan ($)', 
-                                                               min_value=1000, max_value=20000, value=5000, step=500,
-                                                               help="Gaji bulanan dalam dollar")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                employee_data['YearsAtCompany'] = st.number_input('Lama Bekerja (tahun)', 
-                                                                min_value=0, max_value=40, value=5,
-                                                                help="Lama bekerja di perusahaan dalam tahun")
-            with col2:
-                employee_data['YearsSinceLastPromotion'] = st.number_input('Tahun Sejak Promosi Terakhir', 
-                                                                         min_value=0, max_value=15, value=2,
-                                                                         help="Jumlah tahun sejak karyawan terakhir dipromosikan")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                employee_data['TotalWorkingYears'] = st.number_input('Total Pengalaman Kerja (tahun)', 
-                                                                   min_value=0, max_value=40, value=10,
-                                                                   help="Total pengalaman kerja dalam tahun")
-            with col2:
-                education_options = ['Human Resources', 'Life Sciences', 'Marketing', 
-                                   'Medical', 'Technical Degree', 'Other']
-                employee_data['EducationField'] = st.selectbox('Bidang Pendidikan', 
-                                                             education_options,
-                                                             help="Bidang pendidikan karyawan")
+        sidebar_prediction_form(df_ref, measure)
+    
+    return st.session_state.get('employee_data', {}), st.session_state.pop('predict_requested', False)
+
+@st.fragment
+def sidebar_prediction_form(df_ref=None, measure=False):
+    """
+    Fragment berisi input data karyawan dan tombol prediksi.
+    
+    Data input disimpan di st.session_state['employee_data']. Saat tombol prediksi
+    ditekan, fragment meminta rerun seluruh aplikasi agar hasil prediksi ditampilkan.
+    Rerun fragment tidak melewati app.run, sehingga scope pengukurannya dibuka di sini.
+    
+    Args:
+        df_ref: DataFrame referensi yang berisi data untuk dropdown dinamis
+        measure: True untuk mengukur rerun fragment (argumen dari rerun penuh terakhir)
+    """
+    with timing_scope(measure), stage('ui.sidebar_prediction_form'):
+        _sidebar_prediction_form(df_ref)
+
+def _sidebar_prediction_form(df_ref):
+    # Gambar header
+    st.image("https://img.freepik.com/free-vector/human-resources-concept-illustration_114360-4792.jpg", width=280)
+    
+    st.markdown("<h3 style='text-align: center;'>Prediksi Risiko Attrition</h3>", unsafe_allow_html=True)
+    st.markdown("<p style='text-align: center; font-size: 0.9rem; color: #555555;'>Masukkan data karyawan untuk analisis</p>", unsafe_allow_html=True)
+    st.markdown("<hr>", unsafe_allow_html=True)
+    
+    employee_data = {}
+    
+    # Data Personal dengan accordion
+    with st.expander("📋 Data Pribadi", expanded=True):
+        col1, col2 = st.columns(2)
+        with col1:
+            employee_data['Age'] = st.number_input('Usia', min_value=18, max_value=65, value=35, 
+                                                  help="Usia karyawan dalam tahun")
+        with col2:
+            employee_data['Gender'] = st.selectbox('Jenis Kelamin', ['Male', 'Female'],
+                                                 help="Jenis kelamin karyawan")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            employee_data['MaritalStatus'] = st.selectbox('Status Pernikahan', 
+                                                       ['Single', 'Married', 'Divorced'],
+                                                       help="Status pernikahan karyawan")
+        with col2:
+            employee_data['DistanceFromHome'] = st.number_input('Jarak dari Rumah (km)', 
+                                                              min_value=1, max_value=30, value=10,
+                                                              help="Jarak tempuh dari rumah ke kantor dalam kilometer")
+    
+    # Data Pekerjaan dengan accordion
+    with st.expander("💼 Data Pekerjaan", expanded=True):
+        # Mapping departemen ke posisi
+        dept_to_jobs = {
+            'Sales': ['Sales Executive', 'Sales Representative', 'Manager'],
+            'Research & Development': ['Research Scientist', 'Laboratory Technician', 'Manufacturing Director', 'Research Director', 'Manager'],
+            'Human Resources': ['Human Resources', 'Manager']
+        }
+        
+        # Default jobs jika belum ada data referensi
+        all_jobs = ['Sales Executive', 'Research Scientist', 'Laboratory Technician', 
+                  'Manufacturing Director', 'Healthcare Representative', 'Manager', 
+                  'Sales Representative', 'Research Director', 'Human Resources']
+        
+        # Cek jika ada data referensi untuk mapping departemen-posisi yang lebih akurat
+        if df_ref is not None and 'Department' in df_ref.columns and 'JobRole' in df_ref.columns:
+            try:
+                # Buat mapping dari data
+                dept_to_jobs = {}
+                for dept in df_ref['Department'].unique():
+                    dept_jobs = df_ref[df_ref['Department'] == dept]['JobRole'].unique().tolist()
+                    if dept_jobs:  # Hanya tambahkan jika daftar tidak kosong
+                        dept_to_jobs[dept] = dept_jobs
                 
-            # Education slider dengan label visual
-            education_labels = {1: "Di bawah College", 2: "College", 3: "Bachelor", 4: "Master", 5: "Doktor"}
-            edu_val = st.slider('Tingkat Pendidikan', min_value=1, max_value=5, value=3, 
-                              help="Tingkat pendidikan karyawan")
-            employee_data['Education'] = edu_val
-            st.caption(f"**Tingkat dipilih:** {education_labels[edu_val]}")
-            
-            # Checkbox untuk overtime dengan styling
-            overtime = st.checkbox('Bekerja Overtime', value=False, 
-                                 help="Apakah karyawan sering bekerja lembur?")
-            employee_data['OverTime'] = 1 if overtime else 0
-            
-            employee_data['NumCompaniesWorked'] = st.number_input('Jumlah Perusahaan Sebelumnya', 
-                                                                min_value=0, max_value=9, value=2,
-                                                                help="Jumlah perusahaan tempat karyawan pernah bekerja sebelumnya")
-        
-        # Tingkat Kepuasan dengan accordion dan label visual
-        with st.expander("😊 Tingkat Kepuasan", expanded=True):
-            # Helper function untuk label visual
-            def satisfaction_label(val):
-                if val == 1:
-                    return "Rendah"
-                elif val == 2:
-                    return "Sedang"
-                elif val == 3:
-                    return "Tinggi"
-                else:
-                    return "Sangat Tinggi"
-            
-            # Job Satisfaction
-            job_sat = st.slider('Kepuasan Kerja', min_value=1, max_value=4, value=3, 
-                              help="Tingkat kepuasan karyawan terhadap pekerjaannya (1=Rendah, 4=Sangat Tinggi)")
-            employee_data['JobSatisfaction'] = job_sat
-            st.caption(f"**Tingkat dipilih:** {satisfaction_label(job_sat)}")
-            
-            # Environment Satisfaction
-            env_sat = st.slider('Kepuasan Lingkungan', min_value=1, max_value=4, value=3, 
-                              help="Tingkat kepuasan karyawan terhadap lingkungan kerja (1=Rendah, 4=Sangat Tinggi)")
-            employee_data['EnvironmentSatisfaction'] = env_sat
-            st.caption(f"**Tingkat dipilih:** {satisfaction_label(env_sat)}")
-            
-            # Work-Life Balance
-            wlb = st.slider('Work-Life Balance', min_value=1, max_value=4, value=3, 
-                          help="Keseimbangan antara pekerjaan dan kehidupan pribadi (1=Buruk, 4=Sangat Baik)")
-            employee_data['WorkLifeBalance'] = wlb
-            st.caption(f"**Tingkat dipilih:** {satisfaction_label(wlb)}")
+                # Update all_jobs
+                all_jobs = sorted(df_ref['JobRole'].unique().tolist())
+            except Exception as e:
+                st.warning(f"Tidak dapat memuat data posisi dari referensi: {e}")
+        
+        # Departments berdasarkan key dari dept_to_jobs mapping
+        departments = list(dept_to_jobs.keys()) if dept_to_jobs else ['Sales', 'Research & Development', 'Human Resources']
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            # Department selection
+            selected_dept = st.selectbox('Departemen', departments,
+                                       help="Departemen tempat karyawan bekerja")
+            employee_data['Department'] = selected_dept
+        
+        with col2:
+            # Job role selection based on selected department
+            available_jobs = dept_to_jobs.get(selected_dept, all_jobs) if dept_to_jobs else all_jobs
+            # Pastikan list tidak kosong
+            if not available_jobs:
+                available_jobs = all_jobs
             
-            # Relationship Satisfaction
-            rel_sat = st.slider('Kepuasan Hubungan', min_value=1, max_value=4, value=3, 
-                              help="Tingkat kepuasan karyawan dengan hubungan di tempat kerja (1=Rendah, 4=Sangat Tinggi)")
-            employee_data['RelationshipSatisfaction'] = rel_sat
-            st.caption(f"**Tingkat dipilih:** {satisfaction_label(rel_sat)}")
+            selected_job = st.selectbox('Posisi/Jabatan', available_jobs,
+                                      help="Posisi/jabatan karyawan")
+            employee_data['JobRole'] = selected_job
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            employee_data['JobLevel'] = st.number_input('Level Jabatan', 
+                                                      min_value=1, max_value=5, value=2,
+                                                      help="Level jabatan (1-5)")
+        with col2:
+            employee_data['MonthlyIncome'] = st.number_input('Gaji Bulanan ($)', 
+                                                           min_value=1000, max_value=20000, value=5000, step=500,
+                                                           help="Gaji bulanan dalam dollar")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            employee_data['YearsAtCompany'] = st.number_input('Lama Bekerja (tahun)', 
+                                                            min_value=0, max_value=40, value=5,
+                                                            help="Lama bekerja di perusahaan dalam tahun")
+        with col2:
+            employee_data['YearsSinceLastPromotion'] = st.number_input('Tahun Sejak Promosi Terakhir', 
+                                                                     min_value=0, max_value=15, value=2,
+                                                                     help="Jumlah tahun sejak karyawan terakhir dipromosikan")
         
-        st.markdown("<hr>", unsafe_allow_html=True)
-        predict_button = st.button("🔍 PREDIKSI RISIKO", type="primary", use_container_width=True)
+        col1, col2 = st.columns(2)
+        with col1:
+            employee_data['TotalWorkingYears'] = st.number_input('Total Pengalaman Kerja (tahun)', 
+                                                               min_value=0, max_value=40, value=10,
+                                                               help="Total pengalaman kerja dalam tahun")
+        with col2:
+            education_options = ['Human Resources', 'Life Sciences', 'Marketing', 
+                               'Medical', 'Technical Degree', 'Other']
+            employee_data['EducationField'] = st.selectbox('Bidang Pendidikan', 
+                                                         education_options,
+                                                         help="Bidang pendidikan karyawan")
+        
+        # Education slider dengan label visual
+        education_labels = {1: "Di bawah College", 2: "College", 3: "Bachelor", 4: "Master", 5: "Doktor"}
+        edu_val = st.slider('Tingkat Pendidikan', min_value=1, max_value=5, value=3, 
+                          help="Tingkat pendidikan karyawan")
+        employee_data['Education'] = edu_val
+        st.caption(f"**Tingkat dipilih:** {education_labels[edu_val]}")
+        
+        # Checkbox untuk overtime dengan styling
+        overtime = st.checkbox('Bekerja Overtime', value=False, 
+                             help="Apakah karyawan sering bekerja lembur?")
+        employee_data['OverTime'] = 1 if overtime else 0
+        
+        employee_data['NumCompaniesWorked'] = st.number_input('Jumlah Perusahaan Sebelumnya', 
+                                                            min_value=0, max_value=9, value=2,
+                                                            help="Jumlah perusahaan tempat karyawan pernah bekerja sebelumnya")
+    
+    # Tingkat Kepuasan dengan accordion dan label visual
+    with st.expander("😊 Tingkat Kepuasan", expanded=True):
+        # Helper function untuk label visual
+        def satisfaction_label(val):
+            if val == 1:
+                return "Rendah"
+            elif val == 2:
+                return "Sedang"
+            elif val == 3:
+                return "Tinggi"
+            else:
+                return "Sangat Tinggi"
+        
+        # Job Satisfaction
+        job_sat = st.slider('Kepuasan Kerja', min_value=1, max_value=4, value=3, 
+                          help="Tingkat kepuasan karyawan terhadap pekerjaannya (1=Rendah, 4=Sangat Tinggi)")
+        employee_data['JobSatisfaction'] = job_sat
+        st.caption(f"**Tingkat dipilih:** {satisfaction_label(job_sat)}")
+        
+        # Environment Satisfaction
+        env_sat = st.slider('Kepuasan Lingkungan', min_value=1, max_value=4, value=3, 
+                          help="Tingkat kepuasan karyawan terhadap lingkungan kerja (1=Rendah, 4=Sangat Tinggi)")
+        employee_data['EnvironmentSatisfaction'] = env_sat
+        st.caption(f"**Tingkat dipilih:** {satisfaction_label(env_sat)}")
         
-        return employee_data, predict_button
+        # Work-Life Balance
+        wlb = st.slider('Work-Life Balance', min_value=1, max_value=4, value=3, 
+                      help="Keseimbangan antara pekerjaan dan kehidupan pribadi (1=Buruk, 4=Sangat Baik)")
+        employee_data['WorkLifeBalance'] = wlb
+        st.caption(f"**Tingkat dipilih:** {satisfaction_label(wlb)}")
+        
+        # Relationship Satisfaction
+        rel_sat = st.slider('Kepuasan Hubungan', min_value=1, max_value=4, value=3, 
+                          help="Tingkat kepuasan karyawan dengan hubungan di tempat kerja (1=Rendah, 4=Sangat Tinggi)")
+        employee_data['RelationshipSatisfaction'] = rel_sat
+        st.caption(f"**Tingkat dipilih:** {satisfaction_label(rel_sat)}")
+    
+    st.markdown("<hr>", unsafe_allow_html=True)
+    predict_button = st.button("🔍 PREDIKSI RISIKO", type="primary", use_container_width=True)
+    
+    st.session_state['employee_data'] = employee_data
+    
+    if predict_button:
+        st.session_state['predict_requested'] = True
+        st.rerun()
 
 def display_prediction_result(employee_data, cluster, risk_info, risk_factors, recommendations):
     """
@@ -295,8 +328,8 @@ def display_prediction_result(employee_data, cluster, risk_info, risk_factors, r
     if risk_factors:
         st.markdown("<div class='card'><h3 style='color: #3A86FF; margin-top: 0;'>Faktor Risiko Utama</h3>", unsafe_allow_html=True)
         
-        # Urutkan berdasarkan skor dampak
-        risk_factors.sort(key=lambda x: x[2], reverse=True)
+        # Urutkan berdasarkan skor dampak (salinan baru; list aslinya tersimpan di cache prediksi)
+        risk_factors = sorted(risk_factors, key=lambda x: x[2], reverse=True)
         
         # Tampilkan 3 faktor risiko tertinggi
         top_factors = risk_factors[:3]
@@ -455,7 +488,7 @@ def display_prediction_result(employee_data, cluster, risk_info, risk_factors, r
                         value = sat_labels.get(employee_data[field], employee_data[field])
                     else:
                         value = employee_data[field]
-                        
+                    
                     profile_data.append({"Kategori": category, "Atribut": field, "Nilai": value})
         
         # Tampilkan DataFrame dengan style yang lebih baik
@@ -472,7 +505,7 @@ def display_prediction_result(employee_data, cluster, risk_info, risk_factors, r
         'Kepuasan': 'background-color: rgba(76, 201, 240, 0.1)'
     }
         return colors.get(val, '')
-        
+    
     st.dataframe(
         profile_df.style.map(highlight_category, subset=['Kategori']),
         use_container_width=True,
@@ -561,7 +594,7 @@ def display_summary_metrics(df):
             color = "#FF9F1C"  # oranye
         else:
             color = "#E63946"  # merah
-            
+        
         st.markdown(f"""
         <div class="metric-container">
             <div class="metric-title">Tingkat Attrition</div>
@@ -591,7 +624,7 @@ def display_summary_metrics(df):
             color = "#FF9F1C"  # oranye
         else:
             color = "#2DC653"  # hijau - stabil
-            
+        
         st.markdown(f"""
         <div class="metric-container">
             <div class="metric-title">Rata-rata Masa Kerja</div>
@@ -644,7 +677,6 @@ def display_summary_metrics(df):
         
         # Distribusi risiko
         risk_counts = df['RiskLevel'].value_counts(normalize=True) * 100
-        risk_order = ['Risiko Sangat Rendah', 'Risiko Rendah', 'Risiko Tinggi', 'Risiko Sangat Tinggi']
         risk_colors = {
             'Risiko Sangat Rendah': '#2DC653',
             'Risiko Rendah': '#5097ED', 
@@ -652,8 +684,8 @@ def display_summary_metrics(df):
             'Risiko Sangat Tinggi': '#E63946'
         }
         
-        for risk in risk_order:
-            if risk in risk_counts.index:
+        for risk in RISK_LEVEL_ORDER:
+            if risk_counts.get(risk, 0) > 0:
                 percentage = risk_counts[risk]
                 color = risk_colors.get(risk, '#888')
                 
@@ -667,84 +699,142 @@ def display_summary_metrics(df):
         
         st.markdown("</div>", unsafe_allow_html=True)
 
-def animated_loading():
+PREDICTION_STAGES = {
+    'feature_engineering': "Memproses fitur-fitur",
+    'cache_lookup': "Memeriksa cache prediksi",
+    'preprocessing': "Preprocessing data",
+    'prediction': "Menerapkan model prediksi",
+    'risk_factors': "Menghitung faktor risiko",
+    'recommendations': "Menghasilkan rekomendasi",
+}
+
+class PredictionProgress:
     """
-    Menampilkan animasi loading yang lebih menarik.
+    Menampilkan progres prediksi berdasarkan tahapan pipeline yang benar-benar dijalankan.
+    
+    Objek ini dipakai sebagai callback on_stage untuk analyze_employee; setiap tahap
+    yang selesai ditulis ke panel status beserta durasi aslinya.
     """
-    progress_text = "Memproses data..."
     
-    # Style untuk loading
-    st.markdown("""
-    <style>
-    @keyframes pulse {
-        0% {
-            opacity: 0.6;
-        }
-        50% {
-            opacity: 1;
-        }
-        100% {
-            opacity: 0.6;
-        }
-    }
-    .loading-container {
-        display: flex;
-        flex-direction: column;
-        align-items: center;
-        justify-content: center;
-        padding: 30px;
-        background-color: white;
-        border-radius: 10px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-        margin: 20px 0;
-        animation: pulse 1.5s infinite ease-in-out;
-    }
-    .loading-icon {
-        font-size: 3rem;
-        margin-bottom: 15px;
-        color: #3A86FF;
-    }
-    .loading-text {
-        font-size: 1.2rem;
-        color: #555;
-        margin-bottom: 15px;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    def __init__(self):
+        self.timings = {}
+        self.status = st.status("Memproses prediksi...", expanded=False)
+    
+    def __call__(self, name, seconds):
+        self.timings[name] = seconds
+        label = PREDICTION_STAGES.get(name, name)
+        self.status.update(label=f"{label}...")
+        self.status.write(f"✅ {label} — {seconds * 1000:.1f} ms")
+    
+    def complete(self):
+        """
+        Menandai seluruh tahap selesai dan menampilkan total durasi.
+        """
+        total_ms = sum(self.timings.values()) * 1000
+        source = " (dari cache)" if 'prediction' not in self.timings else ""
+        self.status.update(label=f"Analisis selesai dalam {total_ms:.1f} ms{source} 🎉", state="complete")
+
+@st.cache_data(max_entries=4, show_spinner="Memproses file...")
+def score_uploaded_file(file_bytes, file_name, model_version, _model, _preprocessor):
+    """
+    Scoring isi file hasil upload beserta CSV hasilnya.
+    
+    Di-cache per isi file dan versi model, sehingga rerun (misalnya klik tombol download
+    atau input sidebar) tidak membaca, menilai, dan menulis ulang file yang sama.
+    
+    Args:
+        file_bytes: Isi file hasil upload
+        file_name: Nama file (menentukan format CSV/Parquet)
+        model_version: Versi model, bagian dari kunci cache pengganti _model dan _preprocessor
+        _model: Model machine learning (tidak di-hash)
+        _preprocessor: Preprocessor (tidak di-hash)
+    
+    Returns:
+        tuple: (DataFrame hasil scoring, isi CSV hasil scoring dalam bytes, durasi detik,
+        tuple ScoringIssue unik yang terjadi saat scoring)
+    """
+    from batch_scoring import score_employee_file
+    
+    source = io.BytesIO(file_bytes)
+    source.name = file_name
+    issues = []
+    start = time.perf_counter()
+    scored = score_employee_file(source, _model, _preprocessor, issues=issues)
+    csv_bytes = scored.to_csv(index=False).encode('utf-8')
+    return scored, csv_bytes, time.perf_counter() - start, tuple(dict.fromkeys(issues))
+
+def display_batch_scoring(model, preprocessor, model_version):
+    """
+    Menampilkan panel upload file untuk scoring risiko attrition banyak karyawan sekaligus.
     
-    # Container untuk loading
-    with st.container():
-        col1, col2, col3 = st.columns([1, 2, 1])
+    Args:
+        model: Model machine learning yang telah dilatih
+        preprocessor: Preprocessor untuk mempersiapkan data
+        model_version: Versi model (lihat ModelArtifacts.version)
+    """
+    with st.expander("📂 Prediksi Massal dari File (CSV/Parquet)", expanded=False):
+        uploaded_file = st.file_uploader("Upload data karyawan", type=['csv', 'parquet'],
+                                         help="Satu baris per karyawan dengan kolom yang sama seperti form input")
         
-        with col2:
-            st.markdown(f"""
-            <div class="loading-container">
-                <div class="loading-icon">🔍</div>
-                <div class="loading-text">{progress_text}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        if uploaded_file is None:
+            return
+        
+        try:
+            scored, csv_bytes, elapsed, issues = score_uploaded_file(uploaded_file.getvalue(), uploaded_file.name,
+                                                                     model_version, model, preprocessor)
+        except Exception as e:
+            st.error(f"Error saat memproses file: {e}")
+            return
+        
+        show_issues(issues)
+        st.success(f"{len(scored):,} karyawan diproses dalam {elapsed:.2f} detik.")
+        st.dataframe(scored['RiskLevel'].value_counts().rename("Jumlah Karyawan"), use_container_width=True)
+        st.dataframe(scored.head(100), use_container_width=True)
+        st.download_button("⬇️ Download Hasil Prediksi", csv_bytes,
+                           file_name="hasil_prediksi_attrition.csv", mime="text/csv")
+
+def display_prediction_cache_stats(stats):
+    """
+    Menampilkan panel diagnostik cache prediksi.
+    
+    Args:
+        stats: Dictionary dari PredictionCache.stats()
+    """
+    with st.expander("🩺 Diagnostik Cache Prediksi", expanded=False):
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Hit", f"{stats['hits']:,}")
+        col2.metric("Miss", f"{stats['misses']:,}")
+        col3.metric("Hit Rate", f"{stats['hit_rate']:.0%}")
+        col4.metric("Entri", f"{stats['size']:,} / {stats['maxsize']:,}")
+
+def display_timing_diagnostics(summary, enabled, on_reset=None):
+    """
+    Menampilkan latensi per tahap (p50/p95) dari scoring.timing_summary().
+    
+    Args:
+        summary: List dictionary dari scoring.timing_summary()
+        enabled: True jika pengukuran sedang aktif
+        on_reset: Callback opsional untuk menghapus semua pengukuran
+    """
+    st.markdown("<h2 class='sub-header'>Diagnostik Latensi</h2>", unsafe_allow_html=True)
+    
+    if not enabled:
+        st.info("Pengukuran tidak aktif. Buka dashboard dengan ?diagnostics=1 atau jalankan dengan SCORING_TIMING=1.")
+        return
+    
+    st.caption("Durasi per tahap dari 1.000 pengukuran terakhir di proses ini (semua sesi yang sedang diukur). "
+               "Tahap yang diambil dari cache Streamlit tidak tercatat; 'app.*' mencakup cache.")
+    
+    if on_reset is not None and st.button("🔄 Reset Pengukuran"):
+        on_reset()
+        st.rerun()
+    
+    if not summary:
+        st.write("Belum ada pengukuran. Buka halaman lain atau jalankan prediksi terlebih dahulu.")
+        return
     
-    # Progress bar
-    my_bar = st.progress(0)
-    
-    steps = [0, 20, 40, 60, 80, 100]
-    messages = [
-        "Memuat data karyawan...",
-        "Memproses fitur-fitur...",
-        "Menghitung indikator risiko...",
-        "Menerapkan model prediksi...",
-        "Menghasilkan rekomendasi...",
-        "Selesai!"
-    ]
-    
-    for i, (percent, msg) in enumerate(zip(steps, messages)):
-        my_bar.progress(percent, text=msg)
-        if i < len(steps) - 1:
-            time.sleep(0.3)  # Waktu sleep yang lebih singkat untuk UX yang lebih baik
-    
-    time.sleep(0.5)
-    my_bar.empty()
-    
-    # Tampilkan animasi sukses
-    st.success("Analisis berhasil! 🎉")
-    time.sleep(0.5)  # Beri waktu untuk melihat pesan sukses
\ No newline at end of file
+    table = pd.DataFrame(summary).rename(columns={
+        'stage': 'Tahap', 'calls': 'Panggilan', 'p50_ms': 'p50 (ms)', 'p95_ms': 'p95 (ms)',
+        'max_ms': 'Maks (ms)', 'last_ms': 'Terakhir (ms)', 'total_ms': 'Total (ms)',
+    }).set_index('Tahap')
+    st.dataframe(table.style.format(precision=2, thousands=','), use_container_width=True)
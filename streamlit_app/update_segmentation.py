@@ -0,0 +1,62 @@
+"""
+Memperbarui segmentasi risiko dengan snapshot data karyawan terbaru tanpa menjalankan
+ulang pipeline training.
+
+State segmentasi (model/segmentation_state.joblib, ditulis train_pipeline.py) menyimpan
+transformasi dan reduksi dimensi hasil training, centroid setiap cluster risiko
+(MiniBatchKMeans), dan cluster setiap karyawan. Setiap update hanya menghitung karyawan
+baru atau yang datanya berubah; nomor Cluster dan RiskLevel karyawan lain tidak berubah.
+Peringatan dicatat jika centroid bergeser jauh atau urutan attrition antar cluster tidak
+lagi sesuai level risiko, tanda segmentasi perlu dilatih ulang dengan train_pipeline.py.
+
+Contoh (dijalankan dari folder streamlit_app):
+    python update_segmentation.py snapshot_2026_10.csv
+    python update_segmentation.py snapshot_2026_10.csv --output data/optimal_risk_segmentation_result.csv
+"""
+import argparse
+import json
+import logging
+import os
+
+from training import DEFAULT_OUTPUT_DIR, SEGMENTATION_STATE_FILE
+from training.incremental import load_segmentation_state, save_segmentation_state, update_segmentation
+
+logger = logging.getLogger('update_segmentation')
+
+DEFAULT_STATE = os.path.join(DEFAULT_OUTPUT_DIR, 'model', SEGMENTATION_STATE_FILE)
+DEFAULT_OUTPUT = os.path.join(DEFAULT_OUTPUT_DIR, 'data', 'optimal_risk_segmentation_result.csv')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('snapshot', help="CSV snapshot lengkap data karyawan (format employee_data.csv)")
+    parser.add_argument('--state', default=DEFAULT_STATE, help="File state segmentasi (default: %(default)s)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="CSV hasil segmentasi (default: %(default)s)")
+    parser.add_argument('--max-centroid-shift', type=float, default=0.25,
+                        help="Batas pergeseran centroid sebelum peringatan (default: %(default)s)")
+    parser.add_argument('--dry-run', action='store_true', help="Tidak menulis hasil maupun state baru")
+    parser.add_argument('--verbose', action='store_true', help="Tampilkan log detail")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    logging.captureWarnings(True)
+    
+    try:
+        state = load_segmentation_state(args.state)
+        data, state, summary = update_segmentation(state, args.snapshot, args.max_centroid_shift)
+        if args.dry_run:
+            logger.info("Dry run: %s", json.dumps(summary, ensure_ascii=False))
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        tmp_path = f'{args.output}.tmp'
+        data.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, args.output)
+        # State ditulis setelah hasil, sehingga kegagalan di tengah jalan dapat diulang
+        save_segmentation_state(state, args.state)
+        logger.info("Hasil segmentasi ditulis ke %s", os.path.abspath(args.output))
+    except Exception:
+        logger.exception("Update segmentasi gagal")
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
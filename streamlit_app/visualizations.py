@@ -1,3 +1,5 @@
+import functools
+
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -5,20 +7,63 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-def plot_attrition_by_department(df):
+from aggregations import has_dimensions, rollup, weighted_mean
+from data_loader import RISK_LEVEL_ORDER
+from scoring.timing import timed
+
+# Jumlah maksimum figure yang disimpan di cache; entri terlama dibuang jika penuh
+FIGURE_CACHE_MAX_ENTRIES = 64
+
+# Registry fungsi pembuat figure yang memakai cache, berdasarkan nama fungsi
+_FIGURE_BUILDERS = {}
+
+@st.cache_data(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _build_cached_figure(builder_name, data_version, _cube, params):
+    return _FIGURE_BUILDERS[builder_name](_cube, *params)
+
+def cached_figure(builder):
+    """
+    Decorator untuk menyimpan figure Plotly di cache berdasarkan versi data dan parameter chart.
+    
+    Kunci cache adalah (nama fungsi, data_version cube, parameter tambahan), sehingga
+    rerun Streamlit akibat interaksi widget lain tidak membangun ulang figure yang sama.
+    Fungsi asli tetap dapat dipanggil tanpa cache melalui atribut .uncached. Durasi
+    pembuatan figure (cache miss) dicatat sebagai tahap 'visualizations.<nama fungsi>'.
+    
+    Args:
+        builder: Fungsi pembuat figure dengan argumen pertama cube agregat
+    
+    Returns:
+        function: Fungsi pembuat figure yang memakai cache
+    """
+    _FIGURE_BUILDERS[builder.__name__] = timed(f'visualizations.{builder.__name__}')(builder)
+    
+    @functools.wraps(builder)
+    def wrapper(cube, *params):
+        data_version = cube.attrs.get('data_version') if cube is not None else None
+        if data_version is None:
+            return _FIGURE_BUILDERS[builder.__name__](cube, *params)
+        return _build_cached_figure(builder.__name__, data_version, cube, params)
+    
+    wrapper.uncached = builder
+    return wrapper
+
+@cached_figure
+def plot_attrition_by_department(cube):
     """
     Membuat visualisasi tingkat attrition berdasarkan departemen.
     
     Args:
-        df: DataFrame yang berisi data
-        
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi grafik
     """
-    if 'Department' not in df.columns or 'Attrition' not in df.columns:
+    if not has_dimensions(cube, 'Department', 'attrition_sum'):
         return None
     
-    dept_attrition = df.groupby('Department')['Attrition'].mean().sort_values(ascending=False) * 100
+    dept = rollup(cube, 'Department')
+    dept_attrition = (dept['attrition_sum'] / dept['count']).sort_values(ascending=False) * 100
     
     fig = px.bar(
         x=dept_attrition.index,
@@ -44,20 +89,22 @@ def plot_attrition_by_department(df):
     
     return fig
 
-def plot_attrition_by_jobrole(df):
+@cached_figure
+def plot_attrition_by_jobrole(cube):
     """
     Membuat visualisasi tingkat attrition berdasarkan job role.
     
     Args:
-        df: DataFrame yang berisi data
-        
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi grafik
     """
-    if 'JobRole' not in df.columns or 'Attrition' not in df.columns:
+    if not has_dimensions(cube, 'JobRole', 'attrition_sum'):
         return None
     
-    role_attrition = df.groupby('JobRole')['Attrition'].mean().sort_values(ascending=False) * 100
+    role = rollup(cube, 'JobRole')
+    role_attrition = (role['attrition_sum'] / role['count']).sort_values(ascending=False) * 100
     
     fig = px.bar(
         x=role_attrition.index,
@@ -84,26 +131,27 @@ def plot_attrition_by_jobrole(df):
     
     return fig
 
-def plot_attrition_by_overtime(df):
+@cached_figure
+def plot_attrition_by_overtime(cube):
     """
     Membuat visualisasi tingkat attrition berdasarkan status overtime.
     
     Args:
-        df: DataFrame yang berisi data
-        
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi grafik
     """
-    if 'OverTime' not in df.columns or 'Attrition' not in df.columns:
+    if not has_dimensions(cube, 'OverTime', 'attrition_sum'):
         return None
     
-    # Menangani OverTime berdasarkan tipe data
-    if df['OverTime'].dtype == 'object':
-        overtime_attrition = df.groupby('OverTime')['Attrition'].mean() * 100
-    else:
-        overtime_labels = {0: 'Tidak Overtime', 1: 'Overtime'}
-        df['OverTime_Label'] = df['OverTime'].map(overtime_labels)
-        overtime_attrition = df.groupby('OverTime_Label')['Attrition'].mean() * 100
+    overtime = rollup(cube, 'OverTime')
+    overtime_attrition = overtime['attrition_sum'] / overtime['count'] * 100
+    
+    # Menangani OverTime berdasarkan tipe data (0/1 diberi label, teks dipakai apa adanya)
+    overtime_labels = {0: 'Tidak Overtime', 1: 'Overtime'}
+    overtime_attrition.index = overtime_attrition.index.map(lambda value: overtime_labels.get(value, value))
+    overtime_attrition = overtime_attrition.sort_index()
     
     fig = px.bar(
         x=overtime_attrition.index,
@@ -129,26 +177,23 @@ def plot_attrition_by_overtime(df):
     
     return fig
 
-def plot_salary_by_risk_level(df):
+@cached_figure
+def plot_salary_by_risk_level(cube):
     """
     Membuat visualisasi perbandingan gaji berdasarkan level risiko.
     
     Args:
-        df: DataFrame yang berisi data
-        
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi grafik
     """
-    if 'RiskLevel' not in df.columns or 'MonthlyIncome' not in df.columns:
+    if not has_dimensions(cube, 'RiskLevel', 'income_sum'):
         return None
     
-    salary_by_risk = df.groupby('RiskLevel')['MonthlyIncome'].mean().reset_index()
-    risk_order = ['Risiko Sangat Rendah', 'Risiko Rendah', 'Risiko Tinggi', 'Risiko Sangat Tinggi']
-    
-    # Gunakan Categorical type untuk memastikan urutan yang benar
-    if all(risk in salary_by_risk['RiskLevel'].values for risk in risk_order):
-        salary_by_risk['RiskLevel'] = pd.Categorical(salary_by_risk['RiskLevel'], categories=risk_order, ordered=True)
-        salary_by_risk = salary_by_risk.sort_values('RiskLevel')
+    # RiskLevel berupa kategori berurutan, sehingga hasil rollup sudah terurut
+    risk = rollup(cube, 'RiskLevel')
+    salary_by_risk = (risk['income_sum'] / risk['count']).rename('MonthlyIncome').reset_index()
     
     fig = px.bar(
         salary_by_risk,
@@ -174,40 +219,28 @@ def plot_salary_by_risk_level(df):
     
     return fig
 
-def plot_satisfaction_comparison(df):
+@cached_figure
+def plot_satisfaction_comparison(cube):
     """
     Membuat visualisasi perbandingan tingkat kepuasan berdasarkan level risiko.
     
     Args:
-        df: DataFrame yang berisi data
-        
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi grafik
     """
-    if 'RiskLevel' not in df.columns:
+    if not has_dimensions(cube, 'RiskLevel'):
         return None
     
-    # Cek apakah kolom-kolom kepuasan ada dalam dataframe
-    satisfaction_cols = []
-    if 'JobSatisfaction' in df.columns:
-        satisfaction_cols.append('JobSatisfaction')
-    if 'EnvironmentSatisfaction' in df.columns:
-        satisfaction_cols.append('EnvironmentSatisfaction')
-    if 'WorkLifeBalance' in df.columns:
-        satisfaction_cols.append('WorkLifeBalance')
-    if 'RelationshipSatisfaction' in df.columns:
-        satisfaction_cols.append('RelationshipSatisfaction')
+    # Cek apakah kolom-kolom kepuasan ada dalam cube
+    satisfaction_cols = [col for col in ['JobSatisfaction', 'EnvironmentSatisfaction',
+                                         'WorkLifeBalance', 'RelationshipSatisfaction']
+                         if col in cube.columns]
     
     if not satisfaction_cols:
         return None
     
-    risk_order = ['Risiko Sangat Rendah', 'Risiko Rendah', 'Risiko Tinggi', 'Risiko Sangat Tinggi']
-    
-    # Debug: Print kolom kepuasan yang ditemukan dan beberapa baris data
-    print(f"Kolom kepuasan yang ditemukan: {satisfaction_cols}")
-    if len(satisfaction_cols) > 0:
-        print(f"Contoh nilai {satisfaction_cols[0]}: {df[satisfaction_cols[0]].head()}")
-    
     # Buat grafik dengan subplot 2x2
     fig = make_subplots(
         rows=2, cols=2,
@@ -237,25 +270,16 @@ def plot_satisfaction_comparison(df):
     
     # Pastikan data dikelompokkan dengan benar dan dihitung rata-ratanya
     for col in ['JobSatisfaction', 'EnvironmentSatisfaction', 'RelationshipSatisfaction', 'WorkLifeBalance']:
-        if col in df.columns:
-            # Kelompokkan data dan hitung rata-rata
+        if col in satisfaction_cols:
+            # Hitung rata-rata tertimbang dari cube; semua level risiko ada (terurut), level kosong bernilai 0
             try:
-                grouped_data = df.groupby('RiskLevel')[col].mean().reset_index()
-                
-                # Pastikan semua level risiko ada, tambahkan yang hilang
-                for risk in risk_order:
-                    if risk not in grouped_data['RiskLevel'].values:
-                        grouped_data = pd.concat([grouped_data, pd.DataFrame({'RiskLevel': [risk], col: [0]})])
-                
-                # Urutkan berdasarkan risk_order
-                grouped_data['RiskLevel'] = pd.Categorical(grouped_data['RiskLevel'], categories=risk_order, ordered=True)
-                grouped_data = grouped_data.sort_values('RiskLevel')
+                grouped_data = weighted_mean(cube, 'RiskLevel', col).reset_index()
                 
                 # Posisi untuk plot
                 row, col_pos = col_positions.get(col, (1, 1))
                 
                 # Buat bar plot untuk setiap level risiko
-                for i, risk in enumerate(risk_order):
+                for i, risk in enumerate(RISK_LEVEL_ORDER):
                     risk_data = grouped_data[grouped_data['RiskLevel'] == risk]
                     if not risk_data.empty:
                         fig.add_trace(
@@ -302,27 +326,28 @@ def plot_satisfaction_comparison(df):
     
     return fig
 
-def plot_risk_distribution(df):
+@cached_figure
+def plot_risk_distribution(cube):
     """
     Membuat visualisasi distribusi level risiko attrition.
     
     Args:
-        df: DataFrame yang berisi data
-        
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi grafik
     """
-    if 'RiskLevel' not in df.columns:
+    if not has_dimensions(cube, 'RiskLevel'):
         return None
     
-    risk_counts = df['RiskLevel'].value_counts().reset_index()
+    # Rollup mempertahankan urutan kategori RiskLevel
+    risk_counts = rollup(cube, 'RiskLevel')['count'].reset_index()
     risk_counts.columns = ['RiskLevel', 'Count']
     
     # Tambahkan persentase
     risk_counts['Percentage'] = risk_counts['Count'] / risk_counts['Count'].sum() * 100
     
-    # Definisikan urutan dan warna
-    risk_order = ['Risiko Sangat Rendah', 'Risiko Rendah', 'Risiko Tinggi', 'Risiko Sangat Tinggi']
+    # Definisikan warna
     risk_colors = {
         'Risiko Sangat Rendah': '#0466C8',
         'Risiko Rendah': '#0D94FB', 
@@ -330,11 +355,6 @@ def plot_risk_distribution(df):
         'Risiko Sangat Tinggi': '#E63946'
     }
     
-    # Gunakan categorical type untuk urutan yang benar
-    if all(risk in risk_counts['RiskLevel'].values for risk in risk_order):
-        risk_counts['RiskLevel'] = pd.Categorical(risk_counts['RiskLevel'], categories=risk_order, ordered=True)
-        risk_counts = risk_counts.sort_values('RiskLevel')
-    
     fig = px.pie(
         risk_counts, 
         values='Count', 
@@ -358,6 +378,95 @@ def plot_risk_distribution(df):
     
     return fig
 
+@cached_figure
+def plot_salary_by_department(cube):
+    """
+    Membuat visualisasi rata-rata gaji berdasarkan departemen.
+    
+    Args:
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+    
+    Returns:
+        plotly.graph_objects.Figure: Visualisasi grafik
+    """
+    if not has_dimensions(cube, 'Department', 'income_sum'):
+        return None
+    
+    dept = rollup(cube, 'Department')
+    dept_salary = (dept['income_sum'] / dept['count']).sort_values(ascending=False)
+    
+    fig = px.bar(
+        x=dept_salary.index,
+        y=dept_salary.values,
+        text=dept_salary.values.round(0),
+        title='Rata-rata Gaji Berdasarkan Departemen',
+        labels={'x': 'Departemen', 'y': 'Rata-rata Gaji ($)'},
+        color=dept_salary.values,
+        color_continuous_scale='Viridis'
+    )
+    
+    fig.update_traces(
+        texttemplate='$%{text:,.0f}', 
+        textposition='outside'
+    )
+    
+    fig.update_layout(
+        height=400,
+        coloraxis_showscale=False,
+        template='plotly_white',
+        margin=dict(l=20, r=20, t=50, b=30)
+    )
+    
+    return fig
+
+@cached_figure
+def plot_attrition_by_satisfaction(cube, col):
+    """
+    Membuat visualisasi tingkat attrition berdasarkan satu metrik kepuasan.
+    
+    Args:
+        cube: Cube agregat dari aggregations.get_aggregate_cube
+        col: Nama kolom kepuasan (misalnya 'JobSatisfaction')
+    
+    Returns:
+        plotly.graph_objects.Figure: Visualisasi grafik
+    """
+    if not has_dimensions(cube, col, 'attrition_sum'):
+        return None
+    
+    satisfaction = rollup(cube, col)
+    attrition_by_sat = satisfaction['attrition_sum'] / satisfaction['count'] * 100
+    
+    # Konversi ke label yang lebih informatif (urutan skor 1-4 dipertahankan)
+    sat_labels = {1: "Rendah", 2: "Sedang", 3: "Tinggi", 4: "Sangat Tinggi"}
+    attrition_by_sat.index = attrition_by_sat.index.map(lambda value: sat_labels.get(value, value))
+    
+    fig = px.bar(
+        x=attrition_by_sat.index,
+        y=attrition_by_sat.values,
+        text=attrition_by_sat.values.round(1),
+        title=f'Attrition Berdasarkan {col.replace("Satisfaction", " Satisfaction").replace("WorkLifeBalance", "Work-Life Balance")}',
+        labels={'x': 'Tingkat Kepuasan', 'y': 'Tingkat Attrition (%)'},
+        color=attrition_by_sat.values,
+        color_continuous_scale='RdYlGn_r'
+    )
+    
+    fig.update_traces(
+        texttemplate='%{text:.1f}%', 
+        textposition='outside'
+    )
+    
+    fig.update_layout(
+        height=400,
+        coloraxis_showscale=False,
+        template='plotly_white',
+        margin=dict(l=20, r=20, t=50, b=30)
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+@timed('visualizations.create_feature_importance_chart')
 def create_feature_importance_chart():
     """
     Membuat visualisasi chart tentang fitur-fitur penting yang mempengaruhi attrition.
@@ -409,6 +518,7 @@ def create_feature_importance_chart():
     
     return fig
 
+@timed('visualizations.create_gauge_chart')
 def create_gauge_chart(value, title="Risk Level", min_value=0, max_value=100, 
                      threshold_values=[25, 50, 75], colors=["green", "yellow", "orange", "red"]):
     """
@@ -421,7 +531,7 @@ def create_gauge_chart(value, title="Risk Level", min_value=0, max_value=100,
         max_value: Nilai maksimum pada gauge
         threshold_values: List berisi nilai threshold untuk perubahan warna
         colors: List berisi warna untuk masing-masing bagian
-        
+    
     Returns:
         plotly.graph_objects.Figure: Visualisasi gauge chart
     """